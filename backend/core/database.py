@@ -91,6 +91,18 @@ def _add_missing_columns():
             print(f"⚠️  error_message 컬럼 추가 중 오류 (무시 가능): {e}")
             conn.rollback()
 
+        try:
+            # chat_messages 테이블에 stage_timings 컬럼 추가
+            conn.execute(text("""
+                ALTER TABLE chat_messages
+                ADD COLUMN IF NOT EXISTS stage_timings TEXT;
+            """))
+            conn.commit()
+            print("✅ chat_messages.stage_timings 컬럼 추가 완료")
+        except Exception as e:
+            print(f"⚠️  stage_timings 컬럼 추가 중 오류 (무시 가능): {e}")
+            conn.rollback()
+
 
 def _create_default_users():
     """기본 사용자(admin, user) 생성"""
@@ -48,6 +48,7 @@ class ChatMessage(Base):
     sender_type = Column(String(10), default="user")  # user, bot
     content = Column(Text, nullable=False)
     sources = Column(Text)  # JSON string of source files
+    stage_timings = Column(Text)  # JSON string of per-stage latency in seconds (bot messages)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # 관계 설정
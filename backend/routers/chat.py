@@ -273,6 +273,7 @@ def create_message(
         "sender_type": message.sender_type,
         "content": message.content,
         "sources": message.sources,
+        "stage_timings": message.stage_timings,
         "created_at": message.created_at
     }
 
@@ -316,6 +317,7 @@ def get_messages(
             "sender_type": msg.sender_type,
             "content": msg.content,
             "sources": msg.sources,
+            "stage_timings": msg.stage_timings,
             "created_at": msg.created_at
         }
         result.append(message_dict)
@@ -60,6 +60,7 @@ class ChatMessageResponse(ChatMessageBase):
     sender_id: Optional[str] = None
     sender_type: str
     sources: Optional[str] = None
+    stage_timings: Optional[str] = None
     created_at: datetime
 
     class Config:
@@ -0,0 +1,28 @@
+"""
+단계별 소요 시간 컬럼 추가 마이그레이션 스크립트
+단일 책임: chat_messages 테이블에 stage_timings 컬럼 추가
+"""
+
+from sqlalchemy import create_engine, text
+from ..config import DATABASE_URL
+
+def add_stage_timings_column() -> None:
+    """chat_messages 테이블에 stage_timings 컬럼 추가"""
+    engine = create_engine(DATABASE_URL)
+
+    with engine.connect() as conn:
+        try:
+            # stage_timings 컬럼 추가 (이미 존재하면 무시)
+            conn.execute(text("""
+                ALTER TABLE chat_messages
+                ADD COLUMN IF NOT EXISTS stage_timings TEXT;
+            """))
+            conn.commit()
+            print("✅ stage_timings 컬럼 추가 완료")
+        except Exception as e:
+            print(f"❌ 컬럼 추가 실패: {e}")
+            conn.rollback()
+            raise
+
+if __name__ == "__main__":
+    add_stage_timings_column()
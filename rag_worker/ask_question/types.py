@@ -2,7 +2,7 @@
 LLM API 관련 타입 정의
 """
 
-from typing import TypedDict, Optional
+from typing import TypedDict, Optional, List
 
 ### prompt
 class SearchResultItem(TypedDict):
@@ -16,6 +16,12 @@ class SearchResultItem(TypedDict):
     type: str
     _source_file: str
     score: Optional[float]
+    chunk_id: str
+    part_index: int
+    part_count: int
+    overlap_lines: int
+    parent_id: str
+    member_ids: List[str]
     
 ### ask_question
 class LLMRequest(TypedDict):
@@ -1,80 +1,137 @@
-"""
-Celery 애플리케이션 설정
-"""
-
-import logging
-import os
-from pathlib import Path
-from celery import Celery
-from decouple import Config, RepositoryEnv
-
-# .env.local 파일이 있으면 우선 사용 (로컬 개발용)
-env_local_path = Path(__file__).parent.parent / '.env.local'
-if env_local_path.exists():
-    config = Config(RepositoryEnv(str(env_local_path)))
-    REDIS_URL = config('REDIS_URL', default='redis://localhost:6379/0')
-else:
-    # .env.local이 없으면 환경변수 또는 기본값 사용
-    REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
-
-# RAG Worker 로깅 설정
-def setup_logging() -> None:
-    """RAG Worker 프로세스 자체 로그 캡처를 위한 설정"""
-    from datetime import datetime
-
-    # 현재 날짜로 디렉토리 생성
-    today = datetime.now().strftime("%Y-%m-%d")
-    log_dir = Path("logs") / today
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    # 로그 파일 경로
-    log_file = log_dir / f"rag_worker_{datetime.now().strftime('%H-%M-%S')}.log"
-
-    # Celery 자체 로그를 파일로 리다이렉트
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
-    file_handler.setLevel(logging.INFO)
-
-    # 기본 포맷 (프로세스 자체 로그 유지)
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    file_handler.setFormatter(formatter)
-
-    # 루트 로거에 파일 핸들러 추가 (모든 로그를 파일로)
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(file_handler)
-
-    # Celery 로거에 파일 핸들러 추가
-    celery_logger = logging.getLogger("celery")
-    celery_logger.addHandler(file_handler)
-
-    # 워커 태스크 로거 설정
-    task_logger = logging.getLogger("celery.task")
-    task_logger.addHandler(file_handler)
-
-    # billiard 로거 (Celery 프로세스 풀)
-    billiard_logger = logging.getLogger("billiard")
-    billiard_logger.addHandler(file_handler)
-
-# 로깅 초기화
-setup_logging()
-
-# Celery 앱 인스턴스 생성
-app = Celery('rag_worker')
-
-# Celery 설정
-app.conf.update(
-    broker_url=REDIS_URL,
-    result_backend=REDIS_URL,
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
-    timezone='UTC',
-    enable_utc=True,
-    # 기본 celery queue 사용 (task_routes 제거)
-)
-
-# 태스크 모듈 자동 발견
-app.autodiscover_tasks(['rag_worker'])
-
-if __name__ == '__main__':
+"""
+Celery 애플리케이션 설정
+"""
+
+import logging
+import os
+from pathlib import Path
+from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown, worker_ready
+from decouple import Config, RepositoryEnv
+
+# .env.local 파일이 있으면 우선 사용 (로컬 개발용)
+env_local_path = Path(__file__).parent.parent / '.env.local'
+if env_local_path.exists():
+    config = Config(RepositoryEnv(str(env_local_path)))
+    REDIS_URL = config('REDIS_URL', default='redis://localhost:6379/0')
+else:
+    # .env.local이 없으면 환경변수 또는 기본값 사용
+    REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+
+# 태스크 결과 보관 시간 (초, 만료되면 Redis 결과 백엔드에서 삭제)
+RESULT_EXPIRES = int(os.getenv('CELERY_RESULT_EXPIRES', '3600'))
+
+# 파이프라인 / 동기화 태스크 결과(처리량, 토큰 예산, 최대 RSS 등 지표) 저장 여부
+# (backend는 결과를 읽지 않으므로 기본값은 저장 안 함, 지표를 수집할 때만 true로 설정)
+STORE_PIPELINE_RESULTS = os.getenv('CELERY_STORE_PIPELINE_RESULTS', 'false').lower() == 'true'
+
+# 태스크별 결과 저장 설정 (backend는 send_task만 호출하고 결과를 읽지 않음, 실패는 항상 기록)
+TASK_RESULT_SETTINGS = {
+    # 응답과 단계별 소요 시간(stage_timings)은 chat_messages에 직접 기록
+    'rag_worker.tasks.chat_query': {'ignore_result': True},
+    # 진행 상태는 repositories 테이블에 기록
+    'rag_worker.tasks.process_repository_pipeline': {'ignore_result': not STORE_PIPELINE_RESULTS},
+    'rag_worker.tasks.sync_repository': {'ignore_result': not STORE_PIPELINE_RESULTS},
+}
+
+# RAG Worker 로깅 설정
+def setup_logging() -> None:
+    """RAG Worker 프로세스 자체 로그 캡처를 위한 설정"""
+    from datetime import datetime
+
+    # 현재 날짜로 디렉토리 생성
+    today = datetime.now().strftime("%Y-%m-%d")
+    log_dir = Path("logs") / today
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    # 로그 파일 경로
+    log_file = log_dir / f"rag_worker_{datetime.now().strftime('%H-%M-%S')}.log"
+
+    # Celery 자체 로그를 파일로 리다이렉트
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setLevel(logging.INFO)
+
+    # 기본 포맷 (프로세스 자체 로그 유지)
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    file_handler.setFormatter(formatter)
+
+    # 루트 로거에 파일 핸들러 추가 (모든 로그를 파일로)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(file_handler)
+
+    # Celery 로거에 파일 핸들러 추가
+    celery_logger = logging.getLogger("celery")
+    celery_logger.addHandler(file_handler)
+
+    # 워커 태스크 로거 설정
+    task_logger = logging.getLogger("celery.task")
+    task_logger.addHandler(file_handler)
+
+    # billiard 로거 (Celery 프로세스 풀)
+    billiard_logger = logging.getLogger("billiard")
+    billiard_logger.addHandler(file_handler)
+
+# 로깅 초기화
+setup_logging()
+
+# Celery 앱 인스턴스 생성
+app = Celery('rag_worker')
+
+# Celery 설정
+app.conf.update(
+    broker_url=REDIS_URL,
+    result_backend=REDIS_URL,
+    task_serializer='json',
+    accept_content=['json'],
+    result_serializer='json',
+    timezone='UTC',
+    enable_utc=True,
+    # 저장한 결과는 만료 시간 후 Redis에서 삭제하고, 읽는 쪽이 없는 태스크는 결과를 저장하지 않음
+    result_expires=RESULT_EXPIRES,
+    task_annotations=TASK_RESULT_SETTINGS,
+    task_store_errors_even_if_ignored=True,
+    # 기본 celery queue 사용 (task_routes 제거)
+)
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs) -> None:
+    """
+    prefork 자식 프로세스 시작 시 DB 커넥션 풀 생성 및 워밍업 시작
+
+    자식은 한 번에 태스크 하나만 실행하므로 작은 풀을 사용하고,
+    모델 / 컬렉션 워밍업은 백그라운드 스레드에서 진행합니다.
+    """
+    from .db_helper import init_engine
+    from .warmup import start_warmup
+
+    init_engine(pool_size=1, max_overflow=1)
+    start_warmup()
+
+
+@worker_ready.connect
+def init_solo_worker(sender=None, **kwargs) -> None:
+    """solo 풀(Windows 로컬 실행)은 메인 프로세스가 태스크를 실행하므로 여기서 워밍업 시작"""
+    from celery.concurrency.solo import TaskPool as SoloPool
+    from .warmup import start_warmup
+
+    if isinstance(getattr(sender, 'pool', None), SoloPool):
+        start_warmup()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs) -> None:
+    """prefork 자식 프로세스 종료 시 DB 커넥션 및 준비 상태 파일 정리"""
+    from .db_helper import dispose_engine
+    from .warmup import clear_readiness
+
+    clear_readiness()
+    dispose_engine()
+
+
+# 태스크 모듈 자동 발견
+app.autodiscover_tasks(['rag_worker'])
+
+if __name__ == '__main__':
     app.start()
\ No newline at end of file
@@ -3,7 +3,7 @@ Git Service 패키지
 """
 
 from .service import GitService, GitCommandRunner, RepositoryManager
-from .types import CloneResult, StatusResult, PullResult, DeleteResult, CommitInfo
+from .types import CloneResult, StatusResult, PullResult, DeleteResult, CommitInfo, DiffResult
 from .exceptions import (
     GitServiceError,
     RepositoryNotFoundError,
@@ -23,6 +23,7 @@ __all__ = [
     "PullResult",
     "DeleteResult",
     "CommitInfo",
+    "DiffResult",
     # Exceptions
     "GitServiceError",
     "RepositoryNotFoundError",
@@ -16,10 +16,13 @@ from .exceptions import (
     GitCommandError,
     GitTimeoutError,
 )
-from .types import CloneResult, StatusResult, PullResult, DeleteResult, CommitInfo
+from .types import CloneResult, StatusResult, PullResult, DeleteResult, CommitInfo, DiffResult
 
 logger = logging.getLogger(__name__)
 
+# 마지막 인덱싱 커밋을 기록하는 레포지토리 내부 ref
+INDEXED_REF = "refs/ragit/indexed"
+
 
 class GitCommandRunner:
     """Git 명령어 실행을 담당하는 클래스"""
@@ -281,22 +284,28 @@ class GitService:
             repo_name: 레포지토리 이름
 
         Returns:
-            Pull 결과
+            Pull 결과 (pull 전후 HEAD 커밋 포함)
         """
         try:
             # 레포지토리 존재 확인
             self.repo_manager.validate_exists(repo_name)
             repo_path = self.repo_manager.get_repo_path(repo_name)
 
+            previous_commit = self.get_commit_hash(repo_name)
+
             # git pull 실행
             logger.info(f"Pulling repository: {repo_name}")
             result = self.command_runner.run(["git", "pull"], cwd=repo_path)
 
+            current_commit = self.get_commit_hash(repo_name)
+
             logger.info(f"Repository pulled successfully: {repo_name}")
             return PullResult(
                 success=True,
                 repo_name=repo_name,
                 repo_path=str(repo_path),
+                previous_commit=previous_commit,
+                current_commit=current_commit,
                 message=result["stdout"],
                 error=None,
             )
@@ -304,7 +313,133 @@ class GitService:
         except (RepositoryNotFoundError, GitCommandError, GitTimeoutError) as e:
             logger.error(f"Pull repository error: {str(e)}")
             return PullResult(
-                success=False, repo_name=repo_name, repo_path="", message=None, error=str(e)
+                success=False,
+                repo_name=repo_name,
+                repo_path="",
+                previous_commit=None,
+                current_commit=None,
+                message=None,
+                error=str(e),
+            )
+
+    def get_commit_hash(self, repo_name: str, ref: str = "HEAD") -> Optional[str]:
+        """
+        ref가 가리키는 커밋 해시 조회
+
+        Args:
+            repo_name: 레포지토리 이름
+            ref: 조회할 ref (기본값: HEAD)
+
+        Returns:
+            커밋 해시 (ref가 없으면 None)
+        """
+        repo_path = self.repo_manager.get_repo_path(repo_name)
+        try:
+            result = self.command_runner.run(
+                ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"], cwd=repo_path
+            )
+        except GitCommandError:
+            return None
+
+        return result["stdout"].strip() or None
+
+    def get_indexed_commit(self, repo_name: str) -> Optional[str]:
+        """
+        마지막으로 인덱싱이 완료된 커밋 조회
+
+        Args:
+            repo_name: 레포지토리 이름
+
+        Returns:
+            커밋 해시 (기록이 없으면 None)
+        """
+        return self.get_commit_hash(repo_name, INDEXED_REF)
+
+    def mark_indexed(self, repo_name: str, commit: Optional[str] = None) -> None:
+        """
+        인덱싱이 완료된 커밋을 레포지토리 내부 ref로 기록
+
+        Args:
+            repo_name: 레포지토리 이름
+            commit: 기록할 커밋 (기본값: 현재 HEAD)
+
+        Raises:
+            RepositoryNotFoundError: 레포지토리가 없을 때
+            GitCommandError: ref 갱신 실패 시
+        """
+        self.repo_manager.validate_exists(repo_name)
+        repo_path = self.repo_manager.get_repo_path(repo_name)
+
+        target = commit or self.get_commit_hash(repo_name)
+        if not target:
+            raise GitCommandError(f"Cannot resolve commit to mark as indexed: {repo_name}")
+
+        self.command_runner.run(["git", "update-ref", INDEXED_REF, target], cwd=repo_path)
+        logger.info(f"Marked {repo_name} as indexed at {target[:12]}")
+
+    def get_changed_files(self, repo_name: str, old_commit: str, new_commit: str) -> DiffResult:
+        """
+        두 커밋 간 변경된 파일 목록 조회 (이름 변경은 삭제 + 추가로 취급)
+
+        Args:
+            repo_name: 레포지토리 이름
+            old_commit: 기준 커밋
+            new_commit: 대상 커밋
+
+        Returns:
+            변경 파일 목록
+        """
+        try:
+            self.repo_manager.validate_exists(repo_name)
+            repo_path = self.repo_manager.get_repo_path(repo_name)
+
+            result = self.command_runner.run(
+                ["git", "diff", "--name-status", "--no-renames", "-z", old_commit, new_commit],
+                cwd=repo_path,
+            )
+
+            added: List[str] = []
+            modified: List[str] = []
+            deleted: List[str] = []
+
+            # -z 출력: status\0path\0status\0path\0...
+            fields = result["stdout"].split("\0")
+            for status, path in zip(fields[0::2], fields[1::2]):
+                if not path:
+                    continue
+                if status.startswith("A"):
+                    added.append(path)
+                elif status.startswith("D"):
+                    deleted.append(path)
+                else:
+                    modified.append(path)
+
+            logger.info(
+                f"Diff {old_commit[:12]}..{new_commit[:12]} in {repo_name}: "
+                f"+{len(added)} ~{len(modified)} -{len(deleted)}"
+            )
+            return DiffResult(
+                success=True,
+                repo_name=repo_name,
+                old_commit=old_commit,
+                new_commit=new_commit,
+                added=added,
+                modified=modified,
+                deleted=deleted,
+                error=None,
+            )
+
+        except (RepositoryNotFoundError, GitCommandError, GitTimeoutError) as e:
+            logger.error(f"Get changed files error: {str(e)}")
+            return DiffResult(
+                success=False,
+                repo_name=repo_name,
+                old_commit=old_commit,
+                new_commit=new_commit,
+                added=[],
+                modified=[],
+                deleted=[],
+                error=str(e),
             )
 
     def delete_repository(self, repo_name: str) -> DeleteResult:
@@ -2,7 +2,7 @@
 Git Service 관련 타입 정의
 """
 
-from typing import TypedDict, Optional
+from typing import TypedDict, Optional, List
 
 
 class CommitInfo(TypedDict):
@@ -44,10 +44,25 @@ class PullResult(TypedDict):
     success: bool
     repo_name: str
     repo_path: str
+    previous_commit: Optional[str]
+    current_commit: Optional[str]
     message: Optional[str]
     error: Optional[str]
 
 
+class DiffResult(TypedDict):
+    """두 커밋 간 변경 파일 목록 타입 (레포지토리 기준 상대 경로)"""
+
+    success: bool
+    repo_name: str
+    old_commit: str
+    new_commit: str
+    added: List[str]
+    modified: List[str]
+    deleted: List[str]
+    error: Optional[str]
+
+
 class DeleteResult(TypedDict):
     """Git Delete 결과 타입"""
 
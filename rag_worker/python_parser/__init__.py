@@ -3,9 +3,11 @@ Python Parser 패키지
 """
 
 from .parser import PythonASTParser, parse_python_source_fully
+from .splitter import ChunkSplitter, estimate_tokens
 from .service import RepositoryParserService, PythonChunker
+from .chunk_store import ChunkStore
 from .file_scanner import FileScanner
-from .types import ChunkEntry, ParseResult, RepositoryParseResult
+from .types import ChunkEntry, ParseResult, RepositoryParseResult, RepositoryParseSummary
 from .exceptions import (
     PythonParserError,
     FileNotFoundError,
@@ -17,14 +19,19 @@ __all__ = [
     # Parser
     "PythonASTParser",
     "parse_python_source_fully",
+    # Splitter
+    "ChunkSplitter",
+    "estimate_tokens",
     # Service classes
     "RepositoryParserService",
     "PythonChunker",
     "FileScanner",
+    "ChunkStore",
     # Types
     "ChunkEntry",
     "ParseResult",
     "RepositoryParseResult",
+    "RepositoryParseSummary",
     # Exceptions
     "PythonParserError",
     "FileNotFoundError",
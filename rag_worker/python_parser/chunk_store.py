@@ -0,0 +1,281 @@
+"""
+레포지토리 청크 저장소 - 줄 단위 JSON 단일 파일 + 오프셋 인덱스
+"""
+
+import gzip
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from .types import ChunkEntry
+
+logger = logging.getLogger(__name__)
+
+# 청크 파일 gzip 압축 여부 (기존 저장소는 생성 시점의 설정을 유지)
+CHUNK_STORE_COMPRESS: bool = os.getenv("CHUNK_STORE_COMPRESS", "true").lower() == "true"
+
+# 인덱스 포맷 버전
+STORE_FORMAT = 1
+
+# 인덱스 파일 이름 (.json 확장자가 아니므로 청크 파일 수집 대상에서 제외됨)
+INDEX_FILE_NAME = "chunks.jsonl.idx"
+
+
+class ChunkStore:
+    """
+    레포지토리별 청크 저장소
+
+    디렉토리 구조:
+        {root}/chunks.jsonl[.gz]   - 한 줄에 청크 하나 (JSON), 소스 파일 단위 블록으로 추가만 함
+        {root}/chunks.jsonl.idx    - 소스 파일 -> 블록 (오프셋, 길이), 청크 키 -> (오프셋, 길이, 줄 번호)
+
+    압축 모드에서는 블록마다 독립된 gzip 멤버로 기록하므로, 파일 전체는 일반 .jsonl.gz로
+    스트리밍할 수 있고 단일 청크는 해당 블록만 seek 후 압축 해제해 읽을 수 있습니다.
+    파일을 제거하거나 다시 추가하면 이전 블록은 인덱스에서만 빼 두었다가 flush() 때 남은 블록을
+    새 파일로 한 번에 복사(압축 해제 없이)하므로, 변경 파일 수와 관계없이 실행당 재작성은 1회이고
+    flush 후 데이터 파일에는 항상 유효한 청크만 남습니다.
+    """
+
+    def __init__(self, root: Path, compress: bool = CHUNK_STORE_COMPRESS) -> None:
+        """
+        ChunkStore 초기화 (기존 인덱스가 있으면 로드)
+
+        Args:
+            root: 저장소 디렉토리 (parsed_repository/{repo_name})
+            compress: 새 저장소의 gzip 압축 여부
+        """
+        self.root: Path = root
+        self.index_path: Path = root / INDEX_FILE_NAME
+        self.compress: bool = compress
+        self.files: Dict[str, List[int]] = {}
+        self.chunks: Dict[str, List[int]] = {}
+        # 인덱스에서 빠졌지만 아직 데이터 파일에 남아 있는 블록 (오프셋 -> 길이, flush 때 압축)
+        self._dead_blocks: Dict[int, int] = {}
+
+        self._load_index()
+
+    @property
+    def data_path(self) -> Path:
+        """청크 데이터 파일 경로"""
+        return self.root / ("chunks.jsonl.gz" if self.compress else "chunks.jsonl")
+
+    @staticmethod
+    def chunk_key(chunk_id: str, part_index: int = 0) -> str:
+        """
+        청크 키 (분할된 조각은 같은 chunk_id를 공유하므로 조각 순서 포함)
+
+        Args:
+            chunk_id: 청크 ID
+            part_index: 조각 순서
+
+        Returns:
+            인덱스 키
+        """
+        return f"{chunk_id}:{part_index}"
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def reset(self) -> None:
+        """
+        저장소 초기화 (이전 형식의 파일별 JSON 포함 디렉토리 비우기)
+        """
+        if self.root.exists():
+            shutil.rmtree(self.root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.files = {}
+        self.chunks = {}
+        self._dead_blocks = {}
+
+    def append_file(self, file_path: str, chunks: Sequence[ChunkEntry]) -> None:
+        """
+        소스 파일 하나의 청크를 블록으로 추가 (같은 파일의 이전 블록은 flush 때 제거)
+
+        Args:
+            file_path: 레포지토리 기준 상대 경로
+            chunks: 청크 리스트
+        """
+        self._drop_files([file_path])
+        if not chunks:
+            return
+
+        lines = [json.dumps(chunk, ensure_ascii=False, separators=(",", ":")) for chunk in chunks]
+        block = ("\n".join(lines) + "\n").encode("utf-8")
+        if self.compress:
+            block = gzip.compress(block, mtime=0)
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.data_path, "ab") as f:
+            offset = f.seek(0, os.SEEK_END)
+            f.write(block)
+
+        self.files[file_path] = [offset, len(block)]
+        for line, chunk in enumerate(chunks):
+            key = self.chunk_key(chunk.get("chunk_id", ""), chunk.get("part_index", 0))
+            self.chunks[key] = [offset, len(block), line]
+
+    def remove_files(self, file_paths: Sequence[str]) -> int:
+        """
+        소스 파일들의 청크 제거 (남은 블록으로 데이터 파일을 1회 재작성하고 인덱스 기록)
+
+        Args:
+            file_paths: 레포지토리 기준 상대 경로 리스트
+
+        Returns:
+            제거된 파일 수
+        """
+        removed = self._drop_files(file_paths)
+        if removed:
+            self.flush()
+        return removed
+
+    def get(self, chunk_id: str, part_index: int = 0) -> Optional[ChunkEntry]:
+        """
+        청크 ID로 단일 청크 조회 (해당 블록만 읽음)
+
+        Args:
+            chunk_id: 청크 ID
+            part_index: 조각 순서
+
+        Returns:
+            청크 (없으면 None)
+        """
+        entry = self.chunks.get(self.chunk_key(chunk_id, part_index))
+        if entry is None or entry[0] in self._dead_blocks:
+            return None
+
+        offset, length, line = entry
+        with open(self.data_path, "rb") as f:
+            f.seek(offset)
+            lines = self._decode_block(f.read(length))
+        return json.loads(lines[line])
+
+    def iter_chunks(self) -> Iterator[ChunkEntry]:
+        """
+        저장된 모든 청크를 블록 순서대로 스트리밍
+
+        Yields:
+            청크
+        """
+        blocks = sorted(self.files.values())
+        if not blocks:
+            return
+
+        with open(self.data_path, "rb") as f:
+            for offset, length in blocks:
+                f.seek(offset)
+                for line in self._decode_block(f.read(length)):
+                    yield json.loads(line)
+
+    def flush(self) -> None:
+        """
+        제거된 블록을 압축한 뒤 인덱스를 디스크에 기록 (임시 파일 후 교체)
+        """
+        if self._dead_blocks:
+            self._compact()
+
+        state = {
+            "format": STORE_FORMAT,
+            "compressed": self.compress,
+            "files": self.files,
+            "chunks": self.chunks,
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, separators=(",", ":"))
+        os.replace(tmp_path, self.index_path)
+
+    def _load_index(self) -> None:
+        """디스크 인덱스 로드 (내부 메서드)"""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable chunk index {self.index_path}: {e}")
+            return
+
+        if state.get("format") != STORE_FORMAT:
+            logger.warning(f"⚠️ Ignoring incompatible chunk index: {self.index_path}")
+            return
+
+        self.compress = state["compressed"]
+        self.files = state["files"]
+        self.chunks = state["chunks"]
+
+        # 인덱스 기록 전에 중단된 실행이 남긴 블록 제거 (데이터 파일에는 유효한 청크만 유지)
+        end = max((offset + length for offset, length in self.files.values()), default=0)
+        try:
+            if os.path.getsize(self.data_path) > end:
+                with open(self.data_path, "r+b") as f:
+                    f.truncate(end)
+        except FileNotFoundError:
+            pass
+
+    def _drop_files(self, file_paths: Sequence[str]) -> int:
+        """
+        소스 파일 블록을 인덱스에서 빼고 압축 대상으로 표시 (데이터 파일은 그대로, 내부 메서드)
+
+        Args:
+            file_paths: 레포지토리 기준 상대 경로 리스트
+
+        Returns:
+            뺀 파일 수
+        """
+        dropped = 0
+        for file_path in file_paths:
+            block = self.files.pop(file_path, None)
+            if block is not None:
+                offset, length = block
+                self._dead_blocks[offset] = length
+                dropped += 1
+        return dropped
+
+    def _decode_block(self, block: bytes) -> List[bytes]:
+        """
+        블록 바이트를 청크 JSON 줄 리스트로 변환 (내부 메서드)
+
+        Args:
+            block: 블록 바이트
+
+        Returns:
+            줄 리스트
+        """
+        if self.compress:
+            block = gzip.decompress(block)
+        return block.rstrip(b"\n").split(b"\n")
+
+    def _compact(self) -> None:
+        """
+        남은 블록만 새 데이터 파일로 복사하고 제거된 블록의 청크 키 정리 (내부 메서드)
+        """
+        blocks = sorted(self.files.items(), key=lambda item: item[1][0])
+        relocated: Dict[int, int] = {}
+        tmp_path = self.data_path.with_name(self.data_path.name + ".tmp")
+
+        # 다시 추가된 청크 키는 새 블록을 가리키므로 제거된 블록을 가리키는 키만 삭제
+        self.chunks = {
+            key: entry for key, entry in self.chunks.items() if entry[0] not in self._dead_blocks
+        }
+        self._dead_blocks = {}
+
+        if not self.data_path.exists():
+            return
+
+        with open(self.data_path, "rb") as src, open(tmp_path, "wb") as dst:
+            for file_path, (offset, length) in blocks:
+                src.seek(offset)
+                relocated[offset] = dst.tell()
+                dst.write(src.read(length))
+                self.files[file_path] = [relocated[offset], length]
+
+        os.replace(tmp_path, self.data_path)
+        for entry in self.chunks.values():
+            entry[0] = relocated[entry[0]]
+
+        logger.debug(f"Compacted chunk store {self.data_path} ({len(blocks)} files)")
@@ -89,6 +89,27 @@ class FileScanner:
 
         return file_name in self.exclude_files
 
+    def is_target_file(self, repo_path: Path, relative_path: str) -> bool:
+        """
+        레포지토리 상대 경로의 파일이 스캔 대상인지 확인 (scan_repository와 동일한 규칙)
+
+        Args:
+            repo_path: 레포지토리 경로
+            relative_path: 레포지토리 기준 상대 경로
+
+        Returns:
+            스캔 대상 여부
+        """
+        file_path = repo_path / relative_path
+        if file_path.suffix != ".py" or not file_path.is_file():
+            return False
+
+        for parent in Path(relative_path).parents:
+            if parent != Path(".") and self.should_exclude_dir(parent):
+                return False
+
+        return not self.should_exclude_file(file_path)
+
     def scan_repository(self, repo_path: Path) -> List[Path]:
         """
         레포지토리 내 모든 Python 파일 스캔
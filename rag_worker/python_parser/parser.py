@@ -3,14 +3,40 @@ Python AST 파서 - AST를 이용한 Python 파일 분석
 """
 
 import ast
+import hashlib
 import logging
+from itertools import accumulate
 from pathlib import Path
-from typing import List, Dict, Union
+from typing import Callable, List, Dict, Optional, Tuple, Union
 
 from .types import ChunkEntry
 
 logger = logging.getLogger(__name__)
 
+# 청크로 추출하는 정의 노드와 청크 타입
+DEFINITION_TYPES: Dict[type, str] = {
+    ast.FunctionDef: "function",
+    ast.AsyncFunctionDef: "async_function",
+    ast.ClassDef: "class",
+}
+
+
+def make_chunk_id(file_path: str, chunk_type: str, name: str, start_line: int) -> str:
+    """
+    청크의 결정적 ID 생성 (같은 파일/위치/이름이면 재파싱해도 동일)
+
+    Args:
+        file_path: 파일 경로
+        chunk_type: 청크 타입
+        name: 청크 이름
+        start_line: 시작 라인
+
+    Returns:
+        16자리 16진 문자열 ID
+    """
+    key = f"{file_path}:{chunk_type}:{name}:{start_line}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
 
 class PythonASTParser:
     """Python 파일을 AST로 파싱하여 청킹하는 클래스"""
@@ -34,16 +60,40 @@ class PythonASTParser:
             raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
 
         with open(file_path, "r", encoding="utf-8") as f:
-            source_lines = f.readlines()
-        source_code = "".join(source_lines)
+            source_code = f.read()
 
+        return PythonASTParser.parse_source(source_code, str(file_path))
+
+    @staticmethod
+    def parse_source(source_code: str, file_path_str: str) -> List[ChunkEntry]:
+        """
+        소스 문자열을 AST로 파싱하여 청킹
+
+        AST는 한 번만 순회하며, 각 청크 코드는 줄 시작 오프셋 테이블로 계산한
+        범위를 소스 문자열에서 한 번에 잘라 만듭니다.
+
+        Args:
+            source_code: Python 소스 코드 (줄바꿈은 \\n으로 정규화된 상태)
+            file_path_str: 청크에 기록할 파일 경로
+
+        Returns:
+            청킹된 코드 블록 리스트 (module, script, 정의 청크 순, 정의는 소스 순서)
+
+        Raises:
+            SyntaxError: AST 파싱 실패 시
+        """
         try:
             tree = ast.parse(source_code)
         except Exception as e:
             raise SyntaxError(f"AST 파싱 실패: {e}") from e
 
+        # line_offsets[n] = n+1번째 줄의 시작 오프셋 → n번째 줄까지의 끝 오프셋
+        line_offsets = list(accumulate((len(line) + 1 for line in source_code.split("\n")), initial=0))
+
+        def snippet(start_line: int, end_line: int) -> str:
+            return source_code[line_offsets[start_line - 1] : line_offsets[end_line]].rstrip("\n")
+
         entries: List[ChunkEntry] = []
-        file_path_str = str(file_path)
 
         # 1. Import 블록 추출 (type="module")
         import_nodes = []
@@ -56,95 +106,177 @@ class PythonASTParser:
         last_import_end = 0
         if import_nodes:
             start_line = import_nodes[0].lineno
-            end_line = (
-                import_nodes[-1].end_lineno
-                if hasattr(import_nodes[-1], "end_lineno")
-                else import_nodes[-1].lineno
-            )
-            code_snip = "".join(source_lines[start_line - 1 : end_line])
+            end_line = import_nodes[-1].end_lineno or import_nodes[-1].lineno
             entries.append(
                 ChunkEntry(
                     type="module",
                     name="",
                     start_line=start_line,
                     end_line=end_line,
-                    code=code_snip.rstrip("\n"),
+                    code=snippet(start_line, end_line),
                     file_path=file_path_str,
+                    chunk_id=make_chunk_id(file_path_str, "module", "", start_line),
+                    parent_id="",
+                    member_ids=[],
+                    part_index=0,
+                    part_count=1,
+                    overlap_lines=0,
                 )
             )
             last_import_end = end_line
 
         # 2. Top-level 스크립트 블록 추출 (type="script")
-        top_segments = PythonASTParser._extract_top_level_segments(tree)
-
-        for start_line, end_line in top_segments:
+        for start_line, end_line in PythonASTParser._extract_top_level_segments(tree):
             if end_line <= last_import_end:
                 continue
-            code_snip = "".join(source_lines[start_line - 1 : end_line])
             entries.append(
                 ChunkEntry(
                     type="script",
                     name="",
                     start_line=start_line,
                     end_line=end_line,
-                    code=code_snip.rstrip("\n"),
+                    code=snippet(start_line, end_line),
                     file_path=file_path_str,
+                    chunk_id=make_chunk_id(file_path_str, "script", "", start_line),
+                    parent_id="",
+                    member_ids=[],
+                    part_index=0,
+                    part_count=1,
+                    overlap_lines=0,
                 )
             )
 
-        # 3. 함수 정의 추출 (type="function")
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                sl = node.lineno
-                el = node.end_lineno if hasattr(node, "end_lineno") else node.lineno
-                snippet = "".join(source_lines[sl - 1 : el])
-                entries.append(
-                    ChunkEntry(
-                        type="function",
-                        name=node.name,
-                        start_line=sl,
-                        end_line=el,
-                        code=snippet.rstrip("\n"),
-                        file_path=file_path_str,
-                    )
-                )
+        # 3. 함수 / 비동기 함수 / 클래스 정의 추출 (단일 순회, 한정 이름 사용)
+        # 클래스는 메서드 본문을 뺀 스켈레톤만 담고, 멤버 청크는 member_ids로 연결
+        definitions = PythonASTParser._iter_definitions(tree)
+        chunk_ids: Dict[int, str] = {}
+        class_entries: Dict[int, ChunkEntry] = {}
 
-        # 4. 비동기 함수 정의 추출 (type="async_function")
-        for node in ast.walk(tree):
-            if isinstance(node, ast.AsyncFunctionDef):
-                sl = node.lineno
-                el = node.end_lineno if hasattr(node, "end_lineno") else node.lineno
-                snippet = "".join(source_lines[sl - 1 : el])
-                entries.append(
-                    ChunkEntry(
-                        type="async_function",
-                        name=node.name,
-                        start_line=sl,
-                        end_line=el,
-                        code=snippet.rstrip("\n"),
-                        file_path=file_path_str,
-                    )
-                )
+        for node, qualified_name, parent in definitions:
+            chunk_type = DEFINITION_TYPES[type(node)]
+            sl = node.lineno
+            el = node.end_lineno or node.lineno
+            chunk_id = make_chunk_id(file_path_str, chunk_type, qualified_name, sl)
+            chunk_ids[id(node)] = chunk_id
 
-        # 5. 클래스 정의 추출 (type="class")
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                sl = node.lineno
-                el = node.end_lineno if hasattr(node, "end_lineno") else node.lineno
-                snippet = "".join(source_lines[sl - 1 : el])
-                entries.append(
-                    ChunkEntry(
-                        type="class",
-                        name=node.name,
-                        start_line=sl,
-                        end_line=el,
-                        code=snippet.rstrip("\n"),
-                        file_path=file_path_str,
-                    )
-                )
+            if chunk_type == "class":
+                code = PythonASTParser._build_class_skeleton(node, snippet)
+            else:
+                code = snippet(sl, el)
+
+            entry = ChunkEntry(
+                type=chunk_type,
+                name=qualified_name,
+                start_line=sl,
+                end_line=el,
+                code=code,
+                file_path=file_path_str,
+                chunk_id=chunk_id,
+                parent_id=chunk_ids[id(parent)] if parent is not None else "",
+                member_ids=[],
+                part_index=0,
+                part_count=1,
+                overlap_lines=0,
+            )
+            entries.append(entry)
+
+            if chunk_type == "class":
+                class_entries[id(node)] = entry
+            if parent is not None and id(parent) in class_entries:
+                class_entries[id(parent)]["member_ids"].append(chunk_id)
 
         return entries
 
+    @staticmethod
+    def _build_class_skeleton(node: ast.ClassDef, snippet: Callable[[int, int], str]) -> str:
+        """
+        클래스 스켈레톤 코드 생성 (내부 메서드)
+
+        클래스 헤더, 독스트링, 클래스 속성은 그대로 두고, 메서드와 중첩 클래스는
+        데코레이터/시그니처/독스트링만 남긴 뒤 본문을 "..."으로 대체합니다.
+
+        Args:
+            node: 클래스 정의 노드
+            snippet: (시작 라인, 끝 라인) -> 코드 문자열 함수
+
+        Returns:
+            스켈레톤 코드
+        """
+        parts: List[str] = [PythonASTParser._header(node, snippet)]
+        if node.body[0].lineno == node.lineno:
+            # 한 줄 클래스 (class A: pass)
+            return parts[0]
+
+        for stmt in node.body:
+            if type(stmt) in DEFINITION_TYPES:
+                parts.append(PythonASTParser._header(stmt, snippet))
+                body = stmt.body
+                if body[0].lineno == stmt.lineno:
+                    continue
+                if PythonASTParser._is_docstring(body[0]):
+                    parts.append(snippet(body[0].lineno, body[0].end_lineno or body[0].lineno))
+                parts.append(" " * body[0].col_offset + "...")
+            else:
+                # 독스트링, 클래스 속성 등은 원문 유지
+                parts.append(snippet(stmt.lineno, stmt.end_lineno or stmt.lineno))
+
+        return "\n".join(parts)
+
+    @staticmethod
+    def _header(node: ast.AST, snippet: Callable[[int, int], str]) -> str:
+        """
+        정의의 데코레이터 + 시그니처(헤더) 코드 반환 (내부 메서드)
+
+        Args:
+            node: 함수 / 클래스 정의 노드
+            snippet: (시작 라인, 끝 라인) -> 코드 문자열 함수
+
+        Returns:
+            헤더 코드
+        """
+        start_line = min([node.lineno] + [d.lineno for d in node.decorator_list])
+        end_line = max(node.body[0].lineno - 1, node.lineno)
+        return snippet(start_line, end_line)
+
+    @staticmethod
+    def _is_docstring(stmt: ast.stmt) -> bool:
+        """문자열 상수 표현식(독스트링)인지 확인 (내부 메서드)"""
+        return (
+            isinstance(stmt, ast.Expr)
+            and isinstance(stmt.value, ast.Constant)
+            and isinstance(stmt.value.value, str)
+        )
+
+    @staticmethod
+    def _iter_definitions(tree: ast.AST) -> List[Tuple[ast.AST, str, Optional[ast.AST]]]:
+        """
+        함수 / 비동기 함수 / 클래스 정의를 한정 이름과 함께 수집 (내부 메서드)
+
+        중첩 정의는 감싸는 정의 이름을 점으로 연결합니다 (예: "Class.method", "outer.inner").
+
+        Args:
+            tree: AST 트리
+
+        Returns:
+            (정의 노드, 한정 이름, 감싸는 정의 노드) 리스트 (소스 순서, 부모가 항상 먼저)
+        """
+        definitions: List[Tuple[ast.AST, str, Optional[ast.AST]]] = []
+        stack: List[Tuple[ast.AST, str, Optional[ast.AST]]] = [(tree, "", None)]
+
+        while stack:
+            node, scope, parent = stack.pop()
+            for child in ast.iter_child_nodes(node):
+                if type(child) in DEFINITION_TYPES:
+                    qualified_name = f"{scope}.{child.name}" if scope else child.name
+                    definitions.append((child, qualified_name, parent))
+                    stack.append((child, qualified_name, child))
+                elif isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case)):
+                    # 정의는 문장 안에만 올 수 있으므로 표현식 하위 트리는 건너뜀
+                    stack.append((child, scope, parent))
+
+        definitions.sort(key=lambda item: (item[0].lineno, item[0].col_offset))
+        return definitions
+
     @staticmethod
     def _extract_top_level_segments(tree: ast.AST) -> List[tuple[int, int]]:
         """
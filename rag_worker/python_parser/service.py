@@ -2,18 +2,39 @@
 Python 파일 파싱 및 청킹 서비스
 """
 
-import json
 import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Optional, Tuple
 
+from .chunk_store import ChunkStore
 from .parser import PythonASTParser
+from .splitter import ChunkSplitter
 from .file_scanner import FileScanner
-from .types import ChunkEntry, ParseResult, RepositoryParseResult
+from .types import ParseResult, RepositoryParseResult, RepositoryParseSummary
 from .exceptions import InvalidRepositoryError
 
+try:
+    # Celery의 multiprocessing 포크 (데몬 프로세스인 prefork 자식에서도 자식 프로세스 생성 가능)
+    from billiard import Pool as BilliardPool
+except ImportError:
+    # Celery 없이 파서만 사용하는 경우 표준 프로세스 풀 사용
+    BilliardPool = None
+
 logger = logging.getLogger(__name__)
 
+# 병렬 파싱 워커 수 (1 이하면 순차 파싱)
+PARSE_MAX_WORKERS: int = int(os.getenv("PARSE_MAX_WORKERS", str(os.cpu_count() or 1)))
+
+# 프로세스 풀에 한 번에 넘기는 파일 수 (작업 단위)
+PARSE_CHUNK_SIZE: int = int(os.getenv("PARSE_CHUNK_SIZE", "64"))
+
+# 이 수보다 파일이 적으면 프로세스 풀 기동 비용이 더 크므로 순차 파싱
+PARALLEL_PARSE_MIN_FILES: int = 200
+
 
 class PythonChunker:
     """Python 파일을 청킹하는 클래스"""
@@ -21,10 +42,11 @@ class PythonChunker:
     def __init__(self) -> None:
         """PythonChunker 초기화"""
         self.parser: PythonASTParser = PythonASTParser()
+        self.splitter: ChunkSplitter = ChunkSplitter()
 
     def chunk_file(self, file_path: Path) -> ParseResult:
         """
-        단일 Python 파일을 청킹
+        단일 Python 파일을 청킹 (토큰 예산을 넘는 청크는 문장 경계에서 분할)
 
         Args:
             file_path: 파싱할 Python 파일 경로
@@ -33,7 +55,7 @@ class PythonChunker:
             파싱 결과
         """
         try:
-            chunks = self.parser.parse_file(file_path)
+            chunks = self.splitter.split(self.parser.parse_file(file_path))
 
             return ParseResult(
                 success=True,
@@ -52,15 +74,39 @@ class PythonChunker:
             )
 
 
+def _parse_work_unit(file_paths: List[Path]) -> List[ParseResult]:
+    """
+    파일 묶음(작업 단위)을 순서대로 파싱
+
+    프로세스 풀로 전달되므로 모듈 최상위 함수로 둡니다.
+    청크 저장은 결과를 받은 부모 프로세스가 하나의 청크 파일에 순서대로 기록합니다.
+
+    Args:
+        file_paths: 파싱할 파일 경로 리스트
+
+    Returns:
+        파일별 파싱 결과 리스트 (입력 순서 유지)
+    """
+    chunker = PythonChunker()
+    return [chunker.chunk_file(py_file) for py_file in file_paths]
+
+
 class RepositoryParserService:
     """레포지토리 전체를 파싱하는 서비스 클래스"""
 
-    def __init__(self, base_repository_path: str = "repository") -> None:
+    def __init__(
+        self,
+        base_repository_path: str = "repository",
+        max_workers: int = PARSE_MAX_WORKERS,
+        chunk_size: int = PARSE_CHUNK_SIZE,
+    ) -> None:
         """
         RepositoryParserService 초기화
 
         Args:
             base_repository_path: 레포지토리 기본 경로
+            max_workers: 병렬 파싱 프로세스 수 (1 이하면 순차 파싱)
+            chunk_size: 프로세스 풀 작업 단위 파일 수
         """
         # 프로젝트 루트 찾기
         if Path(base_repository_path).is_absolute():
@@ -77,6 +123,8 @@ class RepositoryParserService:
 
         self.file_scanner: FileScanner = FileScanner()
         self.chunker: PythonChunker = PythonChunker()
+        self.max_workers: int = max_workers
+        self.chunk_size: int = max(chunk_size, 1)
 
     def get_repo_path(self, repo_name: str) -> Path:
         """
@@ -104,17 +152,31 @@ class RepositoryParserService:
         output_base = self.base_path.parent / "parsed_repository"
         return output_base / repo_name
 
+    def get_chunk_store(self, repo_name: str) -> ChunkStore:
+        """
+        레포지토리 청크 저장소 반환
+
+        Args:
+            repo_name: 레포지토리 이름
+
+        Returns:
+            ChunkStore 인스턴스 (parsed_repository/{repo_name}/chunks.jsonl[.gz])
+        """
+        return ChunkStore(self.get_output_path(repo_name))
+
     def parse_repository(self, repo_name: str, save_json: bool = True) -> RepositoryParseResult:
         """
         레포지토리 전체를 파싱하여 청킹
 
         Args:
             repo_name: 레포지토리 이름
-            save_json: JSON 파일로 저장 여부
+            save_json: 청크 저장소(chunks.jsonl[.gz])에 저장 여부 (기존 저장소는 새로 작성)
 
         Returns:
             레포지토리 파싱 결과
         """
+        start_time = time.time()
+
         try:
             repo_path = self.get_repo_path(repo_name)
 
@@ -125,6 +187,7 @@ class RepositoryParserService:
             # Python 파일 스캔
             logger.info(f"Scanning repository: {repo_name}")
             python_files = self.file_scanner.scan_repository(repo_path)
+            scan_time = time.time() - start_time
 
             if not python_files:
                 logger.warning(f"No Python files found in repository: {repo_name}")
@@ -137,25 +200,21 @@ class RepositoryParserService:
                     failed_files=0,
                     total_chunks=0,
                     output_path="",
+                    chunk_file="",
                     files=[],
+                    workers=0,
+                    stage_timings={"scan": scan_time, "parse": 0.0, "total": time.time() - start_time},
                     error=None,
                 )
 
             # 각 파일 파싱
             logger.info(f"Parsing {len(python_files)} Python files...")
-            parse_results: List[ParseResult] = []
-            total_chunks = 0
-
-            for py_file in python_files:
-                result = self.chunker.chunk_file(py_file)
-                parse_results.append(result)
-
-                if result["success"]:
-                    total_chunks += len(result["chunks"])
-
-                    # JSON 저장
-                    if save_json:
-                        self._save_chunks_to_json(py_file, result["chunks"], repo_path, repo_name)
+            parse_start = time.time()
+            store = self.get_chunk_store(repo_name) if save_json else None
+            if store is not None:
+                store.reset()
+            parse_results, total_chunks, workers = self._parse_files(python_files, repo_path, store)
+            parse_time = time.time() - parse_start
 
             # 통계 계산
             parsed_files = sum(1 for r in parse_results if r["success"])
@@ -165,7 +224,8 @@ class RepositoryParserService:
 
             logger.info(
                 f"Repository parsing completed: {repo_name} "
-                f"(Parsed: {parsed_files}/{len(python_files)}, Chunks: {total_chunks})"
+                f"(Parsed: {parsed_files}/{len(python_files)}, Chunks: {total_chunks}, "
+                f"scan {scan_time:.2f}s, parse {parse_time:.2f}s with {workers} worker(s))"
             )
 
             return RepositoryParseResult(
@@ -177,7 +237,10 @@ class RepositoryParserService:
                 failed_files=failed_files,
                 total_chunks=total_chunks,
                 output_path=output_path,
+                chunk_file=str(store.data_path) if store is not None else "",
                 files=parse_results,
+                workers=workers,
+                stage_timings={"scan": scan_time, "parse": parse_time, "total": time.time() - start_time},
                 error=None,
             )
 
@@ -192,38 +255,216 @@ class RepositoryParserService:
                 failed_files=0,
                 total_chunks=0,
                 output_path="",
+                chunk_file="",
                 files=[],
+                workers=0,
+                stage_timings={"total": time.time() - start_time},
                 error=str(e),
             )
 
-    def _save_chunks_to_json(
-        self, file_path: Path, chunks: List[ChunkEntry], repo_path: Path, repo_name: str
-    ) -> None:
+    @staticmethod
+    def summarize(result: RepositoryParseResult) -> RepositoryParseSummary:
         """
-        청킹 결과를 JSON 파일로 저장
+        파싱 결과에서 청크 본문을 뺀 요약 생성
+
+        파일별 청크 리스트는 레포지토리의 모든 소스 코드를 담고 있으므로, 프로세스 밖으로
+        전달할 때(Celery 결과 등)는 카운터와 청크 파일 경로만 남깁니다.
+
+        Args:
+            result: 레포지토리 파싱 결과
+
+        Returns:
+            파싱 요약
+        """
+        return RepositoryParseSummary(
+            success=result["success"],
+            repo_name=result["repo_name"],
+            total_files=result["total_files"],
+            parsed_files=result["parsed_files"],
+            failed_files=result["failed_files"],
+            total_chunks=result["total_chunks"],
+            output_path=result["output_path"],
+            chunk_file=result["chunk_file"],
+            failed_paths=[file["file_path"] for file in result["files"] if not file["success"]],
+            workers=result["workers"],
+            stage_timings=result["stage_timings"],
+            error=result["error"],
+        )
+
+    def parse_files(
+        self, repo_name: str, relative_paths: List[str], save_json: bool = True
+    ) -> RepositoryParseResult:
+        """
+        레포지토리 내 지정된 파일만 파싱 (증분 동기화용)
+
+        스캔 규칙(FileScanner)에 맞지 않는 파일은 건너뜁니다.
 
         Args:
-            file_path: 원본 파일 경로
-            chunks: 청킹 결과
-            repo_path: 레포지토리 경로
             repo_name: 레포지토리 이름
+            relative_paths: 레포지토리 기준 상대 경로 리스트
+            save_json: 청크 저장소에 추가 여부 (같은 파일의 이전 청크는 교체)
+
+        Returns:
+            레포지토리 파싱 결과 (지정된 파일 기준 통계)
         """
+        start_time = time.time()
+
         try:
-            # 상대 경로 계산
-            relative_path = file_path.relative_to(repo_path)
+            repo_path = self.get_repo_path(repo_name)
 
-            # 출력 경로 생성
-            output_base = self.get_output_path(repo_name)
-            output_file = output_base / relative_path.with_suffix(".json")
+            if not repo_path.exists():
+                raise InvalidRepositoryError(f"Repository {repo_name} not found at {repo_path}")
 
-            # 디렉토리 생성
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+            python_files = sorted(
+                repo_path / relative_path
+                for relative_path in relative_paths
+                if self.file_scanner.is_target_file(repo_path, relative_path)
+            )
+            scan_time = time.time() - start_time
 
-            # JSON 저장
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(chunks, f, ensure_ascii=False, indent=2)
+            logger.info(f"Parsing {len(python_files)} changed Python files in {repo_name}...")
+            parse_start = time.time()
+            store = self.get_chunk_store(repo_name) if save_json else None
+            parse_results, total_chunks, workers = self._parse_files(python_files, repo_path, store)
+            parse_time = time.time() - parse_start
+            parsed_files = sum(1 for r in parse_results if r["success"])
 
-            logger.debug(f"Saved chunks to {output_file}")
+            return RepositoryParseResult(
+                success=True,
+                repo_name=repo_name,
+                repo_path=str(repo_path),
+                total_files=len(python_files),
+                parsed_files=parsed_files,
+                failed_files=len(parse_results) - parsed_files,
+                total_chunks=total_chunks,
+                output_path=str(self.get_output_path(repo_name)) if save_json else "",
+                chunk_file=str(store.data_path) if store is not None else "",
+                files=parse_results,
+                workers=workers,
+                stage_timings={"scan": scan_time, "parse": parse_time, "total": time.time() - start_time},
+                error=None,
+            )
 
         except Exception as e:
-            logger.error(f"Failed to save chunks for {file_path}: {str(e)}")
+            logger.error(f"Partial parsing error: {str(e)}")
+            return RepositoryParseResult(
+                success=False,
+                repo_name=repo_name,
+                repo_path=str(self.get_repo_path(repo_name)),
+                total_files=0,
+                parsed_files=0,
+                failed_files=0,
+                total_chunks=0,
+                output_path="",
+                chunk_file="",
+                files=[],
+                workers=0,
+                stage_timings={"total": time.time() - start_time},
+                error=str(e),
+            )
+
+    def remove_parsed_files(self, repo_name: str, relative_paths: List[str]) -> int:
+        """
+        삭제되거나 변경된 소스 파일의 청크를 청크 저장소에서 제거
+
+        Args:
+            repo_name: 레포지토리 이름
+            relative_paths: 레포지토리 기준 상대 경로 리스트
+
+        Returns:
+            청크가 제거된 파일 수
+        """
+        try:
+            return self.get_chunk_store(repo_name).remove_files(
+                [Path(relative_path).as_posix() for relative_path in relative_paths]
+            )
+        except OSError as e:
+            logger.warning(f"Failed to remove parsed files from chunk store: {str(e)}")
+            return 0
+
+    def _parse_files(
+        self, python_files: List[Path], repo_path: Path, store: Optional[ChunkStore]
+    ) -> Tuple[List[ParseResult], int, int]:
+        """
+        파일 리스트를 파싱하고 필요 시 청크 저장소에 기록 (내부 메서드)
+
+        파일이 충분히 많으면 chunk_size 단위 작업으로 나눠 프로세스 풀에서 병렬 처리하고,
+        작업 단위 순서대로 결과를 받아 순차 파싱과 같은 순서로 저장소에 추가합니다.
+        Celery prefork 자식은 데몬 프로세스라 multiprocessing으로는 자식을 만들 수 없으므로
+        billiard 풀을 우선 사용하고, 풀 생성에 실패하면 경고 로그를 남기고 순차 파싱으로 대체합니다.
+
+        Args:
+            python_files: 파싱할 파일 경로 리스트
+            repo_path: 레포지토리 경로
+            store: 청크 저장소 (None이면 저장하지 않음)
+
+        Returns:
+            (파일별 파싱 결과 리스트, 총 청크 수, 사용한 워커 수)
+        """
+        work_units = [
+            python_files[i : i + self.chunk_size]
+            for i in range(0, len(python_files), self.chunk_size)
+        ]
+
+        parse_results: Optional[List[ParseResult]] = None
+        workers = min(self.max_workers, len(work_units))
+
+        if workers > 1 and len(python_files) >= PARALLEL_PARSE_MIN_FILES:
+            try:
+                # imap / map은 입력 순서대로 결과를 반환하므로 저장 순서가 결정적
+                if BilliardPool is not None:
+                    with BilliardPool(processes=workers) as pool:
+                        parse_results = self._collect_results(
+                            pool.imap(_parse_work_unit, work_units), repo_path, store
+                        )
+                else:
+                    with ProcessPoolExecutor(max_workers=workers) as executor:
+                        parse_results = self._collect_results(
+                            executor.map(_parse_work_unit, work_units), repo_path, store
+                        )
+            except (AssertionError, OSError, BrokenProcessPool) as e:
+                logger.warning(
+                    f"⚠️ Parallel parsing unavailable ({type(e).__name__}: {e}). "
+                    f"Falling back to sequential parsing of {len(python_files)} files"
+                )
+                # 이미 저장된 파일 블록은 순차 파싱에서 같은 파일로 교체됨
+                parse_results = None
+
+        if parse_results is None:
+            workers = 1
+            parse_results = self._collect_results(
+                (_parse_work_unit(unit) for unit in work_units), repo_path, store
+            )
+
+        if store is not None:
+            store.flush()
+        total_chunks = sum(len(result["chunks"]) for result in parse_results if result["success"])
+
+        return parse_results, total_chunks, workers
+
+    @staticmethod
+    def _collect_results(
+        unit_results: Iterable[List[ParseResult]], repo_path: Path, store: Optional[ChunkStore]
+    ) -> List[ParseResult]:
+        """
+        작업 단위 결과를 받는 대로 청크 저장소에 추가하며 합치기 (내부 메서드)
+
+        Args:
+            unit_results: 작업 단위별 파싱 결과 이터러블
+            repo_path: 레포지토리 경로
+            store: 청크 저장소 (None이면 저장하지 않음)
+
+        Returns:
+            파일별 파싱 결과 리스트
+        """
+        parse_results: List[ParseResult] = []
+        for unit in unit_results:
+            for result in unit:
+                if result["success"] and store is not None:
+                    relative_path = Path(result["file_path"]).relative_to(repo_path).as_posix()
+                    try:
+                        store.append_file(relative_path, result["chunks"])
+                    except OSError as e:
+                        logger.error(f"Failed to save chunks for {result['file_path']}: {str(e)}")
+                parse_results.append(result)
+        return parse_results
@@ -0,0 +1,239 @@
+"""
+크기 초과 청크 분할기 - 토큰 예산 기준으로 문장 경계에서 분할
+"""
+
+import ast
+import logging
+import os
+import re
+import textwrap
+from typing import Any, List, Mapping, Sequence, Set, Tuple
+
+from .types import ChunkEntry
+
+logger = logging.getLogger(__name__)
+
+# 청크당 최대 토큰 수 (임베딩 모델 최대 시퀀스 길이 기준 추정치)
+MAX_CHUNK_TOKENS: int = int(os.getenv("MAX_CHUNK_TOKENS", "1024"))
+
+# 청크당 최대 바이트 수 (Milvus text VARCHAR(65,535) 한도 이하)
+MAX_CHUNK_BYTES: int = 60_000
+
+# 분할된 조각 사이에 반복할 줄 수
+CHUNK_OVERLAP_LINES: int = int(os.getenv("CHUNK_OVERLAP_LINES", "2"))
+
+# 코드용 토큰 수 추정 패턴 (식별자/숫자 단위 + 기호 하나씩)
+TOKEN_ESTIMATE_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    코드 텍스트의 토큰 수 추정 (BPE 토크나이저 결과와 비슷한 규모)
+
+    Args:
+        text: 코드 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    return len(TOKEN_ESTIMATE_PATTERN.findall(text))
+
+
+class ChunkSplitter:
+    """
+    토큰 예산을 넘는 청크를 문장 경계에서 여러 조각으로 분할하는 클래스
+
+    조각은 원본 chunk_id를 그대로 유지하고 part_index / part_count / overlap_lines로 구분되므로,
+    같은 chunk_id의 조각을 part_index 순으로 정렬한 뒤 각 조각의 앞 overlap_lines 줄을
+    제외하고 이어 붙이면 원본 코드가 복원됩니다.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = MAX_CHUNK_TOKENS,
+        max_bytes: int = MAX_CHUNK_BYTES,
+        overlap_lines: int = CHUNK_OVERLAP_LINES,
+    ) -> None:
+        """
+        ChunkSplitter 초기화
+
+        Args:
+            max_tokens: 조각당 최대 추정 토큰 수
+            max_bytes: 조각당 최대 UTF-8 바이트 수
+            overlap_lines: 이전 조각과 겹치게 할 줄 수
+        """
+        self.max_tokens: int = max_tokens
+        self.max_bytes: int = max_bytes
+        self.overlap_lines: int = max(overlap_lines, 0)
+
+    def split(self, chunks: List[ChunkEntry]) -> List[ChunkEntry]:
+        """
+        청크 리스트에서 크기를 넘는 청크만 분할
+
+        Args:
+            chunks: 청크 리스트
+
+        Returns:
+            분할이 반영된 청크 리스트 (순서 유지)
+        """
+        results: List[ChunkEntry] = []
+        for chunk in chunks:
+            if self.fits(chunk["code"]):
+                results.append(chunk)
+            else:
+                results.extend(self.split_chunk(chunk))
+        return results
+
+    def fits(self, code: str) -> bool:
+        """
+        코드가 예산 이내인지 확인
+
+        Args:
+            code: 코드 텍스트
+
+        Returns:
+            예산 이내 여부
+        """
+        if len(code) * 4 <= self.max_bytes and len(code) <= self.max_tokens:
+            # 문자 수만으로 확실히 작은 경우 추정 생략
+            return True
+        return len(code.encode("utf-8")) <= self.max_bytes and estimate_tokens(code) <= self.max_tokens
+
+    def split_chunk(self, chunk: ChunkEntry) -> List[ChunkEntry]:
+        """
+        단일 청크를 문장 경계에서 분할
+
+        Args:
+            chunk: 분할할 청크
+
+        Returns:
+            조각 청크 리스트
+        """
+        lines = chunk["code"].split("\n")
+        boundaries = self._statement_boundaries(chunk["code"])
+        line_tokens = [estimate_tokens(line) for line in lines]
+        line_bytes = [len(line.encode("utf-8")) + 1 for line in lines]
+
+        # (시작 줄, 끝 줄(제외), 겹침 줄 수) 범위 계산
+        ranges: List[Tuple[int, int, int]] = []
+        start, overlap = 0, 0
+        while start < len(lines):
+            end, tokens, size, last_boundary = start, 0, 0, 0
+            while (
+                end < len(lines)
+                and tokens + line_tokens[end] <= self.max_tokens
+                and size + line_bytes[end] <= self.max_bytes
+            ):
+                tokens += line_tokens[end]
+                size += line_bytes[end]
+                end += 1
+                if end in boundaries:
+                    last_boundary = end
+
+            if end < len(lines):
+                # 예산 안의 마지막 문장 경계에서 자르고, 경계가 없으면 줄 경계 사용
+                # (겹침 줄만으로 예산이 차면 최소 한 줄은 새로 포함)
+                end = last_boundary if last_boundary > start + overlap else max(end, start + overlap + 1)
+
+            if overlap and sum(line_bytes[start:end]) - 1 > self.max_bytes:
+                # 문자 단위로 잘릴 범위는 겹침 줄 없이 새 줄만 포함
+                # (잘린 겹침 줄은 join_parts에서 줄 단위로 제거할 수 없어 중복되고,
+                #  다음 범위가 같은 시작 줄을 갖지 않도록 여기서 시작 줄을 옮김)
+                start, overlap = start + overlap, 0
+
+            ranges.append((start, end, overlap))
+            if end >= len(lines):
+                break
+
+            next_start = max(end - self.overlap_lines, start + 1)
+            overlap = end - next_start
+            start = next_start
+
+        pieces: List[Tuple[int, int, int, str]] = []
+        for start, end, overlap in ranges:
+            code = "\n".join(lines[start:end])
+            for text in self._split_oversized_text(code):
+                pieces.append((start, end, overlap, text))
+                overlap = 0
+
+        parts: List[ChunkEntry] = []
+        for part_index, (start, end, overlap, text) in enumerate(pieces):
+            part = ChunkEntry(**chunk)
+            part["code"] = text
+            part["start_line"] = chunk["start_line"] + start
+            part["end_line"] = min(chunk["start_line"] + end - 1, chunk["end_line"])
+            part["part_index"] = part_index
+            part["part_count"] = len(pieces)
+            part["overlap_lines"] = overlap
+            parts.append(part)
+
+        logger.debug(f"Split chunk {chunk['name'] or chunk['type']} into {len(parts)} parts")
+        return parts
+
+    @staticmethod
+    def join_parts(parts: Sequence[Mapping[str, Any]]) -> str:
+        """
+        같은 chunk_id의 조각들을 원본 코드로 복원
+
+        part_index 순으로 정렬한 뒤 각 조각의 앞 overlap_lines 줄을 제외하고 이어 붙입니다.
+        한 줄이 바이트 한도를 넘어 문자 단위로 잘린 조각은 같은 줄 범위(start_line)를 공유하므로
+        줄바꿈 없이 붙입니다. 검색 결과(SearchResultItem)와 청크(ChunkEntry) 모두 사용할 수 있습니다.
+
+        Args:
+            parts: 조각 리스트 (code, part_index, overlap_lines, start_line 필드 필요)
+
+        Returns:
+            복원된 코드
+        """
+        code = ""
+        previous_start = None
+        for part in sorted(parts, key=lambda item: item["part_index"]):
+            text = "\n".join(part["code"].split("\n")[part["overlap_lines"]:])
+            if previous_start is None:
+                code = text
+            elif part["start_line"] == previous_start:
+                code += text
+            else:
+                code += "\n" + text
+            previous_start = part["start_line"]
+        return code
+
+    @staticmethod
+    def _statement_boundaries(code: str) -> Set[int]:
+        """
+        문장이 시작되는 줄 인덱스 집합 계산 (내부 메서드)
+
+        Args:
+            code: 청크 코드 (들여쓰기 포함)
+
+        Returns:
+            0부터 시작하는 줄 인덱스 집합 (파싱 실패 시 빈 집합 → 줄 단위 분할)
+        """
+        try:
+            tree = ast.parse(textwrap.dedent(code))
+        except SyntaxError:
+            return set()
+
+        boundaries: Set[int] = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.stmt):
+                first_line = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+                boundaries.add(first_line - 1)
+        return boundaries
+
+    def _split_oversized_text(self, text: str) -> List[str]:
+        """
+        한 줄이 바이트 한도를 넘는 경우 문자 단위로 강제 분할 (내부 메서드)
+
+        Args:
+            text: 조각 텍스트
+
+        Returns:
+            바이트 한도 이내 텍스트 리스트
+        """
+        if len(text.encode("utf-8")) <= self.max_bytes:
+            return [text]
+
+        # UTF-8 문자당 최대 4바이트이므로 문자 수 기준으로 자르면 한도를 넘지 않음
+        step = max(self.max_bytes // 4, 1)
+        return [text[i : i + step] for i in range(0, len(text), step)]
@@ -12,8 +12,14 @@ class ChunkEntry(TypedDict):
     name: str
     start_line: int
     end_line: int
-    code: str
+    code: str  # class 타입은 메서드 본문을 제외한 스켈레톤
     file_path: str
+    chunk_id: str  # 파일/타입/이름/시작 라인 기반 결정적 ID
+    parent_id: str  # 감싸는 정의의 chunk_id (최상위면 "")
+    member_ids: List[str]  # class 타입: 메서드 / 중첩 클래스 청크 ID
+    part_index: int  # 크기 초과로 분할된 경우 조각 순서 (분할되지 않았으면 0)
+    part_count: int  # 같은 chunk_id의 전체 조각 수 (분할되지 않았으면 1)
+    overlap_lines: int  # 이전 조각과 겹치는 앞쪽 줄 수
 
 
 class ParseResult(TypedDict):
@@ -36,5 +42,25 @@ class RepositoryParseResult(TypedDict):
     failed_files: int
     total_chunks: int
     output_path: str
+    chunk_file: str  # 청크 데이터 파일 경로 (저장하지 않았으면 "")
     files: List[ParseResult]
+    workers: int  # 파싱에 사용한 프로세스 수
+    stage_timings: Dict[str, float]  # 단계별 소요 시간 (초): scan, parse, total
+    error: Optional[str]
+
+
+class RepositoryParseSummary(TypedDict):
+    """레포지토리 파싱 요약 (청크 본문 제외, Celery 결과 백엔드 저장용)"""
+
+    success: bool
+    repo_name: str
+    total_files: int
+    parsed_files: int
+    failed_files: int
+    total_chunks: int
+    output_path: str
+    chunk_file: str
+    failed_paths: List[str]  # 파싱에 실패한 파일 경로
+    workers: int
+    stage_timings: Dict[str, float]
     error: Optional[str]
@@ -3,18 +3,34 @@ Vector DB 패키지
 """
 
 from .service import VectorDBService
-from .collection_manager import CollectionManager, MilvusConnectionManager
+from .collection_manager import CollectionManager, LoadedCollectionTracker, MilvusConnectionManager
 from .embedding_service import EmbeddingService, BM25ModelCache, DenseEmbedder, SparseEmbedder
+from .model_registry import EmbeddingModelRegistry
+from .embedding_cache import EmbeddingCache
+from .query_cache import QueryEmbeddingCache
+from .query_batcher import QueryEmbeddingBatcher
+from .batch_sizer import AdaptiveBatchSizer
+from .sparse_encoder import BM25SparseEncoder, SparseBatch, tokenize
+from .sparse_model_store import SparseModelStore
 from .search_service import SearchService, SparseQueryEmbedder
 from .repository_embedder import RepositoryEmbedder
+from .vector_store import VectorStore, get_vector_store
+from .milvus_store import MilvusVectorStore
+from .local_store import LocalVectorStore
 from .types import (
     EmbeddingModelConfig,
     EmbeddingInput,
     EmbeddingResult,
+    DenseEmbeddingStats,
     SearchInput,
     SearchResult,
     SearchResultItem,
+    VectorHit,
+    BatchSearchInput,
+    BatchSearchResult,
     CollectionInfo,
+    CollectionLoadStats,
+    QueryBatchStats,
     CollectionCreateInput,
     CollectionCreateResult,
     CollectionDeleteResult,
@@ -30,7 +46,7 @@ from .exceptions import (
     DataValidationError,
     ModelLoadError,
 )
-from .config import EMBEDDING_MODELS, DEFAULT_MODEL_KEY, MILVUS_URI
+from .config import EMBEDDING_MODELS, DEFAULT_MODEL_KEY, MILVUS_URI, VECTOR_STORE_BACKEND
 
 __all__ = [
     # Main Service
@@ -38,21 +54,41 @@ __all__ = [
     # Service Components
     "CollectionManager",
     "MilvusConnectionManager",
+    "LoadedCollectionTracker",
     "EmbeddingService",
     "BM25ModelCache",
     "DenseEmbedder",
     "SparseEmbedder",
+    "EmbeddingModelRegistry",
+    "EmbeddingCache",
+    "QueryEmbeddingCache",
+    "QueryEmbeddingBatcher",
+    "AdaptiveBatchSizer",
+    "BM25SparseEncoder",
+    "SparseBatch",
+    "tokenize",
+    "SparseModelStore",
     "SearchService",
     "SparseQueryEmbedder",
     "RepositoryEmbedder",
+    "VectorStore",
+    "get_vector_store",
+    "MilvusVectorStore",
+    "LocalVectorStore",
     # Types
     "EmbeddingModelConfig",
     "EmbeddingInput",
     "EmbeddingResult",
+    "DenseEmbeddingStats",
     "SearchInput",
     "SearchResult",
     "SearchResultItem",
+    "VectorHit",
+    "BatchSearchInput",
+    "BatchSearchResult",
     "CollectionInfo",
+    "CollectionLoadStats",
+    "QueryBatchStats",
     "CollectionCreateInput",
     "CollectionCreateResult",
     "CollectionDeleteResult",
@@ -70,4 +106,5 @@ __all__ = [
     "EMBEDDING_MODELS",
     "DEFAULT_MODEL_KEY",
     "MILVUS_URI",
+    "VECTOR_STORE_BACKEND",
 ]
@@ -0,0 +1,186 @@
+"""
+메모리 여유와 처리량 기반 임베딩 배치 크기 조절기
+"""
+
+import logging
+import threading
+from typing import Dict
+
+import psutil
+
+from .config import (
+    EMBEDDING_BYTES_PER_TOKEN,
+    EMBEDDING_MAX_TOKEN_BUDGET,
+    EMBEDDING_TOKEN_BUDGET,
+    MEMORY_PRESSURE_RATIO,
+)
+
+logger = logging.getLogger(__name__)
+
+# 배치를 키웠을 때 처리량이 이 비율 이상 좋아져야 계속 키움
+GROWTH_MIN_GAIN = 0.05
+
+# 가용 메모리 중 배치 활성화 메모리로 쓸 수 있는 비율
+MEMORY_HEADROOM_RATIO = 0.5
+
+
+def current_rss() -> int:
+    """
+    현재 프로세스의 RSS (바이트)
+
+    Returns:
+        RSS 바이트 수
+    """
+    return psutil.Process().memory_info().rss
+
+
+def is_allocation_failure(error: BaseException) -> bool:
+    """
+    메모리 할당 실패(OOM) 예외인지 확인
+
+    torch는 CPU 할당 실패를 RuntimeError("... can't allocate memory"), CUDA 할당 실패를
+    torch.cuda.OutOfMemoryError(RuntimeError 하위 클래스)로 던집니다.
+
+    Args:
+        error: 예외
+
+    Returns:
+        할당 실패 여부
+    """
+    if isinstance(error, MemoryError):
+        return True
+    message = str(error).lower()
+    return isinstance(error, RuntimeError) and (
+        "out of memory" in message or "can't allocate memory" in message
+    )
+
+
+class AdaptiveBatchSizer:
+    """
+    배치 토큰 예산을 조절하는 클래스
+
+    시작 예산은 가용 메모리(psutil)로 제한하고, 임베딩 호출(파이프라인 배치)마다 처리량을
+    비교해 좋아지는 동안 예산을 두 배로 키웁니다. 더 이상 좋아지지 않으면 가장 좋았던
+    예산으로 고정하고, 할당 실패 시에는 예산을 절반으로 줄여 같은 배치를 다시 시도합니다.
+    """
+
+    _instances: Dict[str, "AdaptiveBatchSizer"] = {}
+    _instances_lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def for_model(cls, model_key: str, min_budget: int) -> "AdaptiveBatchSizer":
+        """
+        모델 키별 조절기 반환 (프로세스 내 싱글톤, 학습한 예산을 작업 간에 유지)
+
+        Args:
+            model_key: 임베딩 모델 키
+            min_budget: 최소 토큰 예산 (모델 최대 시퀀스 길이)
+
+        Returns:
+            AdaptiveBatchSizer 인스턴스
+        """
+        with cls._instances_lock:
+            sizer = cls._instances.get(model_key)
+            if sizer is None:
+                sizer = cls(min_budget=min_budget)
+                cls._instances[model_key] = sizer
+            return sizer
+
+    def __init__(
+        self,
+        initial_budget: int = EMBEDDING_TOKEN_BUDGET,
+        min_budget: int = 512,
+        max_budget: int = EMBEDDING_MAX_TOKEN_BUDGET,
+        adaptive: bool = True,
+    ) -> None:
+        """
+        AdaptiveBatchSizer 초기화
+
+        Args:
+            initial_budget: 시작 토큰 예산
+            min_budget: 최소 토큰 예산
+            max_budget: 최대 토큰 예산
+            adaptive: False면 예산을 키우지 않음 (할당 실패 시 줄이기만 함)
+        """
+        self.min_budget: int = max(min_budget, 1)
+        self.max_budget: int = max(max_budget, self.min_budget)
+        self.adaptive: bool = adaptive
+        self.token_budget: int = max(min(initial_budget, self._memory_cap()), self.min_budget)
+
+        self._lock: threading.Lock = threading.Lock()
+        self._settled: bool = not adaptive
+        self._best_budget: int = self.token_budget
+        self._best_throughput: float = 0.0
+        self._window_tokens: int = 0
+        self._window_seconds: float = 0.0
+
+    def _memory_cap(self) -> int:
+        """
+        가용 메모리로 감당할 수 있는 토큰 예산 (내부 메서드)
+
+        Returns:
+            최대 토큰 예산
+        """
+        available = psutil.virtual_memory().available * MEMORY_HEADROOM_RATIO
+        return min(int(available // EMBEDDING_BYTES_PER_TOKEN), self.max_budget)
+
+    def observe(self, tokens: int, seconds: float) -> None:
+        """
+        모델 호출 1회의 처리량 기록
+
+        Args:
+            tokens: 처리한 토큰 수
+            seconds: 소요 시간 (초)
+        """
+        with self._lock:
+            self._window_tokens += tokens
+            self._window_seconds += seconds
+
+    def step(self) -> int:
+        """
+        누적 처리량을 평가해 다음 예산 결정 (임베딩 호출 단위로 호출)
+
+        한 번의 임베딩 호출은 긴 텍스트와 짧은 텍스트를 모두 포함하므로, 길이순으로 처리되는
+        개별 모델 호출보다 호출 단위 처리량이 예산 비교에 적합합니다.
+
+        Returns:
+            다음 토큰 예산
+        """
+        with self._lock:
+            if self._settled or self._window_seconds <= 0:
+                return self.token_budget
+
+            throughput = self._window_tokens / self._window_seconds
+            self._window_tokens, self._window_seconds = 0, 0.0
+
+            if throughput > self._best_throughput * (1 + GROWTH_MIN_GAIN):
+                self._best_budget, self._best_throughput = self.token_budget, throughput
+                next_budget = min(self.token_budget * 2, self._memory_cap())
+                has_headroom = psutil.virtual_memory().percent < MEMORY_PRESSURE_RATIO * 100
+                if next_budget > self.token_budget and has_headroom:
+                    self.token_budget = next_budget
+                    logger.info(f"📈 Embedding token budget grown to {next_budget} ({throughput:.0f} tokens/s)")
+                    return self.token_budget
+
+            # 처리량이 더 좋아지지 않거나 메모리 여유가 없으면 최적 예산으로 고정
+            self.token_budget = self._best_budget
+            self._settled = True
+            logger.info(f"✅ Embedding token budget settled at {self.token_budget}")
+            return self.token_budget
+
+    def back_off(self) -> bool:
+        """
+        할당 실패 후 예산을 절반으로 줄이고 고정
+
+        Returns:
+            예산을 줄였으면 True (이미 최소 예산이면 False)
+        """
+        with self._lock:
+            if self.token_budget <= self.min_budget:
+                return False
+
+            self.token_budget = max(self.token_budget // 2, self.min_budget)
+            self._best_budget = min(self._best_budget, self.token_budget)
+            self._settled = True
+            logger.warning(f"⚠️ Allocation failure, embedding token budget reduced to {self.token_budget}")
+            return True
@@ -0,0 +1,99 @@
+"""
+청크 파일 스트리밍 리더 (JSON 배열 / 줄 단위 JSON, gzip 지원)
+"""
+
+import gzip
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator
+
+from .exceptions import DataValidationError
+
+logger = logging.getLogger(__name__)
+
+# 한 줄에 청크 하나씩 기록하는 형식의 확장자 (.gz 압축 허용)
+LINE_DELIMITED_SUFFIXES = (".jsonl", ".ndjson")
+
+
+def is_line_delimited(path: Path) -> bool:
+    """
+    줄 단위 JSON 청크 파일인지 확인
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        .jsonl / .ndjson (또는 그 .gz) 여부
+    """
+    suffixes = path.suffixes
+    if suffixes and suffixes[-1] == ".gz":
+        suffixes = suffixes[:-1]
+    return bool(suffixes) and suffixes[-1] in LINE_DELIMITED_SUFFIXES
+
+
+def _open_text(path: Path) -> IO[str]:
+    """파일을 텍스트 모드로 열기 (.gz는 압축 해제, 내부 함수)"""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def iter_chunk_file(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    청크 파일 하나를 순회
+
+    줄 단위 형식은 한 줄씩 읽어 전체 파일을 메모리에 올리지 않고,
+    JSON 배열 형식(파서의 파일별 출력)은 파일 하나 단위로 읽습니다.
+
+    Args:
+        path: 청크 파일 경로
+
+    Yields:
+        청크 딕셔너리
+
+    Raises:
+        DataValidationError: 파일이 없거나 형식이 잘못된 경우
+    """
+    if not path.is_file():
+        raise DataValidationError(f"File not found: {path}")
+
+    try:
+        with _open_text(path) as f:
+            if is_line_delimited(path):
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        raise DataValidationError(f"Invalid JSON at {path}:{line_no}: {e}") from e
+                return
+
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        raise DataValidationError(f"Invalid JSON file: {path}: {e}") from e
+    except OSError as e:
+        raise DataValidationError(f"Failed to read file: {path}: {e}") from e
+
+    # 데이터가 리스트인 경우 항목별로, 딕셔너리인 경우 그대로
+    if isinstance(data, list):
+        yield from data
+    elif isinstance(data, dict):
+        yield data
+    else:
+        logger.warning(f"Unexpected data type in {path}: {type(data)}")
+
+
+def iter_chunk_files(paths: Iterable[Path]) -> Iterator[Dict[str, Any]]:
+    """
+    여러 청크 파일을 순서대로 이어서 순회
+
+    Args:
+        paths: 청크 파일 경로 이터러블
+
+    Yields:
+        청크 딕셔너리
+    """
+    for path in paths:
+        yield from iter_chunk_file(path)
@@ -1,28 +1,46 @@
 """
-Milvus 컬렉션 관리 클래스
+컬렉션 관리 및 Milvus 연결 / 로드 상태 관리 클래스
 """
 
 import logging
-from typing import List, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from pymilvus import (
     MilvusClient,
-    DataType,
-    FieldSchema,
-    CollectionSchema,
-    Collection,
+    LoadState,
     connections,
 )
 
-from .config import MILVUS_URI
+from .config import (
+    COLLECTION_IDLE_TTL_SECONDS,
+    COLLECTION_USAGE_REDIS_URL,
+    MAX_LOADED_COLLECTIONS,
+    MILVUS_URI,
+)
+from .sparse_model_store import SparseModelStore
+from .vector_store import VectorStore, get_vector_store
 from .exceptions import (
     CollectionNotFoundError,
     CollectionAlreadyExistsError,
     ConnectionError as VectorDBConnectionError,
 )
-from .types import CollectionInfo, CollectionCreateResult, CollectionDeleteResult
+from .types import (
+    CollectionInfo,
+    CollectionCreateResult,
+    CollectionDeleteResult,
+    CollectionLoadStats,
+)
 
 logger = logging.getLogger(__name__)
 
+# 컬렉션별 마지막 사용 시각 (Redis sorted set, 포맷이 바뀌면 버전을 올려 이전 값을 무시)
+USAGE_REDIS_KEY = "ragit:collection_last_used:v1"
+
+# 프로세스가 같은 컬렉션의 사용 시각을 Redis에 다시 기록하기까지의 최소 간격 (초)
+USAGE_PUBLISH_INTERVAL_SECONDS = 60.0
+
 
 class MilvusConnectionManager:
     """Milvus 연결 관리 클래스"""
@@ -66,12 +84,218 @@ class MilvusConnectionManager:
                 raise VectorDBConnectionError(f"Failed to establish connection: {e}") from e
 
 
+class LoadedCollectionTracker:
+    """
+    로드된 컬렉션 추적 클래스 (프로세스 단위 기록 + 클러스터 공유 사용 시각)
+
+    검색 전에 컬렉션을 매번 load()하지 않고, 이 프로세스에서 로드를 확인한 컬렉션은
+    다음 검색부터 확인 없이 바로 사용합니다.
+    release_collection은 클러스터 전체에 적용되므로, 해제 여부는 이 프로세스의 기록이 아니라
+    모든 워커가 Redis에 남긴 마지막 사용 시각으로 판단합니다. 클러스터 전체에서
+    COLLECTION_IDLE_TTL_SECONDS 이상 사용되지 않았거나 MAX_LOADED_COLLECTIONS를 넘은 컬렉션만
+    release하여 Milvus 쿼리 노드 메모리를 돌려줍니다. 사용 시각은 컬렉션당 프로세스마다
+    USAGE_PUBLISH_INTERVAL_SECONDS에 한 번만 기록하므로 검색마다 Redis 왕복이 생기지 않으며,
+    COLLECTION_USAGE_REDIS_URL이 비어 있으면 워커는 컬렉션을 해제하지 않습니다.
+    다른 프로세스가 해제한 컬렉션은 검색이 실패한 뒤 invalidate()로 다시 로드합니다.
+    """
+
+    _last_used: "OrderedDict[str, float]" = OrderedDict()
+    _published: Dict[str, float] = {}
+    _lock: threading.Lock = threading.Lock()
+    _redis: Optional[Any] = None
+    _redis_checked: bool = False
+    _hits: int = 0
+    _misses: int = 0
+    _loads: int = 0
+    _releases: int = 0
+
+    @classmethod
+    def ensure_loaded(cls, collection_name: str) -> None:
+        """
+        컬렉션이 로드되어 있음을 보장 (추적 중이면 Milvus 호출 없음)
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Raises:
+            VectorDBConnectionError: 연결 실패 시
+        """
+        with cls._lock:
+            if collection_name in cls._last_used:
+                cls._hits += 1
+                cls._last_used[collection_name] = time.time()
+                cls._last_used.move_to_end(collection_name)
+                hit = True
+            else:
+                cls._misses += 1
+                hit = False
+
+        if hit:
+            cls._publish_usage(collection_name)
+            return
+
+        client = MilvusConnectionManager.get_client()
+        state = client.get_load_state(collection_name=collection_name).get("state")
+        if state != LoadState.Loaded:
+            start_time = time.time()
+            client.load_collection(collection_name=collection_name)
+            with cls._lock:
+                cls._loads += 1
+            logger.info(f"✅ Collection '{collection_name}' loaded in {time.time() - start_time:.2f}s")
+
+        with cls._lock:
+            cls._last_used[collection_name] = time.time()
+            cls._last_used.move_to_end(collection_name)
+
+        cls._publish_usage(collection_name, force=True)
+        cls.release_idle(exclude=collection_name)
+
+    @classmethod
+    def invalidate(cls, collection_name: str) -> None:
+        """
+        추적 정보 제거 (컬렉션 삭제 또는 다른 프로세스의 해제 감지 시)
+
+        Args:
+            collection_name: 컬렉션 이름
+        """
+        with cls._lock:
+            cls._last_used.pop(collection_name, None)
+            cls._published.pop(collection_name, None)
+
+    @classmethod
+    def release_idle(
+        cls, max_idle_seconds: Optional[float] = None, exclude: Optional[str] = None
+    ) -> List[str]:
+        """
+        클러스터 전체에서 유휴 시간이 TTL을 넘었거나 최대 개수를 넘은 컬렉션 해제
+
+        Args:
+            max_idle_seconds: 유휴 허용 시간 (기본값: COLLECTION_IDLE_TTL_SECONDS, 0 이하면 TTL 해제 비활성)
+            exclude: 해제 대상에서 제외할 컬렉션 이름
+
+        Returns:
+            해제된 컬렉션 이름 리스트 (공유 사용 시각을 읽을 수 없으면 빈 리스트)
+        """
+        redis_client = cls._usage_store()
+        if redis_client is None:
+            return []
+
+        ttl = COLLECTION_IDLE_TTL_SECONDS if max_idle_seconds is None else max_idle_seconds
+        now = time.time()
+
+        try:
+            # 오래 사용하지 않은 순서 (모든 워커 프로세스의 마지막 사용 시각)
+            usage = [
+                (name.decode() if isinstance(name, bytes) else name, last_used)
+                for name, last_used in redis_client.zrange(USAGE_REDIS_KEY, 0, -1, withscores=True)
+            ]
+        except Exception as e:
+            logger.warning(f"Failed to read shared collection usage: {e}")
+            return []
+
+        excess = len(usage) - MAX_LOADED_COLLECTIONS
+        targets: List[Tuple[str, float]] = []
+        for name, last_used in usage:
+            if name == exclude:
+                continue
+            if len(targets) < excess or (ttl > 0 and now - last_used > ttl):
+                targets.append((name, last_used))
+
+        released: List[str] = []
+        for name, last_used in targets:
+            try:
+                # 목록을 읽은 뒤 다른 프로세스가 사용을 기록했으면 건너뜀
+                if redis_client.zscore(USAGE_REDIS_KEY, name) != last_used:
+                    continue
+                redis_client.zrem(USAGE_REDIS_KEY, name)
+                cls.invalidate(name)
+                MilvusConnectionManager.get_client().release_collection(collection_name=name)
+                released.append(name)
+                logger.info(f"♻️ Collection released: {name}")
+            except Exception as e:
+                logger.warning(f"Failed to release collection '{name}': {e}")
+
+        with cls._lock:
+            cls._releases += len(released)
+        return released
+
+    @classmethod
+    def _publish_usage(cls, collection_name: str, force: bool = False) -> None:
+        """
+        컬렉션 마지막 사용 시각을 Redis에 기록 (프로세스당 간격 제한, 내부 메서드)
+
+        Args:
+            collection_name: 컬렉션 이름
+            force: 간격과 관계없이 기록 (로드 직후)
+        """
+        now = time.time()
+        interval = USAGE_PUBLISH_INTERVAL_SECONDS
+        if COLLECTION_IDLE_TTL_SECONDS > 0:
+            # 계속 사용 중인 컬렉션이 TTL 안에 여러 번 기록되도록 간격 제한
+            interval = min(interval, COLLECTION_IDLE_TTL_SECONDS / 4)
+
+        with cls._lock:
+            if not force and now - cls._published.get(collection_name, 0.0) < interval:
+                return
+            cls._published[collection_name] = now
+
+        redis_client = cls._usage_store()
+        if redis_client is None:
+            return
+        try:
+            redis_client.zadd(USAGE_REDIS_KEY, {collection_name: now})
+        except Exception as e:
+            logger.warning(f"Failed to publish collection usage: {e}")
+
+    @classmethod
+    def _usage_store(cls) -> Optional[Any]:
+        """
+        공유 사용 시각 Redis 클라이언트 반환 (최초 1회 연결, 설정이 없거나 실패하면 None, 내부 메서드)
+
+        Returns:
+            Redis 클라이언트 또는 None
+        """
+        if cls._redis_checked:
+            return cls._redis
+
+        with cls._lock:
+            if not cls._redis_checked:
+                if COLLECTION_USAGE_REDIS_URL:
+                    try:
+                        import redis
+
+                        cls._redis = redis.Redis.from_url(COLLECTION_USAGE_REDIS_URL, socket_timeout=0.1)
+                    except Exception as e:
+                        logger.warning(f"⚠️ Shared collection usage unavailable, idle release disabled: {e}")
+                else:
+                    logger.info("COLLECTION_USAGE_REDIS_URL not set, idle collection release disabled")
+                cls._redis_checked = True
+        return cls._redis
+
+    @classmethod
+    def stats(cls) -> CollectionLoadStats:
+        """
+        로드 추적 통계 반환
+
+        Returns:
+            히트 / 미스 / 로드 / 해제 횟수와 추적 중인 컬렉션
+        """
+        with cls._lock:
+            return CollectionLoadStats(
+                hits=cls._hits,
+                misses=cls._misses,
+                loads=cls._loads,
+                releases=cls._releases,
+                loaded=list(cls._last_used.keys()),
+            )
+
+
 class CollectionManager:
-    """Milvus 컬렉션 관리 클래스"""
+    """컬렉션 관리 클래스 (VECTOR_STORE_BACKEND로 선택된 벡터 저장소 사용)"""
 
     def __init__(self) -> None:
         """CollectionManager 초기화"""
-        self.client: MilvusClient = MilvusConnectionManager.get_client()
+        self.store: VectorStore = get_vector_store()
 
     def exists(self, collection_name: str) -> bool:
         """
@@ -83,7 +307,7 @@ class CollectionManager:
         Returns:
             존재 여부
         """
-        return self.client.has_collection(collection_name)
+        return self.store.has_collection(collection_name)
 
     def validate_exists(self, collection_name: str) -> None:
         """
@@ -129,53 +353,10 @@ class CollectionManager:
             # 이미 존재하는지 확인
             self.validate_not_exists(collection_name)
 
-            analyzer_params: dict = {"type": "english"}
-
-            # 스키마 정의
-            fields: List[FieldSchema] = [
-                FieldSchema(name="pk", dtype=DataType.INT64, is_primary=True, auto_id=True),
-                FieldSchema(name="text", dtype=DataType.VARCHAR, max_length=65_535),
-                FieldSchema(name="dense", dtype=DataType.FLOAT_VECTOR, dim=dim),
-                FieldSchema(name="sparse", dtype=DataType.SPARSE_FLOAT_VECTOR),
-                FieldSchema(name="file_path", dtype=DataType.VARCHAR, max_length=1024),
-                FieldSchema(name="name", dtype=DataType.VARCHAR, max_length=1024),
-                FieldSchema(name="start_line", dtype=DataType.INT64),
-                FieldSchema(name="end_line", dtype=DataType.INT64),
-                FieldSchema(
-                    name="type",
-                    dtype=DataType.VARCHAR,
-                    max_length=256,
-                    enable_analyzer=True,
-                    analyzer_params=analyzer_params,
-                    enable_match=True,
-                ),
-                FieldSchema(
-                    name="_source_file",
-                    dtype=DataType.VARCHAR,
-                    max_length=1024,
-                    enable_analyzer=True,
-                    enable_match=True,
-                    analyzer_params=analyzer_params,
-                ),
-            ]
-
-            schema: CollectionSchema = CollectionSchema(
-                fields=fields,
-                description=description or "Optimized hybrid search collection",
-                enable_dynamic_field=True,
-            )
-
-            # 컬렉션 생성
-            logger.info(f"Creating collection: {collection_name}")
-            self.client.create_collection(
-                collection_name=collection_name,
-                schema=schema,
-                consistency_level="Strong",
+            self.store.create_collection(
+                collection_name, dim, description or "Optimized hybrid search collection"
             )
 
-            # 인덱스 생성
-            self._create_indexes(collection_name)
-
             logger.info(f"✅ Collection '{collection_name}' created successfully")
             return CollectionCreateResult(
                 success=True,
@@ -193,53 +374,6 @@ class CollectionManager:
                 error=str(e),
             )
 
-    def _create_indexes(self, collection_name: str) -> None:
-        """
-        컬렉션에 인덱스 생성 (내부 메서드)
-
-        Args:
-            collection_name: 컬렉션 이름
-        """
-        logger.info(f"Creating indexes for collection: {collection_name}")
-
-        # 인덱스 파라미터 준비
-        index_params = self.client.prepare_index_params()
-
-        # Dense 벡터 인덱스
-        index_params.add_index(
-            field_name="dense",
-            index_type="HNSW",
-            metric_type="COSINE",
-            params={"M": 16, "efConstruction": 256},
-        )
-
-        # Sparse 벡터 인덱스
-
-        index_params.add_index(
-            field_name="sparse",
-            index_type="SPARSE_WAND",
-            metric_type="IP",
-            params={"drop_ratio_build": 0.2},
-        )
-
-
-        # 스칼라 필드 인덱스
-        index_params.add_index(field_name="file_path")
-        index_params.add_index(field_name="type")
-        index_params.add_index(field_name="name")
-        index_params.add_index(field_name="start_line")
-        index_params.add_index(field_name="end_line")
-        index_params.add_index(field_name="_source_file")
-
-
-        # 인덱스 생성
-        
-
-        self.client.create_index(collection_name=collection_name, index_params=index_params)
-
-
-        logger.info(f"✅ Indexes created for collection: {collection_name}")
-
     def delete_collection(self, collection_name: str) -> CollectionDeleteResult:
         """
         컬렉션 삭제
@@ -256,7 +390,10 @@ class CollectionManager:
 
             # 삭제
             logger.info(f"Deleting collection: {collection_name}")
-            self.client.drop_collection(collection_name)
+            self.store.drop_collection(collection_name)
+
+            # 컬렉션에 딸린 BM25 아티팩트 정리
+            SparseModelStore().delete(collection_name)
 
             logger.info(f"✅ Collection '{collection_name}' deleted successfully")
             return CollectionDeleteResult(
@@ -283,22 +420,14 @@ class CollectionManager:
             컬렉션 정보 리스트
         """
         try:
-            MilvusConnectionManager.ensure_connection()
-
-            collection_names: List[str] = self.client.list_collections()
+            collection_names: List[str] = self.store.list_collections()
             collections: List[CollectionInfo] = []
 
             for name in collection_names:
                 try:
-                    collection = Collection(name)
-                    collection.load()
-
-                    # 엔티티 수 조회
-                    count_result = collection.query(expr="pk > 0", output_fields=["count(*)"])
-                    count: int = count_result[0]["count(*)"] if count_result else 0
-
-                    # 설명 가져오기
-                    desc = collection.description if hasattr(collection, "description") else ""
+                    # 로드 없이 조회 가능한 통계 / 스키마 사용 (검색용 메모리를 점유하지 않음)
+                    count: int = self.store.row_count(name)
+                    desc: str = self.store.describe_collection(name)
 
                     collections.append(
                         CollectionInfo(name=name, num_entities=count, description=desc)
@@ -320,6 +449,9 @@ class CollectionManager:
         """
         컬렉션의 엔티티 수 조회
 
+        컬렉션을 로드하지 않고 저장소 통계의 행 수를 반환합니다.
+        (Milvus는 삭제 후 컴팩션 전까지 삭제된 행이 포함될 수 있습니다.)
+
         Args:
             collection_name: 컬렉션 이름
 
@@ -331,13 +463,7 @@ class CollectionManager:
         """
         try:
             self.validate_exists(collection_name)
-            MilvusConnectionManager.ensure_connection()
-
-            collection = Collection(collection_name)
-            collection.load()
-
-            count_result = collection.query(expr="pk > 0", output_fields=["count(*)"])
-            return count_result[0]["count(*)"] if count_result else 0
+            return self.store.row_count(collection_name)
 
         except Exception as e:
             logger.error(f"Failed to get entity count: {e}")
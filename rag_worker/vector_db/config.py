@@ -1,31 +1,117 @@
-import os
-
-# Milvus 서버 연결 정보 (환경변수로부터 읽기, 기본값은 로컬)
-MILVUS_HOST: str = os.getenv("MILVUS_HOST", "localhost")
-MILVUS_PORT: str = os.getenv("MILVUS_PORT", "19530")
-MILVUS_URI: str = f"http://{MILVUS_HOST}:{MILVUS_PORT}"
-
-# --- 모델 설정 중앙 관리 ---
-EMBEDDING_MODELS = {
-    # 기존 모델 (영어 검색 최적화 모델)
-    "mpnet-base-v2": {
-        "model_name": "sentence-transformers/all-mpnet-base-v2",
-        "dim": 768,
-        "kwargs": {}
-    },
-    # 코드 검색 최적화 모델 (CodeXEmbed)
-    "sfr-code-400m": {
-        "model_name": "Salesforce/SFR-Embedding-Code-400M_R",
-        "dim": 1024,
-        "kwargs": {"trust_remote_code": True}
-    }
-}
-
-# 기본으로 사용할 모델의 '키'를 지정
-DEFAULT_MODEL_KEY = "sfr-code-400m"
-
-# 기본 컬렉션 이름
-DEFAULT_COLLECTION_NAME = "langchain_default_collection"
-
-# 임베딩할 테스트 데이터 파일 경로
+import os
+
+# Milvus 서버 연결 정보 (환경변수로부터 읽기, 기본값은 로컬)
+MILVUS_HOST: str = os.getenv("MILVUS_HOST", "localhost")
+MILVUS_PORT: str = os.getenv("MILVUS_PORT", "19530")
+MILVUS_URI: str = f"http://{MILVUS_HOST}:{MILVUS_PORT}"
+
+# 벡터 저장소 백엔드 ("milvus" 또는 프로세스 내 NumPy 인덱스 "local")
+VECTOR_STORE_BACKEND: str = os.getenv("VECTOR_STORE_BACKEND", "milvus").lower()
+
+# local 백엔드 데이터 디렉토리 (상대 경로는 프로젝트 루트 기준)
+LOCAL_VECTOR_STORE_DIR: str = os.getenv("LOCAL_VECTOR_STORE_DIR", "local_vector_store")
+
+# local 백엔드에서 flush 전 삽입 행을 메모리에 두는 최대 행 수 (넘으면 임시 파일로 내림)
+LOCAL_VECTOR_STORE_SPILL_ROWS: int = int(os.getenv("LOCAL_VECTOR_STORE_SPILL_ROWS", "2000"))
+
+# 하이브리드 검색 RRF 상수 (Milvus RRFRanker 기본값과 동일)
+RRF_K: int = 60
+
+# --- 모델 설정 중앙 관리 ---
+EMBEDDING_MODELS = {
+    # 기존 모델 (영어 검색 최적화 모델)
+    "mpnet-base-v2": {
+        "model_name": "sentence-transformers/all-mpnet-base-v2",
+        "dim": 768,
+        "kwargs": {}
+    },
+    # 코드 검색 최적화 모델 (CodeXEmbed)
+    "sfr-code-400m": {
+        "model_name": "Salesforce/SFR-Embedding-Code-400M_R",
+        "dim": 1024,
+        "kwargs": {"trust_remote_code": True}
+    }
+}
+
+# 기본으로 사용할 모델의 '키'를 지정
+DEFAULT_MODEL_KEY = "sfr-code-400m"
+
+# 임베딩 모델 유휴 해제 시간 (초, 0 이하면 해제하지 않음)
+MODEL_IDLE_TTL_SECONDS: int = int(os.getenv("EMBEDDING_MODEL_IDLE_TTL", "1800"))
+
+# 검색 후 이 시간(초) 이상 사용되지 않은 컬렉션은 Milvus 메모리에서 해제 (0 이하면 해제하지 않음)
+COLLECTION_IDLE_TTL_SECONDS: int = int(os.getenv("COLLECTION_IDLE_TTL", "3600"))
+
+# 클러스터 전체에서 로드 상태로 유지할 최대 컬렉션 수 (초과 시 가장 오래 사용하지 않은 컬렉션 해제)
+MAX_LOADED_COLLECTIONS: int = int(os.getenv("MAX_LOADED_COLLECTIONS", "16"))
+
+# 컬렉션 마지막 사용 시각을 워커 프로세스 간에 공유할 Redis URL
+# (release_collection은 클러스터 전체에 적용되므로, 비어 있으면 워커는 컬렉션을 해제하지 않음)
+COLLECTION_USAGE_REDIS_URL: str = os.getenv("COLLECTION_USAGE_REDIS_URL", os.getenv("REDIS_URL", ""))
+
+# 검색 쿼리 벡터 캐시 (프로세스 LRU 항목 수 / 만료 시간, 0 이하면 비활성)
+QUERY_CACHE_MAX_ENTRIES: int = int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "1024"))
+QUERY_CACHE_TTL_SECONDS: int = int(os.getenv("QUERY_CACHE_TTL", "3600"))
+
+# 쿼리 벡터 캐시를 워커 프로세스 간에 공유할 Redis URL (비어 있으면 프로세스 LRU만 사용)
+QUERY_CACHE_REDIS_URL: str = os.getenv("QUERY_CACHE_REDIS_URL", "")
+
+# 분할된 청크를 검색 결과에서 다시 이어 붙이기 위한 필드 (동적 필드)
+SPLIT_PART_FIELDS = ["chunk_id", "part_index", "part_count", "overlap_lines"]
+
+# 클래스 ↔ 메서드 관계 필드 (동적 필드, 감싸는 정의 / 멤버 청크 ID)
+HIERARCHY_FIELDS = ["parent_id", "member_ids"]
+
+# 검색 결과로 가져올 필드 (SearchResultItem 구성용, 벡터 필드는 가져오지 않음)
+SEARCH_OUTPUT_FIELDS = [
+    "text", "file_path", "name", "start_line", "end_line", "type", "_source_file", *SPLIT_PART_FIELDS, *HIERARCHY_FIELDS
+]
+
+# 채팅 프롬프트와 출처 표시에 필요한 필드
+PROMPT_OUTPUT_FIELDS = ["text", "file_path", "name", "start_line", "end_line", "type", *SPLIT_PART_FIELDS, *HIERARCHY_FIELDS]
+
+# 2단계 검색 (1단계는 id / 점수 / 위치만 받아 중복 제거 후, 최종 top_k의 본문만 일괄 조회)
+SEARCH_TWO_PHASE: bool = os.getenv("SEARCH_TWO_PHASE", "false").lower() == "true"
+
+# 2단계 검색의 1단계 후보 수 배율 (top_k x 배율, 중복 제거 여유분)
+SEARCH_CANDIDATE_FACTOR: int = int(os.getenv("SEARCH_CANDIDATE_FACTOR", "2"))
+
+# 동시에 들어온 검색 쿼리를 모아 한 번에 인코딩하는 마이크로 배치 (스레드 / gevent 풀에서 효과)
+QUERY_BATCH_ENABLED: bool = os.getenv("QUERY_BATCH_ENABLED", "true").lower() == "true"
+QUERY_BATCH_MAX_SIZE: int = int(os.getenv("QUERY_BATCH_MAX_SIZE", "32"))
+QUERY_BATCH_MAX_WAIT_MS: float = float(os.getenv("QUERY_BATCH_MAX_WAIT_MS", "5"))
+
+# BM25 모델 재구성 시 컬렉션 페이지 크기
+BM25_REBUILD_BATCH_SIZE: int = int(os.getenv("BM25_REBUILD_BATCH_SIZE", "2000"))
+
+# 증분 동기화 시 한 번의 delete 표현식에 담을 파일 수
+DELETE_FILE_BATCH_SIZE: int = 50
+
+# 스트리밍 인제스천 단계 사이 큐 크기 (삽입 배치 단위)
+PIPELINE_QUEUE_SIZE: int = int(os.getenv("EMBEDDING_PIPELINE_QUEUE_SIZE", "2"))
+
+# 밀집 임베딩 캐시 (모델 키 + 코드 해시 기반, 기본 2GB)
+EMBEDDING_CACHE_ENABLED: bool = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+EMBEDDING_CACHE_MAX_BYTES: int = int(os.getenv("EMBEDDING_CACHE_MAX_BYTES", str(2 * 1024**3)))
+
+# 밀집 임베딩 배치 토큰 예산 (배치 크기 x 배치 내 최대 토큰 수, 패딩 포함)
+EMBEDDING_TOKEN_BUDGET: int = int(os.getenv("EMBEDDING_TOKEN_BUDGET", "8192"))
+
+# 밀집 임베딩 배치당 최대 텍스트 수
+EMBEDDING_MAX_BATCH_SIZE: int = int(os.getenv("EMBEDDING_MAX_BATCH_SIZE", "128"))
+
+# 메모리 여유와 처리량에 따라 배치 토큰 예산 자동 조절 (EMBEDDING_TOKEN_BUDGET에서 시작)
+EMBEDDING_ADAPTIVE_BATCH: bool = os.getenv("EMBEDDING_ADAPTIVE_BATCH", "true").lower() == "true"
+EMBEDDING_MAX_TOKEN_BUDGET: int = int(os.getenv("EMBEDDING_MAX_TOKEN_BUDGET", "65536"))
+
+# 토큰당 추론 활성화 메모리 추정치 (가용 메모리로 시작/최대 예산 제한, 기본 256KB)
+EMBEDDING_BYTES_PER_TOKEN: int = int(os.getenv("EMBEDDING_BYTES_PER_TOKEN", str(256 * 1024)))
+
+# 메모리 사용률이 이 비율을 넘을 때만 GC / CUDA 캐시 해제
+MEMORY_PRESSURE_RATIO: float = float(os.getenv("MEMORY_PRESSURE_RATIO", "0.85"))
+
+# 기본 컬렉션 이름
+DEFAULT_COLLECTION_NAME = "langchain_default_collection"
+
+# 임베딩할 테스트 데이터 파일 경로
 TEST_DATA_PATH = "test_data.json"
\ No newline at end of file
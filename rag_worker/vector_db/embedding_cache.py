@@ -0,0 +1,374 @@
+"""
+콘텐츠 주소 기반 밀집 임베딩 캐시 (모델 키 + 코드 SHA-256)
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .config import EMBEDDING_CACHE_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+# 저장 포맷 버전 (포맷이 바뀌면 올려서 이전 캐시를 무시)
+CACHE_FORMAT = 1
+
+# 레코드 헤더 (SHA-256 다이제스트) 크기
+DIGEST_SIZE = 32
+
+# 데이터 파일 확장 단위 (레코드 수)
+GROWTH_RECORDS = 1024
+
+
+class EmbeddingCache:
+    """
+    모델별 밀집 임베딩 디스크 캐시
+
+    디렉토리 구조:
+        {base_path}/{model_key}/vectors.bin   - 고정 길이 레코드 (다이제스트 32바이트 + float32 벡터)
+        {base_path}/{model_key}/index.json    - 다이제스트 -> 슬롯 번호 (LRU 순서)
+
+    용량(max_bytes)을 넘으면 가장 오래 사용되지 않은 슬롯을 재사용합니다.
+    레코드마다 다이제스트를 함께 기록하고 읽을 때 검증하므로, 여러 워커 프로세스가
+    같은 슬롯을 덮어쓰더라도 잘못된 벡터 대신 캐시 미스가 됩니다.
+    """
+
+    _instances: Dict[str, "EmbeddingCache"] = {}
+    _instances_lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def for_model(cls, model_key: str, dim: int) -> "EmbeddingCache":
+        """
+        모델 키별 캐시 인스턴스 반환 (프로세스 내 싱글톤)
+
+        Args:
+            model_key: 임베딩 모델 키
+            dim: 벡터 차원
+
+        Returns:
+            EmbeddingCache 인스턴스
+        """
+        with cls._instances_lock:
+            cache = cls._instances.get(model_key)
+            if cache is None or cache.dim != dim:
+                cache = cls(model_key, dim)
+                cls._instances[model_key] = cache
+            return cache
+
+    def __init__(
+        self,
+        model_key: str,
+        dim: int,
+        base_path: str = "embedding_cache",
+        max_bytes: int = EMBEDDING_CACHE_MAX_BYTES,
+    ) -> None:
+        """
+        EmbeddingCache 초기화
+
+        Args:
+            model_key: 임베딩 모델 키
+            dim: 벡터 차원
+            base_path: 캐시 저장 기본 경로
+            max_bytes: 데이터 파일 최대 크기 (바이트)
+        """
+        # 프로젝트 루트 찾기
+        if Path(base_path).is_absolute():
+            root = Path(base_path)
+        else:
+            current = Path.cwd()
+            while current != current.parent:
+                if (current / "pyproject.toml").exists():
+                    root = current / base_path
+                    break
+                current = current.parent
+            else:
+                root = Path(base_path).resolve()
+
+        self.model_key: str = model_key
+        self.dim: int = dim
+        self.record_size: int = DIGEST_SIZE + dim * 4
+        self.capacity: int = max(max_bytes, 0) // self.record_size
+        self.cache_path: Path = root / model_key
+        self.data_path: Path = self.cache_path / "vectors.bin"
+        self.index_path: Path = self.cache_path / "index.json"
+
+        self._lock: threading.RLock = threading.RLock()
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._index_stamp: Optional[int] = None
+        self._next_slot: int = 0
+        self._dirty: bool = False
+        self._buffer: Optional[mmap.mmap] = None
+
+        self._load_index()
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        """
+        텍스트의 콘텐츠 주소 (SHA-256 16진 문자열) 계산
+
+        Args:
+            text: 원본 텍스트
+
+        Returns:
+            다이제스트 문자열
+        """
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get_into(self, keys: Sequence[str], out: np.ndarray) -> List[bool]:
+        """
+        여러 키의 벡터를 미리 할당된 배열에 조회
+
+        Args:
+            keys: content_hash()로 만든 키 리스트
+            out: (키 수, dim) float32 배열 (히트한 행만 채워짐)
+
+        Returns:
+            키별 히트 여부
+        """
+        with self._lock:
+            if not self._dirty and self._stamp() != self._index_stamp:
+                self._load_index()
+
+            return [self._read_into(key, out[i]) for i, key in enumerate(keys)]
+
+    def put_many(self, keys: Sequence[str], vectors: np.ndarray) -> None:
+        """
+        여러 벡터 저장 (flush() 호출 전까지 인덱스는 프로세스 메모리에만 반영)
+
+        Args:
+            keys: content_hash()로 만든 키 리스트
+            vectors: (키 수, dim) float32 배열
+        """
+        if self.capacity == 0:
+            return
+
+        with self._lock:
+            for key, vector in zip(keys, vectors):
+                if len(vector) != self.dim:
+                    continue
+
+                slot = self._index.get(key)
+                if slot is None:
+                    slot = self._allocate_slot()
+                    if slot is None:
+                        return
+
+                self._write(slot, key, vector)
+                self._index[key] = slot
+                self._index.move_to_end(key)
+                self._dirty = True
+
+    def flush(self) -> None:
+        """
+        인덱스를 디스크에 기록 (다른 프로세스가 기록한 항목과 병합)
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+
+            # 디스크 항목을 먼저, 현재 프로세스 항목을 최신 순서로 병합
+            merged: "OrderedDict[str, int]" = OrderedDict(
+                (key, slot) for key, slot in self._read_index_file().items() if key not in self._index
+            )
+            merged.update(self._index)
+            while len(merged) > self.capacity:
+                merged.popitem(last=False)
+
+            state = {
+                "format": CACHE_FORMAT,
+                "byteorder": sys.byteorder,
+                "model_key": self.model_key,
+                "dim": self.dim,
+                "entries": list(merged.items()),
+            }
+
+            try:
+                self.cache_path.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.cache_path / "index.json.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(state, f)
+                os.replace(tmp_path, self.index_path)
+            except OSError as e:
+                logger.warning(f"⚠️ Failed to write embedding cache index: {e}")
+                return
+
+            self._index = merged
+            self._index_stamp = self._stamp()
+            self._next_slot = max(self._next_slot, max(merged.values(), default=-1) + 1)
+            self._dirty = False
+
+    def clear(self) -> None:
+        """
+        캐시 전체 삭제
+        """
+        with self._lock:
+            self._close_buffer()
+            for path in (self.index_path, self.data_path):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"Failed to delete embedding cache file {path}: {e}")
+
+            self._index = OrderedDict()
+            self._index_stamp = None
+            self._next_slot = 0
+            self._dirty = False
+
+    def _stamp(self) -> Optional[int]:
+        """인덱스 파일 변경 스탬프 (내부 메서드)"""
+        try:
+            return os.stat(self.index_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _read_index_file(self) -> "OrderedDict[str, int]":
+        """
+        디스크 인덱스 읽기 (내부 메서드)
+
+        Returns:
+            다이제스트 -> 슬롯 (포맷/차원이 다르면 빈 인덱스)
+        """
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return OrderedDict()
+
+        if (
+            state.get("format") != CACHE_FORMAT
+            or state.get("byteorder") != sys.byteorder
+            or state.get("dim") != self.dim
+        ):
+            logger.warning(f"⚠️ Ignoring incompatible embedding cache index: {self.index_path}")
+            return OrderedDict()
+
+        return OrderedDict((key, slot) for key, slot in state["entries"] if slot < self.capacity)
+
+    def _load_index(self) -> None:
+        """디스크 인덱스를 프로세스 메모리로 로드 (내부 메서드)"""
+        self._index_stamp = self._stamp()
+        self._index = self._read_index_file()
+        self._next_slot = max(self._index.values(), default=-1) + 1
+
+    def _ensure_mapped(self, size: int) -> bool:
+        """
+        데이터 파일이 size 바이트 이상 매핑되어 있도록 보장 (내부 메서드)
+
+        Args:
+            size: 필요한 최소 크기
+
+        Returns:
+            매핑 성공 여부
+        """
+        if self._buffer is not None and len(self._buffer) >= size:
+            return True
+
+        self._close_buffer()
+        try:
+            file_size = os.path.getsize(self.data_path)
+        except OSError:
+            return False
+        if file_size < size:
+            return False
+
+        with open(self.data_path, "r+b") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0)
+        return True
+
+    def _close_buffer(self) -> None:
+        """데이터 파일 매핑 해제 (내부 메서드)"""
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+
+    def _read_into(self, key: str, out: np.ndarray) -> bool:
+        """
+        단일 키 조회 (다이제스트 검증 포함, 내부 메서드)
+
+        Args:
+            key: 다이제스트 문자열
+            out: 벡터를 채울 (dim,) float32 배열
+
+        Returns:
+            히트 여부
+        """
+        slot = self._index.get(key)
+        if slot is None:
+            return False
+
+        offset = slot * self.record_size
+        if not self._ensure_mapped(offset + self.record_size):
+            return False
+
+        if self._buffer[offset : offset + DIGEST_SIZE] != bytes.fromhex(key):
+            # 다른 키가 슬롯을 재사용함
+            del self._index[key]
+            return False
+
+        self._index.move_to_end(key)
+        # 매핑을 직접 참조하는 뷰를 남기지 않도록 바이트 복사본에서 읽음 (매핑 해제 가능 상태 유지)
+        out[:] = np.frombuffer(
+            self._buffer[offset + DIGEST_SIZE : offset + self.record_size], dtype=np.float32
+        )
+        return True
+
+    def _write(self, slot: int, key: str, vector: np.ndarray) -> None:
+        """
+        슬롯에 레코드 기록 (내부 메서드)
+
+        Args:
+            slot: 슬롯 번호
+            key: 다이제스트 문자열
+            vector: 벡터
+        """
+        offset = slot * self.record_size
+        self._buffer[offset : offset + self.record_size] = (
+            bytes.fromhex(key) + np.asarray(vector, dtype=np.float32).tobytes()
+        )
+
+    def _allocate_slot(self) -> Optional[int]:
+        """
+        새 레코드 슬롯 할당 (용량 초과 시 LRU 슬롯 재사용, 내부 메서드)
+
+        Returns:
+            슬롯 번호 (데이터 파일 확장 실패 시 None)
+        """
+        if self._next_slot >= self.capacity:
+            if not self._index:
+                return 0
+            _, slot = self._index.popitem(last=False)
+            return slot
+
+        slot = self._next_slot
+        required = (slot + 1) * self.record_size
+        if not self._ensure_mapped(required):
+            new_size = min(slot + GROWTH_RECORDS, self.capacity) * self.record_size
+            try:
+                self._close_buffer()
+                self.cache_path.mkdir(parents=True, exist_ok=True)
+                with open(self.data_path, "ab") as f:
+                    if f.tell() < new_size:
+                        f.truncate(new_size)
+            except OSError as e:
+                # Windows에서 다른 프로세스가 매핑 중이면 확장 불가 → 이번에는 캐싱 생략
+                logger.warning(f"⚠️ Failed to grow embedding cache file: {e}")
+                return None
+            if not self._ensure_mapped(required):
+                return None
+
+        self._next_slot = slot + 1
+        return slot
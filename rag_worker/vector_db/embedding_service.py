@@ -2,57 +2,118 @@
 임베딩 처리 서비스
 """
 
-import json
+import gc
 import logging
 import os
+import queue
+import threading
 import time
-from typing import Dict, List, Any
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Any, Iterable, Iterator, Optional, Tuple
+import numpy as np
+import psutil
 import torch
-from rank_bm25 import BM25Okapi
 from langchain_huggingface import HuggingFaceEmbeddings
 
-from .config import EMBEDDING_MODELS
-from .collection_manager import MilvusConnectionManager
+from .config import (
+    EMBEDDING_MODELS,
+    DELETE_FILE_BATCH_SIZE,
+    EMBEDDING_ADAPTIVE_BATCH,
+    EMBEDDING_CACHE_ENABLED,
+    EMBEDDING_MAX_BATCH_SIZE,
+    EMBEDDING_TOKEN_BUDGET,
+    MEMORY_PRESSURE_RATIO,
+    PIPELINE_QUEUE_SIZE,
+)
+from .batch_sizer import AdaptiveBatchSizer, current_rss, is_allocation_failure
+from .chunk_reader import iter_chunk_file
+from .vector_store import get_vector_store
+from .embedding_cache import EmbeddingCache
+from .model_registry import EmbeddingModelRegistry
+from .sparse_encoder import BM25SparseEncoder, SparseBatch, tokenize
+from .sparse_model_store import SparseModelStore
 from .exceptions import EmbeddingError, DataValidationError, ModelLoadError
-from .types import EmbeddingInput, EmbeddingResult
+from .types import EmbeddingInput, EmbeddingResult, DenseEmbeddingStats
 
 logger = logging.getLogger(__name__)
 
 
 class BM25ModelCache:
-    """BM25 모델 캐시 관리 클래스"""
+    """
+    BM25 희소 인코더 캐시 관리 클래스
 
-    _cache: Dict[str, BM25Okapi] = {}
+    프로세스 메모리 캐시 앞단에 컬렉션별 영속 아티팩트(SparseModelStore)를 두어,
+    Celery prefork 자식 프로세스 / 워커 재시작 / 신규 노드가 Milvus에서 모델을
+    재구성하지 않고 디스크 아티팩트를 메모리 매핑하여 공유합니다.
+    """
+
+    _cache: Dict[str, BM25SparseEncoder] = {}
+    _stamps: Dict[str, Optional[int]] = {}
+    _versions: Dict[str, int] = {}
+    _store: Optional[SparseModelStore] = None
+
+    @classmethod
+    def get_store(cls) -> SparseModelStore:
+        """
+        아티팩트 저장소 반환 (싱글톤 패턴)
+
+        Returns:
+            SparseModelStore 인스턴스
+        """
+        if cls._store is None:
+            cls._store = SparseModelStore()
+        return cls._store
 
     @classmethod
-    def get(cls, collection_name: str) -> BM25Okapi:
+    def get(cls, collection_name: str) -> Optional[BM25SparseEncoder]:
         """
-        캐시에서 BM25 모델 가져오기
+        캐시에서 BM25 인코더 가져오기 (아티팩트가 갱신되었으면 다시 매핑)
 
         Args:
             collection_name: 컬렉션 이름
 
         Returns:
-            BM25 모델 (없으면 None)
+            BM25 인코더 (없으면 None)
         """
-        return cls._cache.get(collection_name)
+        store = cls.get_store()
+        stamp = store.stamp(collection_name)
+
+        if collection_name in cls._cache and cls._stamps.get(collection_name) == stamp:
+            return cls._cache[collection_name]
+
+        loaded = store.load(collection_name) if stamp is not None else None
+        if loaded is None:
+            cls.invalidate(collection_name)
+            return None
+
+        encoder, meta = loaded
+        cls._cache[collection_name] = encoder
+        cls._stamps[collection_name] = stamp
+        cls._versions[collection_name] = meta["version"]
+        return encoder
 
     @classmethod
-    def set(cls, collection_name: str, model: BM25Okapi) -> None:
+    def set(cls, collection_name: str, model: BM25SparseEncoder) -> None:
         """
-        캐시에 BM25 모델 저장
+        BM25 인코더를 아티팩트로 저장하고 캐시에 등록
 
         Args:
             collection_name: 컬렉션 이름
-            model: BM25 모델
+            model: BM25 인코더
         """
+        store = cls.get_store()
+        version = store.save(collection_name, model)
+
         cls._cache[collection_name] = model
-        logger.info(f"✅ BM25 model cached for collection: {collection_name}")
+        cls._stamps[collection_name] = store.stamp(collection_name)
+        cls._versions[collection_name] = version
+        logger.info(f"✅ BM25 model cached for collection: {collection_name} (v{version})")
 
     @classmethod
     def has(cls, collection_name: str) -> bool:
         """
-        캐시에 모델이 있는지 확인
+        캐시 또는 아티팩트에 모델이 있는지 확인
 
         Args:
             collection_name: 컬렉션 이름
@@ -60,18 +121,56 @@ class BM25ModelCache:
         Returns:
             존재 여부
         """
-        return collection_name in cls._cache
+        return cls.get(collection_name) is not None
+
+    @classmethod
+    def version(cls, collection_name: str) -> Optional[int]:
+        """
+        캐시된 인코더의 아티팩트 버전 반환
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            버전 번호 (없으면 None)
+        """
+        return cls._versions.get(collection_name)
+
+    @classmethod
+    def invalidate(cls, collection_name: str) -> None:
+        """
+        프로세스 캐시에서 인코더 제거
+
+        Args:
+            collection_name: 컬렉션 이름
+        """
+        cls._cache.pop(collection_name, None)
+        cls._stamps.pop(collection_name, None)
+        cls._versions.pop(collection_name, None)
 
 
 class DenseEmbedder:
-    """밀집 벡터 임베딩 처리 클래스"""
+    """
+    밀집 벡터 임베딩 처리 클래스
+
+    텍스트를 토큰 길이순으로 정렬한 뒤 (배치 크기 x 배치 내 최대 길이)가 토큰 예산을 넘지 않도록
+    배치를 채워 패딩 낭비를 줄이고, 결과는 입력 순서로 되돌려 반환합니다.
+    토큰 예산은 AdaptiveBatchSizer가 메모리 여유와 처리량에 따라 조절합니다.
+    """
 
-    def __init__(self, model_key: str) -> None:
+    def __init__(
+        self,
+        model_key: str,
+        token_budget: Optional[int] = None,
+        max_batch_size: int = EMBEDDING_MAX_BATCH_SIZE,
+    ) -> None:
         """
         DenseEmbedder 초기화
 
         Args:
             model_key: 모델 키 (config.EMBEDDING_MODELS에 정의된 키)
+            token_budget: 배치당 패딩 포함 최대 토큰 수 (None이면 프로세스 공유 조절기 사용)
+            max_batch_size: 배치당 최대 텍스트 수
 
         Raises:
             ModelLoadError: 모델 로드 실패 시
@@ -82,122 +181,278 @@ class DenseEmbedder:
         if not self.model_config:
             raise ModelLoadError(f"Model config not found for key: {model_key}")
 
-        try:
-            # 디버깅: 환경 확인
-            import sys
-            logger.info(f"🔍 Python executable: {sys.executable}")
-            logger.info(f"🔍 PyTorch version: {torch.__version__}")
-            logger.info(f"🔍 CUDA available: {torch.cuda.is_available()}")
-            logger.info(f"🔍 CUDA version: {torch.version.cuda if hasattr(torch.version, 'cuda') else 'N/A'}")
-
-            device: str = "cuda" if torch.cuda.is_available() else "cpu"
-
-            if device == "cuda":
-                gpu_name = torch.cuda.get_device_name(0)
-                gpu_memory = torch.cuda.get_device_properties(0).total_memory / 1024**3  # GB
-                logger.info(f"🚀 Loading dense embedding model on GPU: {gpu_name} ({gpu_memory:.1f}GB)")
-            else:
-                logger.info(f"⚠️ Loading dense embedding model on CPU (GPU not available)")
-
-            # safetensors 강제 사용을 위한 환경 변수 설정
-            import os
-            os.environ["SAFETENSORS_FAST_GPU"] = "1"
-
-            self.embedder: HuggingFaceEmbeddings = HuggingFaceEmbeddings(
-                model_name=self.model_config["model_name"],
-                model_kwargs={
-                    "device": device,
-                    "trust_remote_code": True
-                },
-                encode_kwargs={"normalize_embeddings": True},
+        # 프로세스 단위 레지스트리에서 공유 모델 인스턴스 획득
+        self.embedder: HuggingFaceEmbeddings = EmbeddingModelRegistry.get(model_key)
+        self.max_batch_size: int = max(max_batch_size, 1)
+
+        # 길이 계산용 토크나이저 (SentenceTransformer 클라이언트가 없으면 문자 수로 추정)
+        client = getattr(self.embedder, "_client", None)
+        self.tokenizer: Optional[Any] = getattr(client, "tokenizer", None)
+        self.max_seq_length: int = getattr(client, "max_seq_length", None) or 512
+
+        # 배치 토큰 예산 조절기 (예산을 지정하면 키우지 않고 할당 실패 시 줄이기만 함)
+        if token_budget is None and EMBEDDING_ADAPTIVE_BATCH:
+            self.sizer: AdaptiveBatchSizer = AdaptiveBatchSizer.for_model(model_key, self.max_seq_length)
+        else:
+            self.sizer = AdaptiveBatchSizer(
+                initial_budget=token_budget or EMBEDDING_TOKEN_BUDGET,
+                min_budget=self.max_seq_length,
+                adaptive=False,
             )
-            logger.info(f"✅ Dense embedding model loaded: {model_key} on {device.upper()}")
 
-        except Exception as e:
-            import traceback
-            logger.error(f"Failed to load dense embedding model: {e}")
-            logger.error(f"Full traceback: {traceback.format_exc()}")
-            raise ModelLoadError(f"Failed to load model: {e}") from e
+        # 누적 처리량 / 메모리 통계
+        self.tokens_processed: int = 0
+        self.encode_seconds: float = 0.0
+        self.peak_rss: int = current_rss()
+
+    @property
+    def token_budget(self) -> int:
+        """현재 배치 토큰 예산"""
+        return self.sizer.token_budget
+
+    @property
+    def tokens_per_second(self) -> float:
+        """누적 처리량 (토큰/초)"""
+        return self.tokens_processed / self.encode_seconds if self.encode_seconds else 0.0
+
+    def count_tokens(self, texts: List[str]) -> List[int]:
+        """
+        텍스트별 토큰 수 계산 (모델 최대 시퀀스 길이로 잘림 반영)
+
+        Args:
+            texts: 텍스트 리스트
+
+        Returns:
+            토큰 수 리스트
+        """
+        if self.tokenizer is None:
+            return [min(max(len(text) // 4, 1), self.max_seq_length) for text in texts]
+
+        encoded = self.tokenizer(
+            texts, add_special_tokens=True, truncation=True, max_length=self.max_seq_length
+        )
+        return [len(input_ids) for input_ids in encoded["input_ids"]]
+
+    def plan_batches(
+        self, lengths: List[int], indices: Optional[Iterable[int]] = None
+    ) -> List[List[int]]:
+        """
+        길이순으로 정렬한 인덱스를 토큰 예산 단위 배치로 분할
+
+        긴 텍스트부터 처리하므로 메모리 부족은 작업 초반에 드러납니다.
+
+        Args:
+            lengths: 텍스트별 토큰 수
+            indices: 배치로 나눌 인덱스 (None이면 전체)
+
+        Returns:
+            배치별 원본 인덱스 리스트
+        """
+        if indices is None:
+            indices = range(len(lengths))
+        order = sorted(indices, key=lengths.__getitem__, reverse=True)
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_max = 0
+
+        for idx in order:
+            batch_max = max(current_max, lengths[idx])
+            if current and (
+                batch_max * (len(current) + 1) > self.token_budget
+                or len(current) >= self.max_batch_size
+            ):
+                batches.append(current)
+                current, batch_max = [], lengths[idx]
+            current.append(idx)
+            current_max = batch_max
+
+        if current:
+            batches.append(current)
+        return batches
 
-    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+    def embed_documents(
+        self,
+        texts: List[str],
+        on_batch: Optional[Callable[[List[int], np.ndarray], None]] = None,
+    ) -> np.ndarray:
         """
-        텍스트 리스트를 밀집 벡터로 변환
+        텍스트 리스트를 밀집 벡터로 변환 (길이 버킷 배치, 입력 순서 유지)
+
+        모델 출력은 미리 할당한 float32 배열의 원래 행 위치에 바로 복사되므로
+        벡터 원소마다 Python float 객체를 만들지 않습니다.
+        메모리 할당에 실패하면 토큰 예산을 줄여 남은 텍스트를 다시 배치로 나눈 뒤 계속합니다.
 
         Args:
             texts: 텍스트 리스트
+            on_batch: 배치 완료 시 (원본 인덱스, (배치 크기, dim) 벡터 배열) 콜백 (부분 결과 캐싱용)
 
         Returns:
-            밀집 벡터 리스트
+            (텍스트 수, dim) float32 배열
+
+        Raises:
+            MemoryError, RuntimeError: 최소 예산에서도 할당에 실패할 때
+        """
+        lengths = self.count_tokens(texts)
+        vectors = np.empty((len(texts), self.model_config["dim"]), dtype=np.float32)
+        batches: Deque[List[int]] = deque(self.plan_batches(lengths))
+
+        while batches:
+            batch = batches.popleft()
+            batch_tokens = sum(lengths[idx] for idx in batch)
+            start_time = time.perf_counter()
+            try:
+                batch_vectors = self._encode([texts[idx] for idx in batch])
+            except (MemoryError, RuntimeError) as e:
+                if not is_allocation_failure(e) or not self.sizer.back_off():
+                    raise
+                self._release_memory(force=True)
+                remaining = batch + [idx for pending in batches for idx in pending]
+                batches = deque(self.plan_batches(lengths, remaining))
+                continue
+
+            elapsed = time.perf_counter() - start_time
+            self.encode_seconds += elapsed
+            self.tokens_processed += batch_tokens
+            self.sizer.observe(batch_tokens, elapsed)
+            self.peak_rss = max(self.peak_rss, current_rss())
+
+            vectors[batch] = batch_vectors
+            if on_batch is not None:
+                on_batch(batch, batch_vectors)
+
+            self._release_memory()
+
+        self.sizer.step()
+        return vectors
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
         """
-        import gc
-        import torch
+        모델 1회 호출 (내부 메서드)
+
+        HuggingFaceEmbeddings.embed_documents는 결과를 .tolist()로 바꿔 반환하므로,
+        SentenceTransformer 클라이언트가 있으면 같은 전처리(줄바꿈 → 공백)와
+        encode_kwargs로 직접 호출해 numpy 배열을 그대로 받습니다.
+
+        Args:
+            texts: 텍스트 리스트
 
-        result = self.embedder.embed_documents(texts)
+        Returns:
+            (텍스트 수, dim) float32 배열
+        """
+        client = getattr(self.embedder, "_client", None)
+        if client is None:
+            return np.asarray(self.embedder.embed_documents(texts), dtype=np.float32)
+
+        embeddings = client.encode(
+            [text.replace("\n", " ") for text in texts],
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            **self.embedder.encode_kwargs,
+        )
+        return np.asarray(embeddings, dtype=np.float32)
+
+    @staticmethod
+    def _release_memory(force: bool = False) -> None:
+        """
+        메모리 압박 시에만 캐시 해제 / GC 실행 (내부 메서드)
 
-        # 메모리 정리
+        Args:
+            force: 사용률과 관계없이 해제할지 여부 (할당 실패 직후)
+        """
         if torch.cuda.is_available():
-            torch.cuda.empty_cache()
-        gc.collect()
+            total = torch.cuda.get_device_properties(0).total_memory
+            if force or torch.cuda.memory_reserved() > total * MEMORY_PRESSURE_RATIO:
+                torch.cuda.empty_cache()
 
-        return result
+        if force or psutil.virtual_memory().percent > MEMORY_PRESSURE_RATIO * 100:
+            gc.collect()
 
 
 class SparseEmbedder:
-    """희소 벡터 임베딩 처리 클래스 (BM25)"""
+    """희소 벡터 임베딩 처리 클래스 (BM25 용어 가중치)"""
 
-    def __init__(self, tokenized_corpus: List[List[str]]) -> None:
+    def __init__(self, tokenized_corpus: Iterable[List[str]]) -> None:
         """
-        SparseEmbedder 초기화
+        SparseEmbedder 초기화 (코퍼스 통계 1회 순회)
 
         Args:
-            tokenized_corpus: 토큰화된 문서 리스트
+            tokenized_corpus: 토큰화된 문서 이터러블
         """
-        self.bm25: BM25Okapi = BM25Okapi(tokenized_corpus)
+        self.encoder: BM25SparseEncoder = BM25SparseEncoder().fit(tokenized_corpus)
+        if self.encoder.collisions:
+            merged = sum(len(tokens) for tokens in self.encoder.collisions.values())
+            examples = list(self.encoder.collisions.values())[:3]
+            logger.warning(
+                f"⚠️ BM25 term hash collisions: {merged} tokens share {len(self.encoder.collisions)} term IDs "
+                f"(e.g. {examples})"
+            )
 
     def embed_documents(
         self, tokenized_corpus: List[List[str]]
     ) -> List[Dict[int, float]]:
         """
-        토큰화된 문서를 희소 벡터로 변환
+        토큰화된 문서를 희소 벡터로 변환 (문서당 O(토큰 수))
 
         Args:
             tokenized_corpus: 토큰화된 문서 리스트
 
         Returns:
-            희소 벡터 리스트 (딕셔너리 형태)
+            희소 벡터 리스트 (용어 ID -> 가중치 딕셔너리)
         """
-        sparse_vectors: List[Dict[int, float]] = []
-
-        for doc_tokens in tokenized_corpus:
-            doc_scores = self.bm25.get_scores(doc_tokens)
-            sparse_vec = {i: score for i, score in enumerate(doc_scores) if score > 0}
-            sparse_vectors.append(sparse_vec)
-
-        return sparse_vectors
+        return self.encoder.encode_documents(tokenized_corpus)
 
 
 class EmbeddingService:
     """임베딩 처리 통합 서비스 클래스"""
 
-    def __init__(self, batch_size: int = 256, embedding_batch_size: int = 12) -> None:
+    def __init__(
+        self, batch_size: int = 256, embedding_batch_size: int = EMBEDDING_MAX_BATCH_SIZE
+    ) -> None:
         """
         EmbeddingService 초기화
 
         Args:
             batch_size: Milvus 삽입 배치 크기
-            embedding_batch_size: 임베딩 생성 배치 크기 (메모리 절약)
+            embedding_batch_size: 모델 1회 호출당 최대 텍스트 수 (토큰 예산과 함께 적용)
         """
-        self.client = MilvusConnectionManager.get_client()
+        self.store = get_vector_store()
         self.batch_size: int = batch_size
         self.embedding_batch_size: int = embedding_batch_size
 
     def process_embedding(self, input_data: EmbeddingInput) -> EmbeddingResult:
         """
-        JSON 파일에서 데이터를 읽어 임베딩 후 Milvus에 저장
+        청크 파일(JSON 배열 또는 줄 단위 JSON)을 읽어 임베딩 후 Milvus에 저장
 
         Args:
             input_data: 임베딩 작업 입력
 
+        Returns:
+            임베딩 결과
+        """
+        json_path = Path(input_data["json_path"])
+        return self.process_chunks(
+            chunk_source=lambda: iter_chunk_file(json_path),
+            collection_name=input_data["collection_name"],
+            model_key=input_data["model_key"],
+        )
+
+    def process_chunks(
+        self,
+        chunk_source: Callable[[], Iterable[Dict[str, Any]]],
+        collection_name: str,
+        model_key: str,
+    ) -> EmbeddingResult:
+        """
+        청크 이터레이터를 임베딩하여 Milvus에 저장 (컬렉션 전체 재구성)
+
+        BM25 통계 수집과 임베딩 파이프라인이 각각 chunk_source()로 새 이터레이터를 받아
+        순회하므로, 청크 전체를 메모리에 올리거나 임시 파일로 합치지 않습니다.
+
+        Args:
+            chunk_source: 호출할 때마다 청크 딕셔너리 이터러블을 새로 만드는 함수
+            collection_name: 컬렉션 이름
+            model_key: 임베딩 모델 키
+
         Returns:
             임베딩 결과
         """
@@ -205,74 +460,30 @@ class EmbeddingService:
 
         try:
             # 0. 컬렉션 존재 확인 및 생성
-            from .collection_manager import CollectionManager
-            from .config import EMBEDDING_MODELS
-
-            collection_manager = CollectionManager()
-            collection_name = input_data["collection_name"]
-
-            if not collection_manager.exists(collection_name):
-                logger.info(f"Collection '{collection_name}' not found. Creating...")
-                model_config = EMBEDDING_MODELS.get(input_data["model_key"])
-                dim = model_config["dim"]
+            self._ensure_collection(collection_name, model_key)
+            logger.info(f"▶️ Starting embedding process for collection: {collection_name}")
 
-                result = collection_manager.create_collection(
-                    collection_name=collection_name,
-                    dim=dim,
-                    description=f"Auto-created for embedding task"
-                )
+            # 1. BM25 코퍼스 통계 수집 (토큰 리스트를 보관하지 않고 1회 순회)
+            logger.info("Collecting BM25 corpus statistics...")
+            sparse_embedder = SparseEmbedder(
+                tokenize(text) for text, _ in self._iter_documents(chunk_source())
+            )
 
-                if not result["success"]:
-                    raise EmbeddingError(f"Failed to create collection: {result['error']}")
+            if sparse_embedder.encoder.num_docs == 0:
+                raise DataValidationError("No valid documents found in chunk source")
 
-                logger.info(f"✅ Collection '{collection_name}' created successfully")
+            logger.info("✅ BM25 model fitted")
 
-            # 1. 데이터 로딩
-            logger.info(f"▶️ Starting embedding process for collection: {collection_name}")
-            texts, metadata_list = self._load_data(input_data["json_path"])
-
-            if not texts:
-                raise DataValidationError("No valid documents found in JSON file")
-
-            # 2. 희소 벡터 생성
-            logger.info("Generating sparse vectors (BM25)...")
-            tokenized_corpus = [doc.split(" ") for doc in texts]
-            sparse_embedder = SparseEmbedder(tokenized_corpus)
-            sparse_vectors = sparse_embedder.embed_documents(tokenized_corpus)
-
-            # BM25 모델 캐싱
-            BM25ModelCache.set(input_data["collection_name"], sparse_embedder.bm25)
-            logger.info("✅ Sparse vectors generated and BM25 model cached")
-
-            # 3. 밀집 벡터 생성 (배치로 나눠서 처리)
-            logger.info(f"Generating dense vectors ({len(texts)} documents) in batches of {self.embedding_batch_size}...")
-            dense_embedder = DenseEmbedder(input_data["model_key"])
-
-            dense_vectors: List[List[float]] = []
-            for batch_idx, i in enumerate(range(0, len(texts), self.embedding_batch_size), 1):
-                batch_end = min(i + self.embedding_batch_size, len(texts))
-                batch_texts = texts[i:batch_end]
-
-                logger.info(f"  - Embedding batch {batch_idx}/{(len(texts)-1)//self.embedding_batch_size + 1}: {i+1}~{batch_end}/{len(texts)}")
-                batch_vectors = dense_embedder.embed_documents(batch_texts)
-                dense_vectors.extend(batch_vectors)
-
-                # 배치마다 메모리 정리
-                del batch_vectors
-                del batch_texts
-                import gc
-                gc.collect()
-
-            logger.info("✅ Dense vectors generated")
-
-            # 4. Milvus에 배치 삽입
-            inserted_count = self._batch_insert(
-                collection_name=input_data["collection_name"],
-                texts=texts,
-                metadata_list=metadata_list,
-                dense_vectors=dense_vectors,
-                sparse_vectors=sparse_vectors,
+            # 2. 읽기 → 임베딩 → 삽입 스트리밍 후 인코더 저장
+            # (삽입이 끝나기 전에 저장하면 동시 검색이 행 수 불일치로 일부만 삽입된
+            #  컬렉션에서 BM25 모델을 재구성해 덮어쓰므로, 파이프라인 성공 후에만 저장)
+            inserted_count, total_documents, cache_stats = self._run_pipeline(
+                collection_name=collection_name,
+                model_key=model_key,
+                documents=self._iter_documents(chunk_source()),
+                encoder=sparse_embedder.encoder,
             )
+            BM25ModelCache.set(collection_name, sparse_embedder.encoder)
 
             elapsed_time = time.time() - start_time
             logger.info(
@@ -281,10 +492,16 @@ class EmbeddingService:
 
             return EmbeddingResult(
                 success=True,
-                collection_name=input_data["collection_name"],
-                total_documents=len(texts),
+                collection_name=collection_name,
+                total_documents=total_documents,
                 inserted_count=inserted_count,
                 elapsed_time=elapsed_time,
+                cache_hits=cache_stats["hits"],
+                cache_hit_rate=self._hit_rate(cache_stats),
+                cache_bytes_saved=cache_stats["bytes_saved"],
+                tokens_per_second=self._tokens_per_second(cache_stats),
+                batch_token_budget=cache_stats["token_budget"],
+                peak_rss_bytes=cache_stats["peak_rss_bytes"],
                 message=f"Successfully embedded {inserted_count} documents",
                 error=None,
             )
@@ -295,68 +512,538 @@ class EmbeddingService:
 
             return EmbeddingResult(
                 success=False,
-                collection_name=input_data.get("collection_name", ""),
+                collection_name=collection_name,
                 total_documents=0,
                 inserted_count=0,
                 elapsed_time=elapsed_time,
+                cache_hits=0,
+                cache_hit_rate=0.0,
+                cache_bytes_saved=0,
+                tokens_per_second=0.0,
+                batch_token_budget=0,
+                peak_rss_bytes=0,
                 message=None,
                 error=str(e),
             )
 
-    def _load_data(self, json_path: str) -> tuple[List[str], List[Dict[str, Any]]]:
+    def embed_chunks(
+        self, chunks: List[Dict[str, Any]], collection_name: str, model_key: str
+    ) -> EmbeddingResult:
         """
-        JSON 파일에서 데이터 로딩
+        청크 리스트를 기존 컬렉션에 추가 임베딩 (증분 동기화용)
+
+        기존 BM25 인코더의 코퍼스 통계에 새 문서를 더해 희소 벡터를 만들고,
+        갱신된 인코더를 새 버전 아티팩트로 저장합니다. 삽입 도중 실패하면 이미 삽입된
+        배치(저장된 BM25 통계에 없는 행)를 소스 파일 단위로 삭제하므로, 호출 측은 청크의 소스 파일
+        행을 미리 삭제해 두어야 합니다 (증분 동기화는 변경된 모든 파일의 행을 먼저 삭제).
 
         Args:
-            json_path: JSON 파일 경로
+            chunks: 청크 딕셔너리 리스트 (ChunkEntry 형식)
+            collection_name: 컬렉션 이름
+            model_key: 사용할 임베딩 모델 키
 
         Returns:
-            (텍스트 리스트, 메타데이터 리스트)
+            임베딩 결과
+        """
+        start_time: float = time.time()
+        inserting = False
 
-        Raises:
-            DataValidationError: 파일을 찾을 수 없거나 형식이 잘못된 경우
+        try:
+            self._ensure_collection(collection_name, model_key)
+            num_documents = sum(1 for _ in self._iter_documents(chunks))
+
+            if num_documents == 0:
+                return EmbeddingResult(
+                    success=True,
+                    collection_name=collection_name,
+                    total_documents=0,
+                    inserted_count=0,
+                    elapsed_time=time.time() - start_time,
+                    cache_hits=0,
+                    cache_hit_rate=0.0,
+                    cache_bytes_saved=0,
+                    tokens_per_second=0.0,
+                    batch_token_budget=0,
+                    peak_rss_bytes=0,
+                    message="No documents to embed",
+                    error=None,
+                )
+
+            logger.info(f"▶️ Embedding {num_documents} new documents into collection: {collection_name}")
+
+            # 인코더 로드부터 저장까지 컬렉션 잠금을 유지해 다른 프로세스의 통계 갱신을 덮어쓰지 않음
+            with BM25ModelCache.get_store().lock(collection_name):
+                # 1. 기존 인코더에 새 문서 통계 추가
+                encoder = BM25ModelCache.get(collection_name) or BM25SparseEncoder()
+                encoder.add_documents(tokenize(text) for text, _ in self._iter_documents(chunks))
+
+                # 2. 읽기 → 임베딩 → 삽입 스트리밍 후 인코더 저장
+                inserting = True
+                inserted_count, total_documents, cache_stats = self._run_pipeline(
+                    collection_name=collection_name,
+                    model_key=model_key,
+                    documents=self._iter_documents(chunks),
+                    encoder=encoder,
+                )
+                BM25ModelCache.set(collection_name, encoder)
+
+            elapsed_time = time.time() - start_time
+            logger.info(
+                f"🎉 Incremental embedding completed: {inserted_count} documents inserted in {elapsed_time:.2f}s"
+            )
+
+            return EmbeddingResult(
+                success=True,
+                collection_name=collection_name,
+                total_documents=total_documents,
+                inserted_count=inserted_count,
+                elapsed_time=elapsed_time,
+                cache_hits=cache_stats["hits"],
+                cache_hit_rate=self._hit_rate(cache_stats),
+                cache_bytes_saved=cache_stats["bytes_saved"],
+                tokens_per_second=self._tokens_per_second(cache_stats),
+                batch_token_budget=cache_stats["token_budget"],
+                peak_rss_bytes=cache_stats["peak_rss_bytes"],
+                message=f"Successfully embedded {inserted_count} documents",
+                error=None,
+            )
+
+        except Exception as e:
+            # 메모리상 인코더가 일부 갱신되었을 수 있으므로 아티팩트에서 다시 로드
+            BM25ModelCache.invalidate(collection_name)
+            if inserting:
+                self._rollback_inserted(collection_name, chunks)
+            elapsed_time = time.time() - start_time
+            logger.error(f"❌ Incremental embedding failed: {e}")
+
+            return EmbeddingResult(
+                success=False,
+                collection_name=collection_name,
+                total_documents=0,
+                inserted_count=0,
+                elapsed_time=elapsed_time,
+                cache_hits=0,
+                cache_hit_rate=0.0,
+                cache_bytes_saved=0,
+                tokens_per_second=0.0,
+                batch_token_budget=0,
+                peak_rss_bytes=0,
+                message=None,
+                error=str(e),
+            )
+
+    def _rollback_inserted(self, collection_name: str, chunks: List[Dict[str, Any]]) -> None:
         """
-        if not os.path.exists(json_path):
-            raise DataValidationError(f"File not found: {json_path}")
+        실패한 증분 임베딩에서 이미 삽입된 행 삭제 (BM25 통계는 갱신하지 않음, 내부 메서드)
 
+        Args:
+            collection_name: 컬렉션 이름
+            chunks: 임베딩하려던 청크 리스트
+        """
+        file_paths = sorted({
+            metadata["file_path"] for _, metadata in self._iter_documents(chunks) if metadata.get("file_path")
+        })
         try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                items = json.load(f)
+            deleted_count = 0
+            for i in range(0, len(file_paths), DELETE_FILE_BATCH_SIZE):
+                batch_paths = file_paths[i : i + DELETE_FILE_BATCH_SIZE]
+                deleted_count += self.store.delete_by_files(collection_name, batch_paths)
+            if deleted_count:
+                logger.info(f"↩️ Rolled back {deleted_count} partially inserted chunks from {collection_name}")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to roll back partially inserted chunks from {collection_name}: {e}")
+
+    def delete_file_chunks(self, collection_name: str, file_paths: List[str]) -> int:
+        """
+        지정된 소스 파일의 청크를 컬렉션에서 삭제하고 BM25 통계에서 제외
+
+        Args:
+            collection_name: 컬렉션 이름
+            file_paths: 삭제할 청크의 file_path 값 리스트
+
+        Returns:
+            삭제된 엔티티 수
+
+        Raises:
+            EmbeddingError: 삭제 실패 시
+        """
+        if not file_paths:
+            return 0
 
-            texts: List[str] = []
-            metadata_list: List[Dict[str, Any]] = []
+        deleted_count = 0
 
-            for item in items:
-                code = item.get("code")
-                if code and code.strip():
-                    texts.append(code)
-                    metadata_list.append({k: v for k, v in item.items() if k != "code"})
+        # 인코더 로드부터 저장까지 컬렉션 잠금을 유지해 다른 프로세스의 통계 갱신을 덮어쓰지 않음
+        with BM25ModelCache.get_store().lock(collection_name):
+            encoder = BM25ModelCache.get(collection_name)
 
-            logger.info(f"Loaded {len(texts)} valid documents from {json_path}")
-            return texts, metadata_list
+            try:
+                for i in range(0, len(file_paths), DELETE_FILE_BATCH_SIZE):
+                    batch_paths = file_paths[i : i + DELETE_FILE_BATCH_SIZE]
+
+                    # 삭제될 문서의 토큰을 BM25 통계에서 제거
+                    if encoder is not None:
+                        rows = self.store.query_by_files(collection_name, batch_paths, ["text"])
+                        encoder.remove_documents(tokenize(row["text"]) for row in rows if "text" in row)
+
+                    deleted_count += self.store.delete_by_files(collection_name, batch_paths)
+
+            except Exception as e:
+                BM25ModelCache.invalidate(collection_name)
+                logger.error(f"❌ Failed to delete chunks: {e}")
+                raise EmbeddingError(f"Failed to delete chunks: {e}") from e
+
+            if encoder is not None:
+                BM25ModelCache.set(collection_name, encoder)
+
+        logger.info(f"🗑️ Deleted {deleted_count} chunks of {len(file_paths)} files from {collection_name}")
+        return deleted_count
+
+    def _ensure_collection(self, collection_name: str, model_key: str) -> None:
+        """
+        컬렉션이 없으면 생성 (내부 메서드)
+
+        Args:
+            collection_name: 컬렉션 이름
+            model_key: 임베딩 모델 키 (차원 결정용)
+
+        Raises:
+            EmbeddingError: 컬렉션 생성 실패 시
+        """
+        from .collection_manager import CollectionManager
+
+        collection_manager = CollectionManager()
+
+        if collection_manager.exists(collection_name):
+            return
+
+        logger.info(f"Collection '{collection_name}' not found. Creating...")
+        model_config = EMBEDDING_MODELS.get(model_key)
+        if not model_config:
+            raise ModelLoadError(f"Model config not found for key: {model_key}")
+
+        result = collection_manager.create_collection(
+            collection_name=collection_name,
+            dim=model_config["dim"],
+            description=f"Auto-created for embedding task"
+        )
+
+        if not result["success"]:
+            raise EmbeddingError(f"Failed to create collection: {result['error']}")
+
+        logger.info(f"✅ Collection '{collection_name}' created successfully")
+
+    def _generate_dense_vectors(
+        self, texts: List[str], model_key: str, flush_cache: bool = True
+    ) -> Tuple[np.ndarray, DenseEmbeddingStats]:
+        """
+        밀집 벡터 생성 (캐시 미스만 토큰 예산 배치로 처리, 내부 메서드)
+
+        (model_key, sha256(code)) 캐시에 있는 텍스트와 같은 실행 안에서 중복된 텍스트는
+        모델을 거치지 않습니다. 모든 텍스트가 캐시 히트면 모델도 로드하지 않습니다.
+
+        Args:
+            texts: 텍스트 리스트
+            model_key: 임베딩 모델 키
+            flush_cache: 종료 시 캐시 인덱스를 디스크에 기록할지 여부
 
-        except json.JSONDecodeError as e:
-            raise DataValidationError(f"Invalid JSON format: {e}") from e
+        Returns:
+            ((텍스트 수, dim) float32 배열, 밀집 임베딩 통계)
+        """
+        cache = self._get_embedding_cache(model_key)
+        keys = [EmbeddingCache.content_hash(text) for text in texts]
+        dense_vectors = np.empty((len(texts), EMBEDDING_MODELS[model_key]["dim"]), dtype=np.float32)
+        cached = cache.get_into(keys, dense_vectors) if cache is not None else [False] * len(texts)
+
+        # 캐시 미스 텍스트를 키 단위로 묶어 한 번만 인코딩
+        pending: Dict[str, List[int]] = {}
+        for idx, hit in enumerate(cached):
+            if not hit:
+                pending.setdefault(keys[idx], []).append(idx)
+
+        miss_keys = list(pending.keys())
+        stats = DenseEmbeddingStats(
+            lookups=len(texts),
+            hits=0,
+            bytes_saved=0,
+            tokens=0,
+            encode_seconds=0.0,
+            token_budget=0,
+            peak_rss_bytes=current_rss(),
+        )
+        for idx, hit in enumerate(cached):
+            if hit or pending[keys[idx]][0] != idx:
+                stats["hits"] += 1
+                stats["bytes_saved"] += len(texts[idx].encode("utf-8"))
+
+        logger.info(
+            f"Generating dense vectors ({len(miss_keys)} of {len(texts)} documents, "
+            f"{stats['hits']} cached)..."
+        )
+
+        if miss_keys:
+            dense_embedder = DenseEmbedder(model_key, max_batch_size=self.embedding_batch_size)
+            miss_texts = [texts[pending[key][0]] for key in miss_keys]
+
+            def on_batch(batch: List[int], batch_vectors: np.ndarray) -> None:
+                batch_keys = [miss_keys[idx] for idx in batch]
+                for key, vector in zip(batch_keys, batch_vectors):
+                    dense_vectors[pending[key]] = vector
+                if cache is not None:
+                    cache.put_many(batch_keys, batch_vectors)
+
+            try:
+                dense_embedder.embed_documents(miss_texts, on_batch=on_batch)
+            finally:
+                # 중간에 실패해도 이미 계산한 벡터는 다음 실행에서 재사용
+                if cache is not None and flush_cache:
+                    cache.flush()
+
+            stats["tokens"] = dense_embedder.tokens_processed
+            stats["encode_seconds"] = dense_embedder.encode_seconds
+            stats["token_budget"] = dense_embedder.token_budget
+            stats["peak_rss_bytes"] = max(stats["peak_rss_bytes"], dense_embedder.peak_rss)
+
+        logger.info(
+            f"✅ Dense vectors generated (cache hit rate: {self._hit_rate(stats):.1%}, "
+            f"{stats['bytes_saved']} bytes skipped, {self._tokens_per_second(stats):.0f} tokens/s)"
+        )
+        return dense_vectors, stats
+
+    @staticmethod
+    def _get_embedding_cache(model_key: str) -> Optional[EmbeddingCache]:
+        """
+        모델 키의 임베딩 캐시 반환 (내부 메서드)
+
+        Args:
+            model_key: 임베딩 모델 키
+
+        Returns:
+            EmbeddingCache 인스턴스 (캐시 비활성 시 None)
+
+        Raises:
+            ModelLoadError: 모델 설정이 없을 때
+        """
+        model_config = EMBEDDING_MODELS.get(model_key)
+        if not model_config:
+            raise ModelLoadError(f"Model config not found for key: {model_key}")
+
+        if not EMBEDDING_CACHE_ENABLED:
+            return None
+        return EmbeddingCache.for_model(model_key, model_config["dim"])
+
+    def _run_pipeline(
+        self,
+        collection_name: str,
+        model_key: str,
+        documents: Iterable[Tuple[str, Dict[str, Any]]],
+        encoder: BM25SparseEncoder,
+    ) -> Tuple[int, int, DenseEmbeddingStats]:
+        """
+        청크 읽기 → 임베딩 → Milvus 삽입 스트리밍 파이프라인 (내부 메서드)
+
+        읽기와 삽입은 별도 스레드, 임베딩(모델 추론)은 호출 스레드에서 수행합니다.
+        단계 사이의 큐 크기가 PIPELINE_QUEUE_SIZE로 제한되므로 메모리에는 최대
+        (2 x 큐 크기 + 3)개의 삽입 배치만 올라가며, 삽입은 다음 배치의 추론과 겹쳐 진행됩니다.
+
+        Args:
+            collection_name: 컬렉션 이름
+            model_key: 임베딩 모델 키
+            documents: (텍스트, 메타데이터) 이터러블
+            encoder: 코퍼스 통계가 반영된 BM25 인코더
+
+        Returns:
+            (삽입된 문서 수, 처리한 문서 수, 밀집 임베딩 통계)
+
+        Raises:
+            EmbeddingError: 삽입 실패 시
+            DataValidationError: 데이터 읽기 실패 시
+        """
+        read_queue: "queue.Queue[Optional[Tuple[List[str], List[Dict[str, Any]]]]]" = queue.Queue(
+            maxsize=PIPELINE_QUEUE_SIZE
+        )
+        insert_queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        stop_event = threading.Event()
+        errors: List[BaseException] = []
+        inserted_count = 0
+
+        def put(target: "queue.Queue[Any]", item: Any) -> bool:
+            # 다른 단계가 실패하면 대기 중인 put을 포기
+            while not stop_event.is_set():
+                try:
+                    target.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def get(source: "queue.Queue[Any]") -> Any:
+            while not stop_event.is_set():
+                try:
+                    return source.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+            return None
+
+        def read_stage() -> None:
+            try:
+                texts: List[str] = []
+                metadata_list: List[Dict[str, Any]] = []
+                for text, metadata in documents:
+                    texts.append(text)
+                    metadata_list.append(metadata)
+                    if len(texts) >= self.batch_size:
+                        if not put(read_queue, (texts, metadata_list)):
+                            return
+                        texts, metadata_list = [], []
+                if texts:
+                    put(read_queue, (texts, metadata_list))
+            except BaseException as e:
+                errors.append(e)
+                stop_event.set()
+            finally:
+                put(read_queue, None)
+
+        def insert_stage() -> None:
+            nonlocal inserted_count
+            try:
+                while True:
+                    batch = get(insert_queue)
+                    if batch is None:
+                        return
+                    inserted_count += self._batch_insert(collection_name=collection_name, **batch)
+            except BaseException as e:
+                errors.append(e)
+                stop_event.set()
+
+        cache = self._get_embedding_cache(model_key)
+        stats = DenseEmbeddingStats(
+            lookups=0,
+            hits=0,
+            bytes_saved=0,
+            tokens=0,
+            encode_seconds=0.0,
+            token_budget=0,
+            peak_rss_bytes=current_rss(),
+        )
+        total_documents = 0
+
+        reader = threading.Thread(target=read_stage, name="embedding-reader", daemon=True)
+        inserter = threading.Thread(target=insert_stage, name="embedding-inserter", daemon=True)
+        reader.start()
+        inserter.start()
+
+        try:
+            batch_idx = 0
+            while True:
+                batch = get(read_queue)
+                if batch is None:
+                    break
+
+                texts, metadata_list = batch
+                batch_idx += 1
+                total_documents += len(texts)
+                logger.info(f"▶️ Pipeline batch {batch_idx}: {len(texts)} documents (total read: {total_documents})")
+
+                sparse_vectors = encoder.encode_batch(tokenize(text) for text in texts)
+                dense_vectors, batch_stats = self._generate_dense_vectors(
+                    texts, model_key, flush_cache=False
+                )
+                for key in ("lookups", "hits", "bytes_saved", "tokens", "encode_seconds"):
+                    stats[key] += batch_stats[key]
+                stats["token_budget"] = batch_stats["token_budget"] or stats["token_budget"]
+                stats["peak_rss_bytes"] = max(stats["peak_rss_bytes"], batch_stats["peak_rss_bytes"])
+
+                if not put(insert_queue, {
+                    "texts": texts,
+                    "metadata_list": metadata_list,
+                    "dense_vectors": dense_vectors,
+                    "sparse_vectors": sparse_vectors,
+                }):
+                    break
+        except BaseException:
+            stop_event.set()
+            raise
+        finally:
+            put(insert_queue, None)
+            reader.join()
+            inserter.join()
+            if cache is not None:
+                cache.flush()
+
+        if errors:
+            raise errors[0]
+
+        # 삽입 데이터 영속화 (로컬 저장소는 이 시점에 새 세대를 기록)
+        try:
+            self.store.flush(collection_name)
         except Exception as e:
-            raise DataValidationError(f"Failed to load data: {e}") from e
+            logger.error(f"❌ Failed to flush inserted data: {e}")
+            raise EmbeddingError(f"Failed to flush inserted data: {e}") from e
+
+        return inserted_count, total_documents, stats
+
+    @staticmethod
+    def _tokens_per_second(stats: DenseEmbeddingStats) -> float:
+        """
+        모델 인코딩 처리량 계산 (내부 메서드)
+
+        Args:
+            stats: 밀집 임베딩 통계
+
+        Returns:
+            토큰/초 (인코딩이 없었으면 0)
+        """
+        return stats["tokens"] / stats["encode_seconds"] if stats["encode_seconds"] else 0.0
+
+    @staticmethod
+    def _hit_rate(stats: DenseEmbeddingStats) -> float:
+        """
+        캐시 히트율 계산 (내부 메서드)
+
+        Args:
+            stats: 밀집 임베딩 통계
+
+        Returns:
+            히트율 (조회가 없으면 0)
+        """
+        return stats["hits"] / stats["lookups"] if stats["lookups"] else 0.0
+
+    @staticmethod
+    def _iter_documents(items: Iterable[Dict[str, Any]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        청크 딕셔너리를 (텍스트, 메타데이터)로 분리하며 순회 (빈 코드 제외, 내부 메서드)
+
+        Args:
+            items: 청크 딕셔너리 이터러블
+
+        Yields:
+            (텍스트, 메타데이터) 튜플
+        """
+        for item in items:
+            code = item.get("code")
+            if code and code.strip():
+                yield code, {k: v for k, v in item.items() if k != "code"}
 
     def _batch_insert(
         self,
         collection_name: str,
         texts: List[str],
         metadata_list: List[Dict[str, Any]],
-        dense_vectors: List[List[float]],
-        sparse_vectors: List[Dict[int, float]],
+        dense_vectors: np.ndarray,
+        sparse_vectors: SparseBatch,
     ) -> int:
         """
         배치 단위로 데이터 삽입
 
+        밀집 벡터는 float32 배열의 행(뷰)을 그대로 넘기고, 희소 벡터는 삽입 직전에만
+        CSR 배치에서 딕셔너리로 꺼냅니다.
+
         Args:
             collection_name: 컬렉션 이름
             texts: 텍스트 리스트
             metadata_list: 메타데이터 리스트
-            dense_vectors: 밀집 벡터 리스트
-            sparse_vectors: 희소 벡터 리스트
+            dense_vectors: (텍스트 수, dim) float32 배열
+            sparse_vectors: CSR 희소 벡터 배치
 
         Returns:
             삽입된 문서 수
@@ -376,11 +1063,10 @@ class EmbeddingService:
                 row = metadata_list[j].copy()
                 row["text"] = texts[j]
                 row["dense"] = dense_vectors[j]
-                row["sparse"] = sparse_vectors[j]
+                row["sparse"] = sparse_vectors.row(j)
 
                 # _source_file 필드 추가 (file_path에서 파일명만 추출)
                 if "file_path" in row:
-                    import os
                     row["_source_file"] = os.path.basename(row["file_path"])
                 else:
                     row["_source_file"] = "unknown"
@@ -389,8 +1075,7 @@ class EmbeddingService:
 
             # 배치 삽입
             try:
-                res = self.client.insert(collection_name=collection_name, data=data_to_insert)
-                total_inserted += res["insert_count"]
+                total_inserted += self.store.insert(collection_name, data_to_insert)
                 logger.info(f"  ✅ Batch inserted successfully (Total: {total_inserted})")
 
             except Exception as e:
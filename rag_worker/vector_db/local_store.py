@@ -0,0 +1,995 @@
+"""
+프로세스 내 벡터 저장소 구현 (NumPy 정확 검색 + 희소 역색인, 메모리 매핑)
+"""
+
+import ast
+import json
+import logging
+import mmap
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .config import LOCAL_VECTOR_STORE_DIR, LOCAL_VECTOR_STORE_SPILL_ROWS, RRF_K
+from .exceptions import CollectionNotFoundError
+from .types import VectorHit
+
+logger = logging.getLogger(__name__)
+
+# 저장 포맷 버전 (포맷이 바뀌면 올려서 이전 데이터를 무시)
+STORE_FORMAT = 1
+
+# 세대(generation) 디렉토리에 저장되는 배열
+ARRAY_NAMES = (
+    "pks",  # int64 기본 키
+    "dense",  # float32 (행 수, dim), L2 정규화
+    "sparse_indptr",  # int64 행별 CSR 오프셋
+    "sparse_indices",  # uint32 용어 ID
+    "sparse_values",  # float32 가중치
+    "inv_terms",  # uint32 정렬된 용어 ID
+    "inv_indptr",  # int64 용어별 포스팅 오프셋
+    "inv_rows",  # int32 포스팅 행 번호
+    "inv_values",  # float32 포스팅 가중치
+    "field_offsets",  # int64 fields.jsonl 행별 바이트 오프셋
+)
+
+# 필터 표현식 절 (필드 연산자 값), "and"로 연결
+FILTER_CLAUSE = re.compile(r"^\s*(\w+)\s*(==|!=|>=|<=|>|<|not\s+in|in)\s*(.+?)\s*$", re.IGNORECASE)
+
+# 필터 표현식의 따옴표 리터럴 또는 절 구분자 (리터럴 안의 " and "는 구분자로 보지 않음)
+FILTER_TOKEN = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|(\s+and\s+)', re.IGNORECASE)
+
+# 삽입 대기 행을 임시 파일로 내릴 때의 배열 (이름, dtype)
+SPILL_ARRAYS = (
+    ("dense", np.float32),  # (행 수, dim), L2 정규화
+    ("sparse_lengths", np.int64),  # 행별 희소 용어 수
+    ("sparse_indices", np.uint32),  # 용어 ID
+    ("sparse_values", np.float32),  # 가중치
+)
+
+
+class _Segment:
+    """
+    컬렉션의 한 세대 데이터 (읽기 전용, 메모리 매핑)
+
+    배열은 np.load(mmap_mode="r")로 매핑하고, 스칼라 필드는 fields.jsonl을 매핑해
+    필요한 행만 JSON으로 읽으므로 여러 워커 프로세스가 페이지 캐시를 공유합니다.
+    """
+
+    def __init__(self, path: Optional[Path], dim: int, generation: int) -> None:
+        """
+        _Segment 초기화
+
+        Args:
+            path: 세대 디렉토리 (None이면 빈 세그먼트)
+            dim: 밀집 벡터 차원
+            generation: 세대 번호
+        """
+        self.dim: int = dim
+        self.generation: int = generation
+        self.arrays: Dict[str, np.ndarray] = {}
+        self._fields_buffer: Optional[mmap.mmap] = None
+        self._columns: Optional[List[Dict[str, Any]]] = None
+        self._pk_rows: Optional[Dict[int, int]] = None
+
+        if path is None:
+            self.arrays = LocalVectorStore._empty_arrays(dim)
+            return
+
+        for name in ARRAY_NAMES:
+            self.arrays[name] = _load_array(path / f"{name}.npy")
+        if len(self.arrays["pks"]) > 0:
+            with open(path / "fields.jsonl", "rb") as f:
+                self._fields_buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return len(self.arrays["pks"])
+
+    def fields(self, row: int) -> Dict[str, Any]:
+        """
+        행의 스칼라 필드 읽기 (text 포함)
+
+        Args:
+            row: 행 번호
+
+        Returns:
+            필드 딕셔너리
+        """
+        offsets = self.arrays["field_offsets"]
+        return json.loads(self._fields_buffer[offsets[row] : offsets[row + 1]])
+
+    def fields_bytes(self) -> bytes:
+        """fields.jsonl 전체 바이트 (새 세대 기록용)"""
+        return self._fields_buffer[:] if self._fields_buffer is not None else b""
+
+    def columns(self) -> List[Dict[str, Any]]:
+        """
+        전체 행의 스칼라 필드 (필터 평가용, 최초 호출 시 1회 파싱)
+
+        Returns:
+            행 순서대로의 필드 딕셔너리 리스트
+        """
+        if self._columns is None:
+            self._columns = [self.fields(row) for row in range(len(self))]
+        return self._columns
+
+    def row_of(self, pk: int) -> Optional[int]:
+        """
+        pk의 행 번호 조회
+
+        Args:
+            pk: 기본 키
+
+        Returns:
+            행 번호 (없으면 None)
+        """
+        if self._pk_rows is None:
+            self._pk_rows = {int(pk): row for row, pk in enumerate(self.arrays["pks"])}
+        return self._pk_rows.get(pk)
+
+
+class _PendingRows:
+    """
+    flush 전 삽입 행 버퍼 (컬렉션별, 프로세스 내)
+
+    행은 SPILL_ROWS개까지 메모리에 모았다가 배열 / JSON 줄로 변환해 컬렉션 디렉토리의
+    이름 없는 임시 파일에 덧붙이므로, 레포지토리 전체를 삽입해도 메모리에는 최대 SPILL_ROWS개 행만
+    남습니다. 임시 파일은 프로세스가 종료되면 운영체제가 회수하고, pk는 삽입 순서대로
+    first_pk부터 부여합니다 (컬렉션당 쓰기 프로세스 1개 가정).
+    """
+
+    def __init__(self, directory: Path, dim: int, first_pk: int, spill_rows: int) -> None:
+        """
+        _PendingRows 초기화
+
+        Args:
+            directory: 임시 파일을 만들 디렉토리 (컬렉션 디렉토리)
+            dim: 밀집 벡터 차원
+            first_pk: 첫 행에 부여할 pk
+            spill_rows: 메모리에 둘 최대 행 수
+        """
+        self.directory: Path = directory
+        self.dim: int = dim
+        self.first_pk: int = first_pk
+        self.spill_rows: int = max(spill_rows, 1)
+        self.spilled: int = 0
+        self._rows: List[Dict[str, Any]] = []
+        self._files: Dict[str, IO[bytes]] = {}
+
+    def __len__(self) -> int:
+        return self.spilled + len(self._rows)
+
+    def extend(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        행 추가 (메모리 버퍼가 spill_rows개를 넘으면 임시 파일로 내림)
+
+        Args:
+            rows: 삽입할 행 리스트
+        """
+        self._rows.extend(rows)
+        if len(self._rows) >= self.spill_rows:
+            self._spill()
+
+    def read(self) -> Dict[str, Any]:
+        """
+        버퍼 전체를 배열로 읽기 (flush용)
+
+        Returns:
+            SPILL_ARRAYS 배열과 fields(JSON 줄 바이트) 딕셔너리
+        """
+        self._spill()
+        batch: Dict[str, Any] = {}
+        for name, dtype in SPILL_ARRAYS:
+            f = self._files.get(name)
+            if f is None:
+                batch[name] = np.zeros(0, dtype=dtype)
+            else:
+                f.seek(0)
+                batch[name] = np.fromfile(f, dtype=dtype)
+        batch["dense"] = batch["dense"].reshape(self.spilled, self.dim)
+        fields_file = self._files.get("fields")
+        if fields_file is None:
+            batch["fields"] = b""
+        else:
+            fields_file.seek(0)
+            batch["fields"] = fields_file.read()
+        return batch
+
+    def close(self) -> None:
+        """임시 파일 닫기 (삭제)"""
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+        self._rows = []
+
+    def _spill(self) -> None:
+        """메모리 버퍼의 행을 배열 / JSON 줄로 변환해 임시 파일에 덧붙이기 (내부 메서드)"""
+        rows, self._rows = self._rows, []
+        if not rows:
+            return
+
+        first_pk = self.first_pk + self.spilled
+        arrays = {
+            "dense": LocalVectorStore._normalize(
+                np.asarray([row["dense"] for row in rows], dtype=np.float32).reshape(len(rows), self.dim)
+            ),
+            "sparse_lengths": np.fromiter((len(row["sparse"]) for row in rows), dtype=np.int64, count=len(rows)),
+            "sparse_indices": np.fromiter(
+                (term for row in rows for term in row["sparse"].keys()), dtype=np.uint32
+            ),
+            "sparse_values": np.fromiter(
+                (weight for row in rows for weight in row["sparse"].values()), dtype=np.float32
+            ),
+        }
+        lines = b"".join(
+            json.dumps(
+                {"pk": first_pk + i, **{k: v for k, v in row.items() if k not in ("dense", "sparse")}},
+                ensure_ascii=False,
+            ).encode("utf-8") + b"\n"
+            for i, row in enumerate(rows)
+        )
+
+        for name, dtype in SPILL_ARRAYS:
+            arrays[name].astype(dtype, copy=False).tofile(self._file(name))
+        self._file("fields").write(lines)
+        self.spilled += len(rows)
+
+    def _file(self, name: str) -> IO[bytes]:
+        """배열별 임시 파일 (최초 사용 시 생성, 내부 메서드)"""
+        f = self._files.get(name)
+        if f is None:
+            f = tempfile.TemporaryFile(prefix=f"pending-{name}-", dir=self.directory)
+            self._files[name] = f
+        else:
+            f.seek(0, os.SEEK_END)
+        return f
+
+
+def _load_array(path: Path) -> np.ndarray:
+    """
+    .npy 배열 메모리 매핑 (빈 배열은 매핑할 수 없으므로 일반 로드)
+
+    Args:
+        path: .npy 파일 경로
+
+    Returns:
+        배열
+    """
+    try:
+        return np.load(path, mmap_mode="r")
+    except ValueError:
+        return np.load(path)
+
+
+class LocalVectorStore:
+    """
+    프로세스 내 벡터 저장소 클래스 (소규모 컬렉션 / 외부 서비스 없는 개발·벤치마크용)
+
+    디렉토리 구조:
+        {base_path}/{collection_name}/meta.json     - 차원, 설명, 현재 세대, 다음 pk
+        {base_path}/{collection_name}/g{N}/*.npy    - ARRAY_NAMES 배열
+        {base_path}/{collection_name}/g{N}/fields.jsonl - 행별 스칼라 필드 (pk, text, 메타데이터)
+
+    밀집 검색은 정규화된 벡터 행렬과의 내적(COSINE)으로 전체 행을 정확히 계산하고,
+    희소 검색은 용어별 포스팅 리스트(역색인)로 쿼리 용어가 있는 행만 IP 점수를 누적합니다.
+    하이브리드 검색은 두 결과를 각각 limit개 뽑아 Milvus RRFRanker와 같은
+    1 / (RRF_K + 순위) 합으로 융합합니다.
+
+    insert()는 LOCAL_VECTOR_STORE_SPILL_ROWS개 행까지 프로세스 메모리에, 나머지는 임시 파일에
+    모았다가 flush()에서 새 세대 디렉토리를 한 번에 쓰고 meta.json을 원자적으로 교체합니다. 검색 프로세스는 meta.json 변경을 감지해 새 세대를 매핑하며,
+    이전 세대를 매핑 중인 프로세스는 영향을 받지 않습니다. 쓰기는 컬렉션당 한 프로세스만
+    수행한다고 가정합니다 (레포지토리 단위 파이프라인 / 동기화 태스크).
+    """
+
+    def __init__(self, base_path: str = LOCAL_VECTOR_STORE_DIR) -> None:
+        """
+        LocalVectorStore 초기화
+
+        Args:
+            base_path: 데이터 저장 기본 경로
+        """
+        # 프로젝트 루트 찾기
+        if Path(base_path).is_absolute():
+            self.base_path: Path = Path(base_path)
+        else:
+            current = Path.cwd()
+            while current != current.parent:
+                if (current / "pyproject.toml").exists():
+                    self.base_path = current / base_path
+                    break
+                current = current.parent
+            else:
+                self.base_path = Path(base_path).resolve()
+
+        self._segments: Dict[str, Tuple[int, _Segment]] = {}
+        self._pending: Dict[str, _PendingRows] = {}
+        self._lock: threading.RLock = threading.RLock()
+
+    def has_collection(self, collection_name: str) -> bool:
+        """
+        컬렉션 존재 여부 확인
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            존재 여부
+        """
+        return self._meta_path(collection_name).exists()
+
+    def create_collection(self, collection_name: str, dim: int, description: str) -> None:
+        """
+        빈 컬렉션 생성
+
+        Args:
+            collection_name: 컬렉션 이름
+            dim: 밀집 벡터 차원
+            description: 컬렉션 설명
+        """
+        logger.info(f"Creating local collection: {collection_name}")
+        (self.base_path / collection_name).mkdir(parents=True, exist_ok=True)
+        self._write_meta(
+            collection_name,
+            {
+                "format": STORE_FORMAT,
+                "byteorder": sys.byteorder,
+                "dim": dim,
+                "description": description,
+                "generation": 0,
+                "next_pk": 1,
+                "num_rows": 0,
+                "created_at": time.time(),
+            },
+        )
+
+    def drop_collection(self, collection_name: str) -> None:
+        """
+        컬렉션 삭제
+
+        Args:
+            collection_name: 컬렉션 이름
+        """
+        with self._lock:
+            self._segments.pop(collection_name, None)
+            pending = self._pending.pop(collection_name, None)
+            if pending is not None:
+                pending.close()
+        shutil.rmtree(self.base_path / collection_name, ignore_errors=True)
+
+    def list_collections(self) -> List[str]:
+        """
+        컬렉션 이름 목록 조회
+
+        Returns:
+            컬렉션 이름 리스트
+        """
+        if not self.base_path.exists():
+            return []
+        return sorted(path.parent.name for path in self.base_path.glob("*/meta.json"))
+
+    def describe_collection(self, collection_name: str) -> str:
+        """
+        컬렉션 설명 조회
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            컬렉션 설명
+        """
+        return self._read_meta(collection_name).get("description", "")
+
+    def row_count(self, collection_name: str) -> int:
+        """
+        영속화된 행 수 조회
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            행 수
+        """
+        return int(self._read_meta(collection_name).get("num_rows", 0))
+
+    def count(self, collection_name: str) -> int:
+        """
+        엔티티 수 조회 (이 프로세스에서 아직 flush하지 않은 행 포함)
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            엔티티 수
+        """
+        with self._lock:
+            pending = self._pending.get(collection_name)
+            pending_rows = len(pending) if pending is not None else 0
+        return self.row_count(collection_name) + pending_rows
+
+    def ensure_loaded(self, collection_name: str) -> None:
+        """
+        현재 세대 매핑 보장 (다른 프로세스가 새 세대를 쓴 경우에만 다시 매핑)
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Raises:
+            CollectionNotFoundError: 컬렉션이 없을 때
+        """
+        self._segment(collection_name)
+
+    def insert(self, collection_name: str, rows: List[Dict[str, Any]]) -> int:
+        """
+        행 삽입 (flush 전까지 프로세스 메모리 / 임시 파일에 보관)
+
+        Args:
+            collection_name: 컬렉션 이름
+            rows: 삽입할 행 리스트 (text, dense, sparse, 메타데이터)
+
+        Returns:
+            삽입된 행 수
+
+        Raises:
+            CollectionNotFoundError: 컬렉션이 없을 때
+        """
+        with self._lock:
+            pending = self._pending.get(collection_name)
+            if pending is None:
+                meta = self._read_meta(collection_name)
+                pending = _PendingRows(
+                    self.base_path / collection_name, meta["dim"], meta["next_pk"], LOCAL_VECTOR_STORE_SPILL_ROWS
+                )
+                self._pending[collection_name] = pending
+            pending.extend(rows)
+        return len(rows)
+
+    def flush(self, collection_name: str) -> None:
+        """
+        보관 중인 삽입 행을 기존 행과 합쳐 새 세대로 기록
+
+        Args:
+            collection_name: 컬렉션 이름
+        """
+        with self._lock:
+            pending = self._pending.pop(collection_name, None)
+            if pending is None:
+                return
+            try:
+                if len(pending) == 0:
+                    return
+                batch = pending.read()
+            finally:
+                pending.close()
+
+            meta = self._read_meta(collection_name)
+            segment = self._segment(collection_name)
+
+            # 새 행 배열 조립 (pk는 버퍼 생성 시점의 next_pk부터)
+            count = len(batch["dense"])
+            pks = np.arange(pending.first_pk, pending.first_pk + count, dtype=np.int64)
+            indptr = np.zeros(count + 1, dtype=np.int64)
+            np.cumsum(batch["sparse_lengths"], out=indptr[1:])
+
+            old = segment.arrays
+            self._write_generation(
+                collection_name,
+                meta,
+                pks=np.concatenate([old["pks"], pks]),
+                dense=np.concatenate([old["dense"], batch["dense"]]),
+                sparse_indptr=np.concatenate([old["sparse_indptr"], indptr[1:] + old["sparse_indptr"][-1]]),
+                sparse_indices=np.concatenate([old["sparse_indices"], batch["sparse_indices"]]),
+                sparse_values=np.concatenate([old["sparse_values"], batch["sparse_values"]]),
+                fields=segment.fields_bytes() + batch["fields"],
+                next_pk=pending.first_pk + count,
+            )
+
+    def query_by_files(
+        self, collection_name: str, file_paths: List[str], output_fields: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        file_path 목록에 해당하는 행 조회
+
+        Args:
+            collection_name: 컬렉션 이름
+            file_paths: file_path 값 리스트
+            output_fields: 가져올 필드
+
+        Returns:
+            행 딕셔너리 리스트 (pk 포함)
+        """
+        self.flush(collection_name)
+        segment = self._segment(collection_name)
+        targets = set(file_paths)
+        return [
+            self._project(fields, output_fields, with_pk=True)
+            for fields in segment.columns()
+            if fields.get("file_path") in targets
+        ]
+
+    def delete_by_files(self, collection_name: str, file_paths: List[str]) -> int:
+        """
+        file_path 목록에 해당하는 행을 제외한 새 세대 기록
+
+        Args:
+            collection_name: 컬렉션 이름
+            file_paths: file_path 값 리스트
+
+        Returns:
+            삭제된 행 수
+        """
+        self.flush(collection_name)
+
+        with self._lock:
+            meta = self._read_meta(collection_name)
+            segment = self._segment(collection_name)
+            targets = set(file_paths)
+            keep = np.array(
+                [fields.get("file_path") not in targets for fields in segment.columns()], dtype=bool
+            )
+            deleted = int(len(keep) - keep.sum())
+            if deleted == 0:
+                return 0
+
+            old = segment.arrays
+            kept_rows = np.flatnonzero(keep)
+            lengths = np.diff(old["sparse_indptr"])[kept_rows]
+            indptr = np.zeros(len(kept_rows) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=indptr[1:])
+            entries = np.concatenate(
+                [np.arange(old["sparse_indptr"][row], old["sparse_indptr"][row + 1]) for row in kept_rows]
+                or [np.zeros(0, dtype=np.int64)]
+            )
+            offsets = old["field_offsets"]
+            fields = segment.fields_bytes()
+
+            self._write_generation(
+                collection_name,
+                meta,
+                pks=old["pks"][kept_rows],
+                dense=old["dense"][kept_rows],
+                sparse_indptr=indptr,
+                sparse_indices=old["sparse_indices"][entries],
+                sparse_values=old["sparse_values"][entries],
+                fields=b"".join(fields[offsets[row] : offsets[row + 1]] for row in kept_rows),
+                next_pk=meta["next_pk"],
+            )
+            return deleted
+
+    def iter_texts(self, collection_name: str, batch_size: int) -> Iterator[List[str]]:
+        """
+        전체 행의 text 순회
+
+        Args:
+            collection_name: 컬렉션 이름
+            batch_size: 배치 크기
+
+        Yields:
+            text 리스트
+        """
+        segment = self._segment(collection_name)
+        for start in range(0, len(segment), batch_size):
+            yield [
+                segment.fields(row).get("text", "")
+                for row in range(start, min(start + batch_size, len(segment)))
+            ]
+
+    def search(
+        self,
+        collection_name: str,
+        dense_vectors: List[List[float]],
+        sparse_vectors: Optional[List[Dict[int, float]]],
+        limit: int,
+        output_fields: List[str],
+        filter_expr: Optional[str] = None,
+    ) -> List[List[VectorHit]]:
+        """
+        정확 밀집 검색 또는 하이브리드 검색 (RRF)
+
+        Args:
+            collection_name: 컬렉션 이름
+            dense_vectors: 밀집 쿼리 벡터 리스트
+            sparse_vectors: 희소 쿼리 벡터 리스트 (None이면 밀집 검색만 수행)
+            limit: 쿼리별 결과 개수
+            output_fields: 가져올 필드
+            filter_expr: 필터 표현식 (선택, ==, !=, 비교, in, not in 절을 and로 연결한 형태만 지원)
+
+        Returns:
+            쿼리별 히트 리스트
+
+        Raises:
+            ValueError: 지원하지 않는 필터 표현식일 때
+        """
+        segment = self._segment(collection_name)
+        if len(segment) == 0 or not dense_vectors:
+            return [[] for _ in dense_vectors]
+
+        allowed = self._filter_mask(segment, filter_expr) if filter_expr else None
+
+        # 모든 쿼리의 COSINE 유사도를 행렬곱 1회로 계산
+        queries = self._normalize(np.asarray(dense_vectors, dtype=np.float32))
+        dense_scores = queries @ segment.arrays["dense"].T
+        if allowed is not None:
+            dense_scores[:, ~allowed] = -np.inf
+
+        results: List[List[VectorHit]] = []
+        for i in range(len(queries)):
+            dense_ranked = self._top(dense_scores[i], limit)
+
+            if sparse_vectors is None:
+                ranked = [(row, float(dense_scores[i, row])) for row in dense_ranked]
+            else:
+                sparse_scores = self._sparse_scores(segment, sparse_vectors[i], allowed)
+                sparse_ranked = self._top(sparse_scores, limit)
+                ranked = self._rrf([dense_ranked, sparse_ranked], limit)
+
+            results.append([
+                VectorHit(
+                    id=int(segment.arrays["pks"][row]),
+                    score=score,
+                    fields=self._project(segment.fields(row), output_fields),
+                )
+                for row, score in ranked
+            ])
+
+        return results
+
+    def get(
+        self, collection_name: str, ids: List[int], output_fields: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        pk로 행 조회
+
+        Args:
+            collection_name: 컬렉션 이름
+            ids: pk 리스트
+            output_fields: 가져올 필드
+
+        Returns:
+            행 딕셔너리 리스트 (pk 포함, 없는 pk는 제외)
+        """
+        segment = self._segment(collection_name)
+        rows = [segment.row_of(int(pk)) for pk in ids]
+        return [
+            self._project(segment.fields(row), output_fields, with_pk=True)
+            for row in rows
+            if row is not None
+        ]
+
+    def _segment(self, collection_name: str) -> _Segment:
+        """
+        현재 세대 세그먼트 반환 (meta.json 세대가 바뀌었으면 다시 매핑, 내부 메서드)
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            세그먼트
+
+        Raises:
+            CollectionNotFoundError: 컬렉션이 없을 때
+        """
+        meta = self._read_meta(collection_name)
+        generation = meta["generation"]
+
+        with self._lock:
+            cached = self._segments.get(collection_name)
+            if cached is not None and cached[0] == generation:
+                return cached[1]
+
+            path = self.base_path / collection_name / f"g{generation}" if generation > 0 else None
+            start_time = time.time()
+            segment = _Segment(path, meta["dim"], generation)
+            self._segments[collection_name] = (generation, segment)
+
+        logger.info(
+            f"📂 Local collection mapped: {collection_name} g{generation} "
+            f"({len(segment)} rows, {time.time() - start_time:.3f}s)"
+        )
+        return segment
+
+    def _meta_path(self, collection_name: str) -> Path:
+        """컬렉션 meta.json 경로 (내부 메서드)"""
+        return self.base_path / collection_name / "meta.json"
+
+    def _read_meta(self, collection_name: str) -> Dict[str, Any]:
+        """
+        메타 정보 읽기 (내부 메서드)
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            메타 딕셔너리
+
+        Raises:
+            CollectionNotFoundError: 컬렉션이 없거나 포맷이 다를 때
+        """
+        try:
+            with open(self._meta_path(collection_name), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise CollectionNotFoundError(f"Collection '{collection_name}' not found") from e
+
+        if meta.get("format") != STORE_FORMAT or meta.get("byteorder") != sys.byteorder:
+            raise CollectionNotFoundError(f"Incompatible local collection format: {collection_name}")
+        return meta
+
+    def _write_meta(self, collection_name: str, meta: Dict[str, Any]) -> None:
+        """meta.json 원자적 교체 (내부 메서드)"""
+        meta_path = self._meta_path(collection_name)
+        tmp_path = meta_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, meta_path)
+
+    def _write_generation(
+        self,
+        collection_name: str,
+        meta: Dict[str, Any],
+        pks: np.ndarray,
+        dense: np.ndarray,
+        sparse_indptr: np.ndarray,
+        sparse_indices: np.ndarray,
+        sparse_values: np.ndarray,
+        fields: bytes,
+        next_pk: int,
+    ) -> None:
+        """
+        새 세대 디렉토리 기록 후 meta.json 교체 (역색인 재구성 포함, 내부 메서드)
+
+        Args:
+            collection_name: 컬렉션 이름
+            meta: 현재 메타 정보
+            pks: 기본 키 배열
+            dense: 정규화된 밀집 벡터 행렬
+            sparse_indptr: 희소 벡터 CSR 오프셋
+            sparse_indices: 희소 벡터 용어 ID
+            sparse_values: 희소 벡터 가중치
+            fields: fields.jsonl 바이트 (pks와 같은 순서)
+            next_pk: 다음에 부여할 pk
+        """
+        generation = meta["generation"] + 1
+        collection_path = self.base_path / collection_name
+        path = collection_path / f"g{generation}"
+        shutil.rmtree(path, ignore_errors=True)
+        path.mkdir(parents=True)
+
+        # 용어 ID 순으로 정렬해 용어별 포스팅 리스트 구성
+        rows = np.repeat(np.arange(len(pks), dtype=np.int32), np.diff(sparse_indptr))
+        order = np.argsort(sparse_indices, kind="stable")
+        inv_terms, counts = np.unique(sparse_indices[order], return_counts=True)
+        inv_indptr = np.zeros(len(inv_terms) + 1, dtype=np.int64)
+        np.cumsum(counts, out=inv_indptr[1:])
+
+        # fields.jsonl 행 오프셋 (줄 끝 기준)
+        ends = np.flatnonzero(np.frombuffer(fields, dtype=np.uint8) == ord("\n")) + 1
+        field_offsets = np.concatenate([np.zeros(1, dtype=np.int64), ends.astype(np.int64)])
+
+        arrays = {
+            "pks": pks.astype(np.int64),
+            "dense": np.ascontiguousarray(dense, dtype=np.float32).reshape(len(pks), meta["dim"]),
+            "sparse_indptr": sparse_indptr.astype(np.int64),
+            "sparse_indices": sparse_indices.astype(np.uint32),
+            "sparse_values": sparse_values.astype(np.float32),
+            "inv_terms": inv_terms.astype(np.uint32),
+            "inv_indptr": inv_indptr,
+            "inv_rows": rows[order],
+            "inv_values": sparse_values[order].astype(np.float32),
+            "field_offsets": field_offsets,
+        }
+        for name, array in arrays.items():
+            np.save(path / f"{name}.npy", array)
+        with open(path / "fields.jsonl", "wb") as f:
+            f.write(fields)
+
+        self._write_meta(
+            collection_name,
+            {**meta, "generation": generation, "next_pk": next_pk, "num_rows": len(pks), "updated_at": time.time()},
+        )
+        self._remove_stale_generations(collection_path, path.name)
+
+        logger.info(f"💾 Local collection saved: {collection_name} g{generation} ({len(pks)} rows)")
+
+    @staticmethod
+    def _remove_stale_generations(collection_path: Path, current: str) -> None:
+        """
+        현재 세대 외의 세대 디렉토리 정리 (내부 메서드)
+
+        Linux는 매핑 중인 파일도 삭제할 수 있고, Windows에서 삭제에 실패한 파일은
+        다음 기록 때 다시 정리합니다.
+        """
+        for path in collection_path.glob("g*"):
+            if path.is_dir() and path.name != current:
+                shutil.rmtree(path, ignore_errors=True)
+
+    @staticmethod
+    def _empty_arrays(dim: int) -> Dict[str, np.ndarray]:
+        """빈 세그먼트 배열 (내부 메서드)"""
+        return {
+            "pks": np.zeros(0, dtype=np.int64),
+            "dense": np.zeros((0, dim), dtype=np.float32),
+            "sparse_indptr": np.zeros(1, dtype=np.int64),
+            "sparse_indices": np.zeros(0, dtype=np.uint32),
+            "sparse_values": np.zeros(0, dtype=np.float32),
+            "inv_terms": np.zeros(0, dtype=np.uint32),
+            "inv_indptr": np.zeros(1, dtype=np.int64),
+            "inv_rows": np.zeros(0, dtype=np.int32),
+            "inv_values": np.zeros(0, dtype=np.float32),
+            "field_offsets": np.zeros(1, dtype=np.int64),
+        }
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        """행 단위 L2 정규화 (영벡터는 그대로, 내부 메서드)"""
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms > 0, norms, 1.0)
+
+    @staticmethod
+    def _top(scores: np.ndarray, limit: int) -> List[int]:
+        """
+        점수 상위 행 번호 (내림차순, 점수가 -inf인 행 제외, 내부 메서드)
+
+        Args:
+            scores: 행별 점수
+            limit: 최대 개수
+
+        Returns:
+            행 번호 리스트
+        """
+        if limit <= 0 or len(scores) == 0:
+            return []
+        if limit < len(scores):
+            candidates = np.argpartition(-scores, limit - 1)[:limit]
+        else:
+            candidates = np.arange(len(scores))
+        candidates = candidates[np.isfinite(scores[candidates])]
+        return candidates[np.argsort(-scores[candidates], kind="stable")].tolist()
+
+    @staticmethod
+    def _sparse_scores(
+        segment: _Segment, query: Dict[int, float], allowed: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """
+        역색인으로 희소 IP 점수 계산 (쿼리 용어가 없는 행은 -inf, 내부 메서드)
+
+        Args:
+            segment: 세그먼트
+            query: 희소 쿼리 벡터
+            allowed: 필터를 통과한 행 마스크 (None이면 전체)
+
+        Returns:
+            행별 점수
+        """
+        arrays = segment.arrays
+        scores = np.zeros(len(segment), dtype=np.float32)
+        matched = np.zeros(len(segment), dtype=bool)
+
+        terms = np.fromiter(query.keys(), dtype=np.uint32, count=len(query))
+        positions = np.searchsorted(arrays["inv_terms"], terms)
+        for term, weight, position in zip(terms, query.values(), positions):
+            if position >= len(arrays["inv_terms"]) or arrays["inv_terms"][position] != term:
+                continue
+            start, end = arrays["inv_indptr"][position], arrays["inv_indptr"][position + 1]
+            rows = arrays["inv_rows"][start:end]
+            scores[rows] += weight * arrays["inv_values"][start:end]
+            matched[rows] = True
+
+        if allowed is not None:
+            matched &= allowed
+        scores[~matched] = -np.inf
+        return scores
+
+    @staticmethod
+    def _rrf(rankings: List[List[int]], limit: int) -> List[Tuple[int, float]]:
+        """
+        Reciprocal Rank Fusion (Milvus RRFRanker와 같은 1 / (k + 순위), 순위는 1부터)
+
+        Args:
+            rankings: 검색 요청별 행 번호 순위 리스트
+            limit: 최종 결과 개수
+
+        Returns:
+            (행 번호, RRF 점수) 리스트 (점수 내림차순)
+        """
+        fused: Dict[int, float] = {}
+        for ranking in rankings:
+            for rank, row in enumerate(ranking, start=1):
+                fused[row] = fused.get(row, 0.0) + 1.0 / (RRF_K + rank)
+        return sorted(fused.items(), key=lambda item: -item[1])[:limit]
+
+    @staticmethod
+    def _project(fields: Dict[str, Any], output_fields: List[str], with_pk: bool = False) -> Dict[str, Any]:
+        """요청한 필드만 남기기 (내부 메서드)"""
+        projected = {key: fields[key] for key in output_fields if key in fields}
+        if with_pk:
+            projected["pk"] = fields["pk"]
+        return projected
+
+    @classmethod
+    def _filter_mask(cls, segment: _Segment, filter_expr: str) -> np.ndarray:
+        """
+        필터 표현식을 만족하는 행 마스크 (내부 메서드)
+
+        Args:
+            segment: 세그먼트
+            filter_expr: `field == "value"`, `field in [...]`, `start_line >= 10` 등의 절을
+                and로 연결한 Milvus 표현식
+
+        Returns:
+            행별 통과 여부
+
+        Raises:
+            ValueError: 지원하지 않는 표현식일 때
+        """
+        predicates = [cls._parse_clause(clause) for clause in cls._split_clauses(filter_expr.strip())]
+        return np.array(
+            [all(predicate(fields) for predicate in predicates) for fields in segment.columns()], dtype=bool
+        )
+
+    @staticmethod
+    def _split_clauses(filter_expr: str) -> List[str]:
+        """
+        필터 표현식을 and 절로 분리 (따옴표 리터럴 안의 and는 건너뜀, 내부 메서드)
+
+        Args:
+            filter_expr: 필터 표현식
+
+        Returns:
+            절 리스트
+        """
+        clauses: List[str] = []
+        start = 0
+        for match in FILTER_TOKEN.finditer(filter_expr):
+            if match.group(1) is not None:
+                clauses.append(filter_expr[start : match.start()])
+                start = match.end()
+        clauses.append(filter_expr[start:])
+        return clauses
+
+    @staticmethod
+    def _parse_clause(clause: str) -> Callable[[Dict[str, Any]], bool]:
+        """
+        필터 절 하나를 판별 함수로 변환 (내부 메서드)
+
+        Args:
+            clause: 필터 절
+
+        Returns:
+            필드 딕셔너리 -> 통과 여부 함수
+
+        Raises:
+            ValueError: 지원하지 않는 절일 때
+        """
+        match = FILTER_CLAUSE.match(clause)
+        if match is None:
+            raise ValueError(f"Unsupported filter expression for local vector store: {clause}")
+
+        field, operator, literal = match.group(1), " ".join(match.group(2).lower().split()), match.group(3)
+        try:
+            value = json.loads(literal)
+        except json.JSONDecodeError:
+            try:
+                value = ast.literal_eval(literal)
+            except (ValueError, SyntaxError) as e:
+                raise ValueError(f"Unsupported filter value for local vector store: {literal}") from e
+
+        operators: Dict[str, Callable[[Any], bool]] = {
+            "==": lambda x: x == value,
+            "!=": lambda x: x != value,
+            ">": lambda x: x is not None and x > value,
+            ">=": lambda x: x is not None and x >= value,
+            "<": lambda x: x is not None and x < value,
+            "<=": lambda x: x is not None and x <= value,
+            "in": lambda x: x in value,
+            "not in": lambda x: x not in value,
+        }
+        compare = operators[operator]
+        return lambda fields: compare(fields.get(field))
@@ -0,0 +1,395 @@
+"""
+Milvus 벡터 저장소 구현
+"""
+
+import json
+import logging
+from typing import Any, Dict, Iterator, List, Optional
+
+from pymilvus import AnnSearchRequest, CollectionSchema, DataType, FieldSchema, RRFRanker
+
+from .collection_manager import LoadedCollectionTracker, MilvusConnectionManager
+from .config import RRF_K
+from .types import VectorHit
+
+logger = logging.getLogger(__name__)
+
+
+class MilvusVectorStore:
+    """
+    Milvus 벡터 저장소 클래스
+
+    밀집 벡터는 HNSW(COSINE), 희소 벡터는 SPARSE_WAND(IP) 인덱스를 사용하며,
+    하이브리드 검색은 hybrid_search + RRFRanker로 서버에서 융합합니다.
+    """
+
+    def __init__(self) -> None:
+        """MilvusVectorStore 초기화"""
+        self.client = MilvusConnectionManager.get_client()
+
+    def has_collection(self, collection_name: str) -> bool:
+        """
+        컬렉션 존재 여부 확인
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            존재 여부
+        """
+        return self.client.has_collection(collection_name)
+
+    def create_collection(self, collection_name: str, dim: int, description: str) -> None:
+        """
+        하이브리드 검색용 컬렉션 및 인덱스 생성
+
+        Args:
+            collection_name: 컬렉션 이름
+            dim: 밀집 벡터 차원
+            description: 컬렉션 설명
+        """
+        analyzer_params: dict = {"type": "english"}
+
+        # 스키마 정의
+        fields: List[FieldSchema] = [
+            FieldSchema(name="pk", dtype=DataType.INT64, is_primary=True, auto_id=True),
+            FieldSchema(name="text", dtype=DataType.VARCHAR, max_length=65_535),
+            FieldSchema(name="dense", dtype=DataType.FLOAT_VECTOR, dim=dim),
+            FieldSchema(name="sparse", dtype=DataType.SPARSE_FLOAT_VECTOR),
+            FieldSchema(name="file_path", dtype=DataType.VARCHAR, max_length=1024),
+            FieldSchema(name="name", dtype=DataType.VARCHAR, max_length=1024),
+            FieldSchema(name="start_line", dtype=DataType.INT64),
+            FieldSchema(name="end_line", dtype=DataType.INT64),
+            FieldSchema(
+                name="type",
+                dtype=DataType.VARCHAR,
+                max_length=256,
+                enable_analyzer=True,
+                analyzer_params=analyzer_params,
+                enable_match=True,
+            ),
+            FieldSchema(
+                name="_source_file",
+                dtype=DataType.VARCHAR,
+                max_length=1024,
+                enable_analyzer=True,
+                enable_match=True,
+                analyzer_params=analyzer_params,
+            ),
+        ]
+
+        schema: CollectionSchema = CollectionSchema(
+            fields=fields,
+            description=description,
+            enable_dynamic_field=True,
+        )
+
+        # 컬렉션 생성
+        logger.info(f"Creating collection: {collection_name}")
+        self.client.create_collection(
+            collection_name=collection_name,
+            schema=schema,
+            consistency_level="Strong",
+        )
+
+        # 인덱스 생성
+        self._create_indexes(collection_name)
+
+    def _create_indexes(self, collection_name: str) -> None:
+        """
+        컬렉션에 인덱스 생성 (내부 메서드)
+
+        Args:
+            collection_name: 컬렉션 이름
+        """
+        logger.info(f"Creating indexes for collection: {collection_name}")
+
+        # 인덱스 파라미터 준비
+        index_params = self.client.prepare_index_params()
+
+        # Dense 벡터 인덱스
+        index_params.add_index(
+            field_name="dense",
+            index_type="HNSW",
+            metric_type="COSINE",
+            params={"M": 16, "efConstruction": 256},
+        )
+
+        # Sparse 벡터 인덱스
+        index_params.add_index(
+            field_name="sparse",
+            index_type="SPARSE_WAND",
+            metric_type="IP",
+            params={"drop_ratio_build": 0.2},
+        )
+
+        # 스칼라 필드 인덱스
+        index_params.add_index(field_name="file_path")
+        index_params.add_index(field_name="type")
+        index_params.add_index(field_name="name")
+        index_params.add_index(field_name="start_line")
+        index_params.add_index(field_name="end_line")
+        index_params.add_index(field_name="_source_file")
+
+        # 인덱스 생성
+        self.client.create_index(collection_name=collection_name, index_params=index_params)
+
+        logger.info(f"✅ Indexes created for collection: {collection_name}")
+
+    def drop_collection(self, collection_name: str) -> None:
+        """
+        컬렉션 삭제
+
+        Args:
+            collection_name: 컬렉션 이름
+        """
+        self.client.drop_collection(collection_name)
+        LoadedCollectionTracker.invalidate(collection_name)
+
+    def list_collections(self) -> List[str]:
+        """
+        컬렉션 이름 목록 조회
+
+        Returns:
+            컬렉션 이름 리스트
+        """
+        return self.client.list_collections()
+
+    def describe_collection(self, collection_name: str) -> str:
+        """
+        컬렉션 설명 조회 (로드 불필요)
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            컬렉션 설명
+        """
+        return self.client.describe_collection(collection_name).get("description", "")
+
+    def row_count(self, collection_name: str) -> int:
+        """
+        세그먼트 통계의 행 수 조회 (로드 불필요, 컴팩션 전에는 삭제된 행 포함)
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            행 수
+        """
+        return int(self.client.get_collection_stats(collection_name).get("row_count", 0))
+
+    def count(self, collection_name: str) -> int:
+        """
+        count(*) 쿼리로 정확한 엔티티 수 조회 (로드 필요)
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            엔티티 수
+        """
+        result = self.client.query(
+            collection_name=collection_name, filter="pk >= 0", output_fields=["count(*)"]
+        )
+        return result[0]["count(*)"] if result else 0
+
+    def ensure_loaded(self, collection_name: str) -> None:
+        """
+        컬렉션 로드 보장 (이 프로세스에서 이미 로드를 확인했으면 Milvus 호출 없음)
+
+        Args:
+            collection_name: 컬렉션 이름
+        """
+        LoadedCollectionTracker.ensure_loaded(collection_name)
+
+    def insert(self, collection_name: str, rows: List[Dict[str, Any]]) -> int:
+        """
+        행 삽입
+
+        Args:
+            collection_name: 컬렉션 이름
+            rows: 삽입할 행 리스트
+
+        Returns:
+            삽입된 행 수
+        """
+        res = self.client.insert(collection_name=collection_name, data=rows)
+        return res["insert_count"]
+
+    def flush(self, collection_name: str) -> None:
+        """
+        삽입 데이터 영속화 (Strong 일관성 컬렉션은 삽입 즉시 검색되므로 별도 작업 없음)
+
+        Args:
+            collection_name: 컬렉션 이름
+        """
+        return None
+
+    def query_by_files(
+        self, collection_name: str, file_paths: List[str], output_fields: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        file_path 목록에 해당하는 행 조회
+
+        Args:
+            collection_name: 컬렉션 이름
+            file_paths: file_path 값 리스트
+            output_fields: 가져올 필드
+
+        Returns:
+            행 딕셔너리 리스트
+        """
+        return self.client.query(
+            collection_name=collection_name,
+            filter=self._file_filter(file_paths),
+            output_fields=output_fields,
+        )
+
+    def delete_by_files(self, collection_name: str, file_paths: List[str]) -> int:
+        """
+        file_path 목록에 해당하는 행 삭제
+
+        Args:
+            collection_name: 컬렉션 이름
+            file_paths: file_path 값 리스트
+
+        Returns:
+            삭제된 행 수
+        """
+        res = self.client.delete(collection_name=collection_name, filter=self._file_filter(file_paths))
+        return res.get("delete_count", 0) if isinstance(res, dict) else len(res)
+
+    def iter_texts(self, collection_name: str, batch_size: int) -> Iterator[List[str]]:
+        """
+        쿼리 이터레이터로 전체 행의 text 순회 (단일 쿼리 limit 제한 없음)
+
+        Args:
+            collection_name: 컬렉션 이름
+            batch_size: 페이지 크기
+
+        Yields:
+            text 리스트
+        """
+        from pymilvus import Collection
+
+        MilvusConnectionManager.ensure_connection()
+        iterator = Collection(collection_name).query_iterator(
+            batch_size=batch_size,
+            expr="pk >= 0",
+            output_fields=["text"],
+        )
+
+        try:
+            while True:
+                batch = iterator.next()
+                if not batch:
+                    break
+                yield [item["text"] for item in batch if "text" in item]
+        finally:
+            iterator.close()
+
+    def search(
+        self,
+        collection_name: str,
+        dense_vectors: List[List[float]],
+        sparse_vectors: Optional[List[Dict[int, float]]],
+        limit: int,
+        output_fields: List[str],
+        filter_expr: Optional[str] = None,
+    ) -> List[List[VectorHit]]:
+        """
+        밀집 검색 또는 하이브리드 검색 (쿼리 여러 개는 nq>1 요청 1회)
+
+        Args:
+            collection_name: 컬렉션 이름
+            dense_vectors: 밀집 쿼리 벡터 리스트
+            sparse_vectors: 희소 쿼리 벡터 리스트 (None이면 밀집 검색만 수행)
+            limit: 쿼리별 결과 개수
+            output_fields: 가져올 필드
+            filter_expr: 필터 표현식 (선택)
+
+        Returns:
+            쿼리별 히트 리스트
+        """
+        if sparse_vectors is None:
+            search_params: Dict[str, Any] = {
+                "collection_name": collection_name,
+                "data": dense_vectors,
+                "anns_field": "dense",
+                "limit": limit,
+                "output_fields": output_fields,
+                "search_params": {"metric_type": "COSINE", "params": {"ef": 128}},
+            }
+
+            # 필터 추가 (있을 경우)
+            if filter_expr:
+                search_params["filter"] = filter_expr
+
+            res = self.client.search(**search_params) or []
+        else:
+            # 밀집 벡터 검색 요청 (hybrid_search는 filter 인자가 없으므로 요청별 expr로 필터 적용)
+            dense_req = AnnSearchRequest(
+                data=dense_vectors,
+                anns_field="dense",
+                limit=limit,
+                param={"metric_type": "COSINE", "params": {"ef": 128}},
+                expr=filter_expr or None,
+            )
+
+            # 희소 벡터 검색 요청
+            sparse_req = AnnSearchRequest(
+                data=sparse_vectors,
+                anns_field="sparse",
+                limit=limit,
+                param={"metric_type": "IP"},
+                expr=filter_expr or None,
+            )
+
+            res = self.client.hybrid_search(
+                collection_name=collection_name,
+                reqs=[dense_req, sparse_req],
+                ranker=RRFRanker(RRF_K),
+                limit=limit,
+                output_fields=output_fields,
+            ) or []
+
+        # 쿼리 순서 유지
+        return [[self._to_hit(hit) for hit in hits] if hits else [] for hits in res]
+
+    def get(
+        self, collection_name: str, ids: List[int], output_fields: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        pk로 행 조회
+
+        Args:
+            collection_name: 컬렉션 이름
+            ids: pk 리스트
+            output_fields: 가져올 필드
+
+        Returns:
+            행 딕셔너리 리스트 (pk 포함)
+        """
+        return self.client.get(collection_name=collection_name, ids=ids, output_fields=output_fields)
+
+    @staticmethod
+    def _file_filter(file_paths: List[str]) -> str:
+        """file_path 목록 필터 표현식 생성 (내부 메서드)"""
+        return f"file_path in {json.dumps(file_paths, ensure_ascii=False)}"
+
+    @staticmethod
+    def _to_hit(hit: Any) -> VectorHit:
+        """
+        pymilvus 검색 히트를 공통 히트로 변환 (내부 메서드)
+
+        pymilvus 버전에 따라 히트가 딕셔너리 또는 딕셔너리처럼 접근 가능한 Hit 객체이므로
+        키로 접근합니다.
+
+        Args:
+            hit: pymilvus 검색 히트
+
+        Returns:
+            VectorHit
+        """
+        return VectorHit(id=hit["id"], score=hit["distance"], fields=dict(hit.get("entity") or {}))
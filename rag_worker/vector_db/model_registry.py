@@ -0,0 +1,186 @@
+"""
+프로세스 단위 임베딩 모델 레지스트리
+"""
+
+import gc
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+import torch
+from langchain_huggingface import HuggingFaceEmbeddings
+
+from .config import EMBEDDING_MODELS, MODEL_IDLE_TTL_SECONDS
+from .exceptions import ModelLoadError
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingModelRegistry:
+    """
+    밀집 임베딩 모델 레지스트리 (프로세스당 모델 키별 1회 로드)
+
+    인제스천(DenseEmbedder)과 검색(SearchService)이 같은 모델 인스턴스를 공유하며,
+    TTL 이상 사용되지 않은 모델은 다음 조회 시점에 해제됩니다.
+    """
+
+    _models: Dict[str, HuggingFaceEmbeddings] = {}
+    _last_used: Dict[str, float] = {}
+    _lock: threading.RLock = threading.RLock()
+
+    @classmethod
+    def get(cls, model_key: str) -> HuggingFaceEmbeddings:
+        """
+        모델 반환 (없으면 로드)
+
+        Args:
+            model_key: 모델 키 (config.EMBEDDING_MODELS에 정의된 키)
+
+        Returns:
+            HuggingFaceEmbeddings 인스턴스
+
+        Raises:
+            ModelLoadError: 모델 설정이 없거나 로드 실패 시
+        """
+        with cls._lock:
+            # 다른 모델이 오래 놀고 있으면 먼저 해제하여 상주 메모리 중복 방지
+            cls.evict_idle(exclude=model_key)
+
+            embedder = cls._models.get(model_key)
+            if embedder is None:
+                embedder = cls._load(model_key)
+                cls._models[model_key] = embedder
+
+            cls._last_used[model_key] = time.time()
+            return embedder
+
+    @classmethod
+    def is_loaded(cls, model_key: str) -> bool:
+        """
+        모델 로드 여부 확인
+
+        Args:
+            model_key: 모델 키
+
+        Returns:
+            로드 여부
+        """
+        return model_key in cls._models
+
+    @classmethod
+    def loaded_models(cls) -> List[str]:
+        """
+        현재 로드된 모델 키 목록 반환
+
+        Returns:
+            모델 키 리스트
+        """
+        return list(cls._models.keys())
+
+    @classmethod
+    def evict(cls, model_key: str) -> bool:
+        """
+        모델 해제
+
+        Args:
+            model_key: 모델 키
+
+        Returns:
+            해제 여부 (로드되어 있지 않았으면 False)
+        """
+        with cls._lock:
+            embedder = cls._models.pop(model_key, None)
+            cls._last_used.pop(model_key, None)
+
+        if embedder is None:
+            return False
+
+        del embedder
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+        logger.info(f"♻️ Dense embedding model evicted: {model_key}")
+        return True
+
+    @classmethod
+    def evict_idle(
+        cls, max_idle_seconds: Optional[float] = None, exclude: Optional[str] = None
+    ) -> List[str]:
+        """
+        유휴 시간이 TTL을 넘은 모델 해제
+
+        Args:
+            max_idle_seconds: 유휴 허용 시간 (기본값: MODEL_IDLE_TTL_SECONDS, 0 이하면 비활성)
+            exclude: 해제 대상에서 제외할 모델 키
+
+        Returns:
+            해제된 모델 키 리스트
+        """
+        ttl = MODEL_IDLE_TTL_SECONDS if max_idle_seconds is None else max_idle_seconds
+        if ttl <= 0:
+            return []
+
+        now = time.time()
+        with cls._lock:
+            idle_keys = [
+                key
+                for key, last_used in cls._last_used.items()
+                if key != exclude and now - last_used > ttl
+            ]
+
+        return [key for key in idle_keys if cls.evict(key)]
+
+    @staticmethod
+    def _load(model_key: str) -> HuggingFaceEmbeddings:
+        """
+        HuggingFace 임베딩 모델 로드 (내부 메서드)
+
+        Args:
+            model_key: 모델 키
+
+        Returns:
+            HuggingFaceEmbeddings 인스턴스
+
+        Raises:
+            ModelLoadError: 모델 설정이 없거나 로드 실패 시
+        """
+        model_config = EMBEDDING_MODELS.get(model_key)
+        if not model_config:
+            raise ModelLoadError(f"Model config not found for key: {model_key}")
+
+        try:
+            device: str = "cuda" if torch.cuda.is_available() else "cpu"
+
+            if device == "cuda":
+                gpu_name = torch.cuda.get_device_name(0)
+                gpu_memory = torch.cuda.get_device_properties(0).total_memory / 1024**3  # GB
+                logger.info(f"🚀 Loading dense embedding model on GPU: {gpu_name} ({gpu_memory:.1f}GB)")
+            else:
+                logger.info(f"⚠️ Loading dense embedding model on CPU (GPU not available)")
+
+            # safetensors 강제 사용을 위한 환경 변수 설정
+            os.environ["SAFETENSORS_FAST_GPU"] = "1"
+
+            start_time = time.time()
+            embedder = HuggingFaceEmbeddings(
+                model_name=model_config["model_name"],
+                model_kwargs={
+                    "device": device,
+                    "trust_remote_code": True
+                },
+                encode_kwargs={"normalize_embeddings": True},
+            )
+            logger.info(
+                f"✅ Dense embedding model loaded: {model_key} on {device.upper()} "
+                f"in {time.time() - start_time:.2f}s"
+            )
+            return embedder
+
+        except Exception as e:
+            import traceback
+            logger.error(f"Failed to load dense embedding model: {e}")
+            logger.error(f"Full traceback: {traceback.format_exc()}")
+            raise ModelLoadError(f"Failed to load model: {e}") from e
@@ -0,0 +1,196 @@
+"""
+동시 검색 쿼리 임베딩 마이크로 배처
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+from .config import QUERY_BATCH_MAX_SIZE, QUERY_BATCH_MAX_WAIT_MS
+from .model_registry import EmbeddingModelRegistry
+from .types import QueryBatchStats
+
+logger = logging.getLogger(__name__)
+
+# 최근 이 시간(초) 안에 동시 요청이 관측되었을 때만 추가 요청을 기다림
+CONCURRENCY_WINDOW_SECONDS = 1.0
+
+
+class QueryEmbeddingBatcher:
+    """
+    쿼리 임베딩 마이크로 배치 클래스
+
+    여러 스레드(Celery threads / gevent 풀)에서 동시에 들어온 쿼리를 디스패처 스레드가
+    최대 max_wait_ms 동안 max_batch_size개까지 모아 모델 forward 1회로 인코딩하고,
+    결과를 각 호출자의 Future로 돌려줍니다.
+    최근 동시 요청이 없었으면 기다리지 않고 바로 인코딩하므로, 태스크를 하나씩 실행하는
+    prefork 자식 프로세스에서는 지연이 추가되지 않습니다.
+    """
+
+    _instances: Dict[str, "QueryEmbeddingBatcher"] = {}
+    _instances_lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def for_model(cls, model_key: str) -> "QueryEmbeddingBatcher":
+        """
+        모델 키별 배처 반환 (프로세스 내 싱글톤)
+
+        fork 이전에 만들어진 인스턴스는 디스패처 스레드가 자식에 없으므로 새로 만듭니다.
+
+        Args:
+            model_key: 임베딩 모델 키
+
+        Returns:
+            QueryEmbeddingBatcher 인스턴스
+        """
+        with cls._instances_lock:
+            batcher = cls._instances.get(model_key)
+            if batcher is None or batcher._pid != os.getpid():
+                batcher = cls(model_key)
+                cls._instances[model_key] = batcher
+            return batcher
+
+    @classmethod
+    def all_stats(cls) -> Dict[str, QueryBatchStats]:
+        """
+        현재 프로세스의 모델 키별 배치 통계 반환
+
+        Returns:
+            모델 키 -> 배치 통계
+        """
+        with cls._instances_lock:
+            return {key: batcher.stats() for key, batcher in cls._instances.items()}
+
+    def __init__(
+        self,
+        model_key: str,
+        max_batch_size: int = QUERY_BATCH_MAX_SIZE,
+        max_wait_ms: float = QUERY_BATCH_MAX_WAIT_MS,
+    ) -> None:
+        """
+        QueryEmbeddingBatcher 초기화
+
+        Args:
+            model_key: 임베딩 모델 키
+            max_batch_size: 배치당 최대 쿼리 수
+            max_wait_ms: 첫 쿼리 이후 추가 쿼리를 기다리는 최대 시간 (밀리초)
+        """
+        self.model_key: str = model_key
+        self.max_batch_size: int = max(1, max_batch_size)
+        self.max_wait_seconds: float = max(0.0, max_wait_ms) / 1000
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock: threading.Lock = threading.Lock()
+        self._pid: int = os.getpid()
+        self._last_concurrent_at: float = 0.0
+        self._batches: int = 0
+        self._queries: int = 0
+        self._max_batch_seen: int = 0
+
+    def embed(self, query: str) -> List[float]:
+        """
+        쿼리 밀집 벡터 생성 (다른 스레드의 쿼리와 함께 배치 인코딩)
+
+        Args:
+            query: 검색 쿼리
+
+        Returns:
+            밀집 벡터
+
+        Raises:
+            Exception: 모델 로드 또는 인코딩 실패 시 (배치의 모든 호출자에게 전달)
+        """
+        future: Future = Future()
+        self._queue.put((query, future))
+        self._ensure_dispatcher()
+        return future.result()
+
+    def stats(self) -> QueryBatchStats:
+        """
+        배치 통계 반환
+
+        Returns:
+            forward 호출 수, 요청 수, 최대 / 평균 배치 크기
+        """
+        return QueryBatchStats(
+            batches=self._batches,
+            queries=self._queries,
+            max_batch_size=self._max_batch_seen,
+            mean_batch_size=self._queries / self._batches if self._batches else 0.0,
+        )
+
+    def _ensure_dispatcher(self) -> None:
+        """디스패처 스레드 시작 (최초 요청 시 1회, 내부 메서드)"""
+        if self._thread is not None:
+            return
+
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._dispatch_loop, name=f"query-batcher-{self.model_key}", daemon=True
+                )
+                self._thread.start()
+
+    def _dispatch_loop(self) -> None:
+        """요청을 배치로 모아 인코딩하는 디스패처 루프 (내부 메서드)"""
+        while True:
+            batch = self._collect_batch()
+            self._run_batch(batch)
+
+    def _collect_batch(self) -> List[Tuple[str, Future]]:
+        """
+        다음 배치 수집 (내부 메서드)
+
+        첫 요청을 받은 뒤 이미 대기 중인 요청은 모두 가져오고, 최근 동시 요청이 있었으면
+        max_wait 동안 추가 요청을 기다립니다.
+
+        Returns:
+            (쿼리, Future) 리스트
+        """
+        batch = [self._queue.get()]
+        concurrent = time.monotonic() - self._last_concurrent_at < CONCURRENCY_WINDOW_SECONDS
+        deadline = time.monotonic() + (self.max_wait_seconds if concurrent else 0.0)
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        if len(batch) > 1:
+            self._last_concurrent_at = time.monotonic()
+        return batch
+
+    def _run_batch(self, batch: List[Tuple[str, Future]]) -> None:
+        """
+        배치 인코딩 후 결과를 각 Future에 전달 (내부 메서드)
+
+        Args:
+            batch: (쿼리, Future) 리스트
+        """
+        # 같은 배치 안에서 반복된 쿼리는 한 번만 인코딩
+        queries = list(dict.fromkeys(query for query, _ in batch))
+
+        try:
+            embedder = EmbeddingModelRegistry.get(self.model_key)
+            vectors = dict(zip(queries, embedder.embed_documents(queries)))
+        except Exception as e:
+            logger.error(f"❌ Query batch encoding failed ({len(batch)} queries): {e}")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        self._batches += 1
+        self._queries += len(batch)
+        self._max_batch_seen = max(self._max_batch_seen, len(batch))
+
+        for query, future in batch:
+            future.set_result(vectors[query])
@@ -0,0 +1,225 @@
+"""
+검색 쿼리 임베딩 캐시 (프로세스 LRU + 선택적 Redis 공유)
+"""
+
+import hashlib
+import logging
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import QUERY_CACHE_MAX_ENTRIES, QUERY_CACHE_REDIS_URL, QUERY_CACHE_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Redis 키 접두사 (포맷이 바뀌면 버전을 올려 이전 값을 무시)
+REDIS_KEY_PREFIX = "ragit:query_embedding:v1:"
+
+
+def normalize_query(query: str) -> str:
+    """
+    캐시 키용 쿼리 정규화 (유니코드 NFKC + 공백 정리)
+
+    공백이나 전각/반각 문자만 다른 같은 질문이 같은 키를 갖게 합니다.
+    대소문자는 코드 식별자 의미를 바꿀 수 있으므로 유지합니다.
+
+    Args:
+        query: 원본 쿼리
+
+    Returns:
+        정규화된 쿼리
+    """
+    return " ".join(unicodedata.normalize("NFKC", query).split())
+
+
+class QueryEmbeddingCache:
+    """
+    쿼리 벡터 캐시 클래스
+
+    밀집 벡터는 (모델 키, 정규화 쿼리), 희소 벡터는 (컬렉션, BM25 아티팩트 버전, 정규화 쿼리)로
+    키를 만듭니다. 프로세스 LRU(QUERY_CACHE_MAX_ENTRIES개, QUERY_CACHE_TTL_SECONDS 만료)를 먼저
+    확인하고, QUERY_CACHE_REDIS_URL이 설정되어 있으면 밀집 벡터를 Redis에 float32 바이트로 공유해
+    다른 워커 프로세스의 인코딩 결과도 재사용합니다. 희소 벡터는 인코딩 비용이 Redis 왕복보다
+    작으므로 프로세스 LRU에만 둡니다.
+    """
+
+    _instance: Optional["QueryEmbeddingCache"] = None
+    _instance_lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "QueryEmbeddingCache":
+        """
+        프로세스 공용 캐시 반환 (싱글톤 패턴)
+
+        Returns:
+            QueryEmbeddingCache 인스턴스
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def __init__(
+        self,
+        max_entries: int = QUERY_CACHE_MAX_ENTRIES,
+        ttl_seconds: int = QUERY_CACHE_TTL_SECONDS,
+        redis_url: str = QUERY_CACHE_REDIS_URL,
+    ) -> None:
+        """
+        QueryEmbeddingCache 초기화
+
+        Args:
+            max_entries: 프로세스 LRU 최대 항목 수 (0 이하면 캐시 비활성)
+            ttl_seconds: 항목 만료 시간 (초)
+            redis_url: 공유 캐시 Redis URL (비어 있으면 프로세스 LRU만 사용)
+        """
+        self.max_entries: int = max_entries
+        self.ttl_seconds: int = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self._redis: Optional[Any] = None
+        self.hits: int = 0
+        self.misses: int = 0
+
+        if redis_url and max_entries > 0:
+            try:
+                import redis
+
+                self._redis = redis.Redis.from_url(redis_url, socket_timeout=0.05)
+                logger.info("✅ Query embedding cache shared through Redis")
+            except Exception as e:
+                logger.warning(f"⚠️ Redis query cache unavailable, using process cache only: {e}")
+
+    @property
+    def hit_rate(self) -> float:
+        """누적 히트율 (조회가 없으면 0)"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_dense(self, model_key: str, query: str) -> Optional[List[float]]:
+        """
+        캐시된 밀집 쿼리 벡터 조회 (프로세스 LRU -> Redis 순)
+
+        Args:
+            model_key: 임베딩 모델 키
+            query: 검색 쿼리
+
+        Returns:
+            밀집 벡터 (없으면 None)
+        """
+        key = self._key("dense", model_key, query)
+        vector = self._get_local(key)
+
+        if vector is None and self._redis is not None:
+            try:
+                payload = self._redis.get(REDIS_KEY_PREFIX + key)
+            except Exception as e:
+                logger.warning(f"Redis query cache lookup failed: {e}")
+                payload = None
+            if payload is not None:
+                vector = np.frombuffer(payload, dtype=np.float32).tolist()
+                self._put_local(key, vector)
+
+        self._count(vector is not None)
+        return vector
+
+    def put_dense(self, model_key: str, query: str, vector: List[float]) -> None:
+        """
+        밀집 쿼리 벡터 저장
+
+        Args:
+            model_key: 임베딩 모델 키
+            query: 검색 쿼리
+            vector: 밀집 벡터
+        """
+        key = self._key("dense", model_key, query)
+        self._put_local(key, vector)
+
+        if self._redis is not None:
+            try:
+                payload = np.asarray(vector, dtype=np.float32).tobytes()
+                self._redis.set(REDIS_KEY_PREFIX + key, payload, ex=self.ttl_seconds)
+            except Exception as e:
+                logger.warning(f"Redis query cache store failed: {e}")
+
+    def get_sparse(
+        self, collection_name: str, version: Optional[int], query: str
+    ) -> Optional[Dict[int, float]]:
+        """
+        캐시된 희소 쿼리 벡터 조회
+
+        Args:
+            collection_name: 컬렉션 이름
+            version: BM25 아티팩트 버전 (바뀌면 이전 항목은 조회되지 않음)
+            query: 검색 쿼리
+
+        Returns:
+            희소 벡터 (없으면 None)
+        """
+        vector = self._get_local(self._key("sparse", f"{collection_name}:{version}", query))
+        self._count(vector is not None)
+        return vector
+
+    def put_sparse(
+        self, collection_name: str, version: Optional[int], query: str, vector: Dict[int, float]
+    ) -> None:
+        """
+        희소 쿼리 벡터 저장
+
+        Args:
+            collection_name: 컬렉션 이름
+            version: BM25 아티팩트 버전
+            query: 검색 쿼리
+            vector: 희소 벡터
+        """
+        self._put_local(self._key("sparse", f"{collection_name}:{version}", query), vector)
+
+    def clear(self) -> None:
+        """프로세스 LRU 비우기 (Redis 항목은 TTL로 만료)"""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _key(kind: str, scope: str, query: str) -> str:
+        """캐시 키 생성 (정규화 쿼리의 SHA-1, 내부 메서드)"""
+        digest = hashlib.sha1(normalize_query(query).encode("utf-8")).hexdigest()
+        return f"{kind}:{scope}:{digest}"
+
+    def _get_local(self, key: str) -> Optional[Any]:
+        """프로세스 LRU 조회 (만료 항목은 제거, 내부 메서드)"""
+        if self.max_entries <= 0:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _put_local(self, key: str, value: Any) -> None:
+        """프로세스 LRU 저장 (용량 초과 시 가장 오래된 항목 제거, 내부 메서드)"""
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _count(self, hit: bool) -> None:
+        """히트 / 미스 집계 (내부 메서드)"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
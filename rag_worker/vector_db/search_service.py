@@ -4,19 +4,32 @@
 
 import logging
 import time
-from typing import List, Dict, Any, Optional
-import torch
-from langchain_huggingface import HuggingFaceEmbeddings
-from pymilvus import AnnSearchRequest, RRFRanker
-
-from .config import EMBEDDING_MODELS
-from .collection_manager import MilvusConnectionManager
-from .embedding_service import BM25ModelCache, DenseEmbedder
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from .config import (
+    BM25_REBUILD_BATCH_SIZE,
+    QUERY_BATCH_ENABLED,
+    SEARCH_CANDIDATE_FACTOR,
+    SEARCH_OUTPUT_FIELDS,
+    SEARCH_TWO_PHASE,
+)
+from .collection_manager import LoadedCollectionTracker
+from .embedding_service import BM25ModelCache
+from .model_registry import EmbeddingModelRegistry
+from .query_batcher import QueryEmbeddingBatcher
+from .query_cache import QueryEmbeddingCache
+from .sparse_encoder import BM25SparseEncoder, tokenize
 from .exceptions import SearchError, ModelLoadError
-from .types import SearchInput, SearchResult, SearchResultItem
+from .types import BatchSearchInput, BatchSearchResult, SearchInput, SearchResult, SearchResultItem, VectorHit
+from .vector_store import get_vector_store
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# 2단계 검색의 1단계에서 가져올 필드 (중복 제거용 위치 정보)
+CANDIDATE_FIELDS = ["file_path", "start_line", "end_line"]
+
 
 class SparseQueryEmbedder:
     """희소 쿼리 벡터 생성 클래스"""
@@ -29,12 +42,12 @@ class SparseQueryEmbedder:
             collection_name: 컬렉션 이름
 
         Raises:
-            ModelLoadError: BM25 모델을 찾을 수 없을 때
+            ModelLoadError: BM25 인코더를 찾을 수 없을 때
         """
         self.collection_name: str = collection_name
-        self.bm25 = BM25ModelCache.get(collection_name)
+        self.encoder: Optional[BM25SparseEncoder] = BM25ModelCache.get(collection_name)
 
-        if self.bm25 is None:
+        if self.encoder is None:
             raise ModelLoadError(
                 f"BM25 model not found for collection '{collection_name}'. "
                 f"Please run embedding first."
@@ -42,18 +55,15 @@ class SparseQueryEmbedder:
 
     def embed_query(self, query: str) -> Dict[int, float]:
         """
-        쿼리를 희소 벡터로 변환
+        쿼리를 희소 벡터로 변환 (컬렉션 크기와 무관하게 쿼리 토큰 수에 비례)
 
         Args:
             query: 검색 쿼리
 
         Returns:
-            희소 벡터 (딕셔너리 형태)
+            희소 벡터 (용어 ID -> IDF 가중치)
         """
-        tokenized_query = query.split(" ")
-        doc_scores = self.bm25.get_scores(tokenized_query)
-        sparse_vec = {i: score for i, score in enumerate(doc_scores) if score > 0}
-        return sparse_vec
+        return self.encoder.encode_query(query)
 
 
 class SearchService:
@@ -61,11 +71,12 @@ class SearchService:
 
     def __init__(self) -> None:
         """SearchService 초기화"""
-        self.client = MilvusConnectionManager.get_client()
+        self.store = get_vector_store()
+        self._validated_sparse_versions: Dict[str, Optional[int]] = {}
 
     def _load_collection(self, collection_name: str) -> None:
         """
-        컬렉션 로드
+        컬렉션 로드 보장 (이 프로세스에서 이미 로드를 확인했으면 저장소 호출 없음)
 
         Args:
             collection_name: 컬렉션 이름
@@ -74,16 +85,7 @@ class SearchService:
             SearchError: 컬렉션 로드 실패 시
         """
         try:
-            from pymilvus import Collection, connections
-
-            # PyMilvus 연결 확인
-            MilvusConnectionManager.ensure_connection()
-
-            # 컬렉션 로드
-            collection = Collection(collection_name)
-            collection.load()
-            logger.info(f"✅ Collection '{collection_name}' loaded successfully")
-
+            self.store.ensure_loaded(collection_name)
         except Exception as e:
             raise SearchError(f"Failed to load collection: {e}") from e
 
@@ -98,49 +100,82 @@ class SearchService:
             검색 결과
         """
         start_time: float = time.time()
+        query_cache = QueryEmbeddingCache.shared()
+        cache_hits: int = 0
+        stage_timings: Dict[str, float] = {}
+        collection_name: str = input_data["collection_name"]
 
         try:
             logger.info(
-                f"▶️ Starting hybrid search in collection: {input_data['collection_name']}"
+                f"▶️ Starting hybrid search in collection: {collection_name}"
             )
 
             # 0. 컬렉션 로드
-            self._load_collection(input_data["collection_name"])
-
-            # 1. 밀집 쿼리 벡터 생성
-            logger.info("Generating dense query vector...")
-            dense_vector = self._generate_dense_vector(
-                input_data["query"], input_data["model_key"]
-            )
+            self._load_collection(collection_name)
+            stage_timings["load"] = time.time() - start_time
+
+            # 1. 밀집 쿼리 벡터 생성 (같은 질문이면 캐시 사용)
+            stage_start = time.time()
+            dense_vector = query_cache.get_dense(input_data["model_key"], input_data["query"])
+            if dense_vector is None:
+                # 모델 로드 (이미 로드되어 있으면 바로 반환)
+                self._load_model(input_data["model_key"])
+                stage_timings["model_load"] = time.time() - stage_start
+
+                logger.info("Generating dense query vector...")
+                stage_start = time.time()
+                dense_vector = self._generate_dense_vector(
+                    input_data["query"], input_data["model_key"]
+                )
+                query_cache.put_dense(input_data["model_key"], input_data["query"], dense_vector)
+            else:
+                cache_hits += 1
+            stage_timings["dense"] = time.time() - stage_start
 
             # 2. 희소 쿼리 벡터 생성 (BM25 모델 자동 생성)
             logger.info("Generating sparse query vector (BM25)...")
-            sparse_vector = self._generate_sparse_vector(
-                input_data["query"], input_data["collection_name"]
+            stage_start = time.time()
+            sparse_vector, sparse_hit = self._generate_sparse_vector(
+                input_data["query"], collection_name
             )
-
-            # 3. 하이브리드 검색 수행
-            logger.info("Executing hybrid search...")
-            results = self._execute_hybrid_search(
-                collection_name=input_data["collection_name"],
-                dense_vector=dense_vector,
-                sparse_vector=sparse_vector,
-                top_k=input_data["top_k"],
-                filter_expr=input_data.get("filter_expr"),
+            cache_hits += int(sparse_hit)
+            stage_timings["sparse"] = time.time() - stage_start
+
+            # 3. 하이브리드 검색 수행 (어휘가 겹치는 토큰이 없으면 밀집 검색만 수행)
+            stage_start = time.time()
+            output_fields, two_phase = self._projection(input_data)
+            hits = self._run_loaded(
+                collection_name,
+                lambda: self._execute_search(input_data, dense_vector, sparse_vector, output_fields, two_phase),
             )
+            stage_timings["search"] = time.time() - stage_start
+
+            # 4. 결과 변환 (2단계 검색이면 본문 조회 포함)
+            stage_start = time.time()
+            results = self._run_loaded(
+                collection_name,
+                lambda: self._select_results(
+                    collection_name, hits, input_data["top_k"], output_fields, two_phase
+                )[0],
+            )
+            stage_timings["format"] = time.time() - stage_start
 
             elapsed_time = time.time() - start_time
             logger.info(
-                f"✅ Search completed: {len(results)} results found in {elapsed_time:.2f}s"
+                f"✅ Search completed: {len(results)} results found in {elapsed_time:.2f}s "
+                f"({self._describe_timings(stage_timings)})"
             )
 
             return SearchResult(
                 success=True,
                 query=input_data["query"],
-                collection_name=input_data["collection_name"],
+                collection_name=collection_name,
                 total_results=len(results),
                 results=results,
                 elapsed_time=elapsed_time,
+                stage_timings=stage_timings,
+                query_cache_hits=cache_hits,
+                query_cache_hit_rate=query_cache.hit_rate,
                 message=f"Found {len(results)} results",
                 error=None,
             )
@@ -156,10 +191,333 @@ class SearchService:
                 total_results=0,
                 results=[],
                 elapsed_time=elapsed_time,
+                stage_timings=stage_timings,
+                query_cache_hits=cache_hits,
+                query_cache_hit_rate=query_cache.hit_rate,
                 message=None,
                 error=str(e),
             )
 
+    def search_batch(self, input_data: BatchSearchInput) -> BatchSearchResult:
+        """
+        다중 쿼리 하이브리드 검색 (같은 컬렉션)
+
+        캐시에 없는 쿼리는 모델 forward 1회로 함께 인코딩하고, 희소 벡터가 있는 쿼리는
+        nq>1 hybrid_search 1회, 희소 벡터가 없는 쿼리는 nq>1 밀집 검색 1회로 처리합니다.
+
+        BatchSearchResult.stage_timings는 배치 전체의 단계별 시간이고, 쿼리별 SearchResult의
+        stage_timings / elapsed_time은 그 쿼리에 귀속되는 시간입니다. 컬렉션 로드는 쿼리 수로 나눈 몫,
+        밀집 인코딩은 캐시 조회 + 캐시 미스면 forward 시간의 몫, 희소 인코딩은 쿼리 자신의 시간,
+        검색은 쿼리가 속한 그룹(hybrid 또는 밀집)의 nq>1 검색 시간입니다.
+
+        Args:
+            input_data: 다중 쿼리 검색 입력
+
+        Returns:
+            쿼리 순서대로의 검색 결과
+        """
+        start_time: float = time.time()
+        queries: List[str] = input_data["queries"]
+        collection_name: str = input_data["collection_name"]
+        query_cache = QueryEmbeddingCache.shared()
+        stage_timings: Dict[str, float] = {}
+
+        def empty_result(query: str, error: Optional[str]) -> SearchResult:
+            # 실패한 배치는 쿼리별 귀속 시간이 없으므로 배치 시간은 BatchSearchResult에만 기록
+            return SearchResult(
+                success=error is None,
+                query=query,
+                collection_name=collection_name,
+                total_results=0,
+                results=[],
+                elapsed_time=0.0,
+                stage_timings={},
+                query_cache_hits=0,
+                query_cache_hit_rate=query_cache.hit_rate,
+                message=None,
+                error=error,
+            )
+
+        try:
+            logger.info(f"▶️ Starting batch search of {len(queries)} queries in collection: {collection_name}")
+            if not queries:
+                return BatchSearchResult(
+                    success=True,
+                    collection_name=collection_name,
+                    total_queries=0,
+                    results=[],
+                    elapsed_time=time.time() - start_time,
+                    stage_timings=stage_timings,
+                    message="No queries to search",
+                    error=None,
+                )
+
+            # 0. 컬렉션 로드
+            self._load_collection(collection_name)
+            stage_timings["load"] = time.time() - start_time
+
+            # 1. 밀집 쿼리 벡터 생성 (캐시 미스만 모델 forward 1회)
+            stage_start = time.time()
+            dense_vectors, dense_hits, dense_times = self._generate_dense_vectors(queries, input_data["model_key"])
+            stage_timings["dense"] = time.time() - stage_start
+
+            # 2. 희소 쿼리 벡터 생성 (쿼리별 시간 기록)
+            stage_start = time.time()
+            sparse: List[Tuple[Dict[int, float], bool]] = []
+            sparse_times: List[float] = []
+            for query in queries:
+                query_start = time.time()
+                sparse.append(self._generate_sparse_vector(query, collection_name))
+                sparse_times.append(time.time() - query_start)
+            stage_timings["sparse"] = time.time() - stage_start
+
+            # 3. 희소 벡터 유무로 나눠 각각 nq>1 검색 1회
+            stage_start = time.time()
+            top_k = input_data["top_k"]
+            output_fields, two_phase = self._projection(input_data)
+            limit, search_fields = self._phase_one(top_k, output_fields, two_phase)
+            hits: List[List[SearchResultItem]] = [[] for _ in queries]
+            search_times: List[float] = [0.0] * len(queries)
+            hybrid_indices = [i for i, (vector, _) in enumerate(sparse) if vector]
+            dense_indices = [i for i, (vector, _) in enumerate(sparse) if not vector]
+
+            if hybrid_indices:
+                group_start = time.time()
+                batch_hits = self._run_loaded(
+                    collection_name,
+                    lambda: self._select_results(
+                        collection_name,
+                        self._execute_hybrid_search(
+                            collection_name=collection_name,
+                            dense_vectors=[dense_vectors[i] for i in hybrid_indices],
+                            sparse_vectors=[sparse[i][0] for i in hybrid_indices],
+                            top_k=limit,
+                            output_fields=search_fields,
+                            filter_expr=input_data.get("filter_expr"),
+                        ),
+                        top_k,
+                        output_fields,
+                        two_phase,
+                    ),
+                )
+                group_time = time.time() - group_start
+                for i, query_hits in zip(hybrid_indices, batch_hits):
+                    hits[i], search_times[i] = query_hits, group_time
+
+            if dense_indices:
+                group_start = time.time()
+                batch_hits = self._run_loaded(
+                    collection_name,
+                    lambda: self._select_results(
+                        collection_name,
+                        self._execute_dense_search(
+                            collection_name=collection_name,
+                            dense_vectors=[dense_vectors[i] for i in dense_indices],
+                            top_k=limit,
+                            output_fields=search_fields,
+                            filter_expr=input_data.get("filter_expr"),
+                        ),
+                        top_k,
+                        output_fields,
+                        two_phase,
+                    ),
+                )
+                group_time = time.time() - group_start
+                for i, query_hits in zip(dense_indices, batch_hits):
+                    hits[i], search_times[i] = query_hits, group_time
+            stage_timings["search"] = time.time() - stage_start
+
+            # 쿼리별 귀속 시간 (배치 단계 시간을 그대로 복사하지 않음)
+            query_timings = [
+                {
+                    "load": stage_timings["load"] / len(queries),
+                    "dense": dense_times[i],
+                    "sparse": sparse_times[i],
+                    "search": search_times[i],
+                }
+                for i in range(len(queries))
+            ]
+
+            results = [
+                SearchResult(
+                    success=True,
+                    query=query,
+                    collection_name=collection_name,
+                    total_results=len(hits[i]),
+                    results=hits[i],
+                    elapsed_time=sum(query_timings[i].values()),
+                    stage_timings=query_timings[i],
+                    query_cache_hits=int(dense_hits[i]) + int(sparse[i][1]),
+                    query_cache_hit_rate=query_cache.hit_rate,
+                    message=f"Found {len(hits[i])} results",
+                    error=None,
+                )
+                for i, query in enumerate(queries)
+            ]
+
+            elapsed_time = time.time() - start_time
+            logger.info(f"✅ Batch search completed: {len(queries)} queries in {elapsed_time:.2f}s")
+
+            return BatchSearchResult(
+                success=True,
+                collection_name=collection_name,
+                total_queries=len(queries),
+                results=results,
+                elapsed_time=elapsed_time,
+                stage_timings=stage_timings,
+                message=f"Searched {len(queries)} queries",
+                error=None,
+            )
+
+        except (ModelLoadError, SearchError, Exception) as e:
+            elapsed_time = time.time() - start_time
+            logger.error(f"❌ Batch search failed: {e}")
+
+            return BatchSearchResult(
+                success=False,
+                collection_name=collection_name,
+                total_queries=len(queries),
+                results=[empty_result(query, str(e)) for query in queries],
+                elapsed_time=elapsed_time,
+                stage_timings=stage_timings,
+                message=None,
+                error=str(e),
+            )
+
+    def _execute_search(
+        self,
+        input_data: SearchInput,
+        dense_vector: List[float],
+        sparse_vector: Dict[int, float],
+        output_fields: List[str],
+        two_phase: bool,
+    ) -> List[List[VectorHit]]:
+        """
+        희소 벡터 유무에 따라 하이브리드 또는 밀집 검색 실행
+
+        Args:
+            input_data: 검색 입력
+            dense_vector: 밀집 쿼리 벡터
+            sparse_vector: 희소 쿼리 벡터 (비어 있으면 밀집 검색만 수행)
+            output_fields: 최종 결과에 필요한 필드
+            two_phase: 2단계 검색 여부
+
+        Returns:
+            검색 히트 리스트 (쿼리 1개)
+
+        Raises:
+            SearchError: 검색 실패 시
+        """
+        limit, search_fields = self._phase_one(input_data["top_k"], output_fields, two_phase)
+
+        if sparse_vector:
+            logger.info("Executing hybrid search...")
+            hits = self._execute_hybrid_search(
+                collection_name=input_data["collection_name"],
+                dense_vectors=[dense_vector],
+                sparse_vectors=[sparse_vector],
+                top_k=limit,
+                output_fields=search_fields,
+                filter_expr=input_data.get("filter_expr"),
+            )
+        else:
+            logger.info("No query terms found in BM25 vocabulary. Executing dense search...")
+            hits = self._execute_dense_search(
+                collection_name=input_data["collection_name"],
+                dense_vectors=[dense_vector],
+                top_k=limit,
+                output_fields=search_fields,
+                filter_expr=input_data.get("filter_expr"),
+            )
+
+        return hits
+
+    @staticmethod
+    def _describe_timings(stage_timings: Dict[str, float]) -> str:
+        """
+        단계별 소요 시간 로그 문자열 (내부 메서드)
+
+        Args:
+            stage_timings: 단계별 소요 시간 (초)
+
+        Returns:
+            "load 1ms, dense 12ms, ..." 형태의 문자열
+        """
+        return ", ".join(f"{stage} {seconds * 1000:.0f}ms" for stage, seconds in stage_timings.items())
+
+    @staticmethod
+    def _projection(input_data: Any) -> Tuple[List[str], bool]:
+        """
+        검색 입력의 필드 projection / 2단계 여부 (없으면 설정 기본값, 내부 메서드)
+
+        Args:
+            input_data: 검색 입력 (SearchInput 또는 BatchSearchInput)
+
+        Returns:
+            (가져올 필드 리스트, 2단계 검색 여부)
+        """
+        output_fields = input_data.get("output_fields") or SEARCH_OUTPUT_FIELDS
+        two_phase = input_data.get("two_phase")
+        return list(output_fields), SEARCH_TWO_PHASE if two_phase is None else two_phase
+
+    @staticmethod
+    def _phase_one(top_k: int, output_fields: List[str], two_phase: bool) -> Tuple[int, List[str]]:
+        """
+        저장소 검색 요청의 limit / output_fields 결정 (내부 메서드)
+
+        2단계 검색이면 중복 제거 여유분만큼 후보를 더 받고, 본문 없이 위치 필드만 요청합니다.
+
+        Args:
+            top_k: 최종 결과 개수
+            output_fields: 최종 결과에 필요한 필드
+            two_phase: 2단계 검색 여부
+
+        Returns:
+            (검색 limit, 검색 요청 output_fields)
+        """
+        if not two_phase:
+            return top_k, output_fields
+        return top_k * max(1, SEARCH_CANDIDATE_FACTOR), list(CANDIDATE_FIELDS)
+
+    def _run_loaded(self, collection_name: str, run: Callable[[], T]) -> T:
+        """
+        검색 실행 (다른 프로세스가 유휴 컬렉션을 해제했으면 다시 로드 후 1회 재시도)
+
+        Args:
+            collection_name: 컬렉션 이름
+            run: 검색 함수
+
+        Returns:
+            검색 함수 반환값
+
+        Raises:
+            SearchError: 검색 실패 시
+        """
+        try:
+            return run()
+        except SearchError as e:
+            if "not loaded" not in str(e).lower():
+                raise
+            logger.warning(f"⚠️ Collection '{collection_name}' was released. Reloading...")
+            LoadedCollectionTracker.invalidate(collection_name)
+            self._load_collection(collection_name)
+            return run()
+
+    def _load_model(self, model_key: str) -> None:
+        """
+        임베딩 모델 로드 보장 (프로세스 단위 레지스트리, 이미 로드되어 있으면 바로 반환)
+
+        Args:
+            model_key: 모델 키
+
+        Raises:
+            ModelLoadError: 모델 로드 실패 시
+        """
+        try:
+            EmbeddingModelRegistry.get(model_key)
+        except Exception as e:
+            raise ModelLoadError(f"Failed to load embedding model: {e}") from e
+
     def _generate_dense_vector(self, query: str, model_key: str) -> List[float]:
         """
         밀집 쿼리 벡터 생성
@@ -175,55 +533,88 @@ class SearchService:
             ModelLoadError: 모델 로드 실패 시
         """
         try:
-            model_config = EMBEDDING_MODELS.get(model_key)
-            if not model_config:
-                raise ModelLoadError(f"Model config not found for key: {model_key}")
-
-            device = "cuda" if torch.cuda.is_available() else "cpu"
-
-            if device == "cuda":
-                gpu_name = torch.cuda.get_device_name(0)
-                logger.info(f"🚀 Using GPU for query embedding: {gpu_name}")
-            else:
-                logger.info(f"⚠️ Using CPU for query embedding (GPU not available)")
-
-            # safetensors 강제 사용을 위한 환경 변수 설정
-            import os
-            os.environ["SAFETENSORS_FAST_GPU"] = "1"
-
-            embedder = HuggingFaceEmbeddings(
-                model_name=model_config["model_name"],
-                model_kwargs={
-                    "device": device,
-                    "trust_remote_code": True
-                },
-                encode_kwargs={"normalize_embeddings": True},
-            )
+            # 동시에 들어온 다른 스레드의 쿼리와 함께 배치 인코딩
+            if QUERY_BATCH_ENABLED:
+                return QueryEmbeddingBatcher.for_model(model_key).embed(query)
 
+            # 프로세스 단위 레지스트리의 공유 모델 사용 (최초 1회만 로드)
+            embedder = EmbeddingModelRegistry.get(model_key)
             return embedder.embed_query(query)
 
         except Exception as e:
             raise ModelLoadError(f"Failed to generate dense vector: {e}") from e
 
+    def _generate_dense_vectors(
+        self, queries: List[str], model_key: str
+    ) -> Tuple[List[List[float]], List[bool], List[float]]:
+        """
+        여러 쿼리의 밀집 벡터 생성 (캐시 미스만 모델 forward 1회로 인코딩)
+
+        Args:
+            queries: 검색 쿼리 리스트
+            model_key: 모델 키
+
+        Returns:
+            (쿼리 순서대로의 밀집 벡터 리스트, 쿼리별 캐시 히트 여부,
+             쿼리별 소요 시간 = 캐시 조회 + 캐시 미스면 forward 시간을 미스 쿼리 수로 나눈 몫)
+
+        Raises:
+            ModelLoadError: 모델 로드 실패 시
+        """
+        query_cache = QueryEmbeddingCache.shared()
+        vectors: List[Optional[List[float]]] = []
+        query_times: List[float] = []
+        for query in queries:
+            lookup_start = time.time()
+            vectors.append(query_cache.get_dense(model_key, query))
+            query_times.append(time.time() - lookup_start)
+        cache_hits = [vector is not None for vector in vectors]
+        # 같은 배치 안에서 반복된 쿼리는 한 번만 인코딩
+        missing: Dict[str, List[int]] = {}
+        for i, vector in enumerate(vectors):
+            if vector is None:
+                missing.setdefault(queries[i], []).append(i)
+
+        if missing:
+            encode_start = time.time()
+            try:
+                # 쿼리 인코딩은 문서 인코딩과 같은 encode 호출 (프롬프트 없음)이므로 배치로 처리
+                embedder = EmbeddingModelRegistry.get(model_key)
+                encoded = embedder.embed_documents(list(missing))
+            except Exception as e:
+                raise ModelLoadError(f"Failed to generate dense vectors: {e}") from e
+
+            for (query, indices), vector in zip(missing.items(), encoded):
+                for i in indices:
+                    vectors[i] = vector
+                query_cache.put_dense(model_key, query, vector)
+
+            # forward 1회 시간을 캐시 미스 쿼리에 균등 배분
+            encode_share = (time.time() - encode_start) / cache_hits.count(False)
+            for i, hit in enumerate(cache_hits):
+                if not hit:
+                    query_times[i] += encode_share
+
+        return vectors, cache_hits, query_times
+
     def _generate_sparse_vector(
         self, query: str, collection_name: str
-    ) -> Dict[int, float]:
+    ) -> Tuple[Dict[int, float], bool]:
         """
-        희소 쿼리 벡터 생성
+        희소 쿼리 벡터 생성 (현재 BM25 아티팩트 버전 기준으로 캐시)
 
         Args:
             query: 검색 쿼리
             collection_name: 컬렉션 이름
 
         Returns:
-            희소 벡터
+            (희소 벡터, 캐시 히트 여부)
 
         Raises:
             ModelLoadError: BM25 모델을 찾을 수 없을 때
         """
         try:
             sparse_embedder = SparseQueryEmbedder(collection_name)
-            return sparse_embedder.embed_query(query)
         except ModelLoadError:
             # BM25 모델이 없으면 자동으로 생성
             logger.warning(f"⚠️ BM25 model not found for '{collection_name}'. Generating...")
@@ -231,11 +622,51 @@ class SearchService:
 
             # 재시도
             sparse_embedder = SparseQueryEmbedder(collection_name)
-            return sparse_embedder.embed_query(query)
+        else:
+            # 아티팩트 버전이 바뀌었을 때만 컬렉션 문서 수와 대조
+            if not self._is_sparse_model_current(collection_name, sparse_embedder.encoder):
+                logger.warning(f"⚠️ BM25 model for '{collection_name}' is out of date. Rebuilding...")
+                self._build_bm25_model(collection_name)
+                sparse_embedder = SparseQueryEmbedder(collection_name)
+
+        version = BM25ModelCache.version(collection_name)
+        self._validated_sparse_versions[collection_name] = version
+
+        query_cache = QueryEmbeddingCache.shared()
+        sparse_vector = query_cache.get_sparse(collection_name, version, query)
+        if sparse_vector is not None:
+            return sparse_vector, True
+
+        sparse_vector = sparse_embedder.embed_query(query)
+        query_cache.put_sparse(collection_name, version, query, sparse_vector)
+        return sparse_vector, False
+
+    def _is_sparse_model_current(self, collection_name: str, encoder: BM25SparseEncoder) -> bool:
+        """
+        BM25 아티팩트가 컬렉션과 일치하는지 확인 (버전당 1회만 조회)
+
+        Args:
+            collection_name: 컬렉션 이름
+            encoder: 캐시된 BM25 인코더
+
+        Returns:
+            일치 여부
+        """
+        version = BM25ModelCache.version(collection_name)
+        if self._validated_sparse_versions.get(collection_name) == version:
+            return True
+
+        try:
+            entity_count = self.store.count(collection_name)
+        except Exception as e:
+            logger.warning(f"Failed to validate BM25 model version: {e}")
+            return True
+
+        return entity_count == encoder.num_docs
 
     def _build_bm25_model(self, collection_name: str) -> None:
         """
-        컬렉션의 데이터로부터 BM25 모델 생성 및 캐싱
+        컬렉션 전체 데이터를 페이지 단위로 순회하며 BM25 인코더 생성 및 저장
 
         Args:
             collection_name: 컬렉션 이름
@@ -243,37 +674,22 @@ class SearchService:
         Raises:
             SearchError: BM25 모델 생성 실패 시
         """
-        from rank_bm25 import BM25Okapi
-
         try:
             logger.info(f"🔨 Building BM25 model for collection: {collection_name}")
 
-            # 컬렉션에서 모든 텍스트 가져오기
-            from pymilvus import Collection
-
-            collection = Collection(collection_name)
+            # 전체 컬렉션 페이지 단위 순회 후 BM25 인코더 통계 수집
+            # (용어 ID는 토큰 해시이므로 인제스천 시점과 동일)
+            encoder = BM25SparseEncoder()
+            for texts in self.store.iter_texts(collection_name, BM25_REBUILD_BATCH_SIZE):
+                encoder.add_documents(tokenize(text) for text in texts)
 
-            # 텍스트 필드 쿼리 (text 필드만 필요)
-            query_result = collection.query(
-                expr="pk >= 0",  # 모든 데이터
-                output_fields=["text"],
-                limit=16384  # Milvus 최대 limit
-            )
-
-            if not query_result:
+            if encoder.num_docs == 0:
                 raise SearchError(f"No documents found in collection '{collection_name}'")
 
-            # 텍스트 추출 및 토큰화
-            texts = [item["text"] for item in query_result if "text" in item]
-            tokenized_corpus = [text.split(" ") for text in texts]
-
-            logger.info(f"📚 Loaded {len(texts)} documents for BM25 model")
+            logger.info(f"📚 Loaded {encoder.num_docs} documents for BM25 model")
 
-            # BM25 모델 생성
-            bm25_model = BM25Okapi(tokenized_corpus)
-
-            # 캐시에 저장
-            BM25ModelCache.set(collection_name, bm25_model)
+            # 아티팩트 저장 및 캐시 등록
+            BM25ModelCache.set(collection_name, encoder)
 
             logger.info(f"✅ BM25 model built and cached for '{collection_name}'")
 
@@ -283,47 +699,31 @@ class SearchService:
     def _execute_dense_search(
         self,
         collection_name: str,
-        dense_vector: List[float],
+        dense_vectors: List[List[float]],
         top_k: int,
+        output_fields: List[str],
         filter_expr: Optional[str] = None,
-    ) -> List[SearchResultItem]:
+    ) -> List[List[VectorHit]]:
         """
-        밀집 벡터만 사용한 검색 (BM25 fallback)
+        밀집 벡터만 사용한 검색 (BM25 fallback, 쿼리 여러 개는 nq>1 요청 1회)
 
         Args:
             collection_name: 컬렉션 이름
-            dense_vector: 밀집 쿼리 벡터
+            dense_vectors: 밀집 쿼리 벡터 리스트
             top_k: 결과 개수
+            output_fields: 가져올 필드
             filter_expr: 필터 표현식 (선택)
 
         Returns:
-            검색 결과 리스트
+            쿼리별 검색 히트 리스트
 
         Raises:
             SearchError: 검색 실패 시
         """
         try:
-            # 검색 파라미터
-            search_params: Dict[str, Any] = {
-                "collection_name": collection_name,
-                "data": [dense_vector],
-                "anns_field": "dense",
-                "limit": top_k,
-                "output_fields": ["*"],
-                "search_params": {"metric_type": "COSINE", "params": {"ef": 128}},
-            }
-
-            # 필터 추가 (있을 경우)
-            if filter_expr:
-                search_params["filter"] = filter_expr
-
-            res = self.client.search(**search_params)
-
-            if not res or not res[0]:
-                return []
-
-            # 결과 포맷팅
-            return self._format_results(res[0])
+            return self.store.search(
+                collection_name, dense_vectors, None, top_k, output_fields, filter_expr
+            )
 
         except Exception as e:
             raise SearchError(f"Dense search execution failed: {e}") from e
@@ -331,74 +731,129 @@ class SearchService:
     def _execute_hybrid_search(
         self,
         collection_name: str,
-        dense_vector: List[float],
-        sparse_vector: Dict[int, float],
+        dense_vectors: List[List[float]],
+        sparse_vectors: List[Dict[int, float]],
         top_k: int,
+        output_fields: List[str],
         filter_expr: Optional[str] = None,
-    ) -> List[SearchResultItem]:
+    ) -> List[List[VectorHit]]:
         """
-        하이브리드 검색 실행 (RRF 랭커 사용)
+        하이브리드 검색 실행 (RRF 랭커 사용, 쿼리 여러 개는 nq>1 요청 1회)
 
         Args:
             collection_name: 컬렉션 이름
-            dense_vector: 밀집 쿼리 벡터
-            sparse_vector: 희소 쿼리 벡터
+            dense_vectors: 밀집 쿼리 벡터 리스트
+            sparse_vectors: 희소 쿼리 벡터 리스트 (dense_vectors와 같은 순서)
             top_k: 결과 개수
+            output_fields: 가져올 필드
             filter_expr: 필터 표현식 (선택)
 
         Returns:
-            검색 결과 리스트
+            쿼리별 검색 히트 리스트
 
         Raises:
             SearchError: 검색 실패 시
         """
         try:
-            # 밀집 벡터 검색 요청
-            dense_req = AnnSearchRequest(
-                data=[dense_vector],
-                anns_field="dense",
-                limit=top_k,
-                param={"metric_type": "COSINE", "params": {"ef": 128}},
+            return self.store.search(
+                collection_name, dense_vectors, sparse_vectors, top_k, output_fields, filter_expr
             )
 
-            # 희소 벡터 검색 요청
-            sparse_req = AnnSearchRequest(
-                data=[sparse_vector],
-                anns_field="sparse",
-                limit=top_k,
-                param={"metric_type": "IP"},
-            )
+        except Exception as e:
+            raise SearchError(f"Hybrid search execution failed: {e}") from e
 
-            # 하이브리드 검색 실행
-            search_params: Dict[str, Any] = {
-                "collection_name": collection_name,
-                "reqs": [dense_req, sparse_req],
-                "ranker": RRFRanker(),
-                "limit": top_k,
-                "output_fields": ["*"],
-            }
+    def _select_results(
+        self,
+        collection_name: str,
+        hits_per_query: List[List[VectorHit]],
+        top_k: int,
+        output_fields: List[str],
+        two_phase: bool,
+    ) -> List[List[SearchResultItem]]:
+        """
+        검색 히트를 최종 결과로 변환 (2단계 검색이면 중복 제거 후 본문 일괄 조회)
 
-            # 필터 추가 (있을 경우)
-            if filter_expr:
-                search_params["filter"] = filter_expr
+        Args:
+            collection_name: 컬렉션 이름
+            hits_per_query: 쿼리별 검색 히트 리스트
+            top_k: 쿼리별 최종 결과 개수
+            output_fields: 최종 결과에 필요한 필드
+            two_phase: 2단계 검색 여부
 
-            res = self.client.hybrid_search(**search_params)
+        Returns:
+            쿼리별 검색 결과 리스트
 
-            if not res or not res[0]:
-                return []
+        Raises:
+            SearchError: 본문 조회 실패 시
+        """
+        if not two_phase:
+            return [self._format_results(hits) for hits in hits_per_query]
+
+        # 같은 위치의 청크는 점수가 가장 높은 것만 남기고 쿼리별 top_k 선택
+        selected = [self._dedup_hits(hits)[:top_k] for hits in hits_per_query]
+        ids = list(dict.fromkeys(hit["id"] for hits in selected for hit in hits))
+        rows = self._fetch_rows(collection_name, ids, output_fields)
+
+        return [self._format_results(hits, rows) for hits in selected]
+
+    @staticmethod
+    def _dedup_hits(hits: List[VectorHit]) -> List[VectorHit]:
+        """
+        (파일, 시작 줄, 끝 줄)이 같은 히트 제거 (점수 순서 유지, 내부 메서드)
+
+        Args:
+            hits: 검색 히트 리스트 (점수 내림차순)
+
+        Returns:
+            중복 제거된 히트 리스트
+        """
+        seen = set()
+        unique: List[VectorHit] = []
+        for hit in hits:
+            fields = hit["fields"]
+            key = (fields.get("file_path"), fields.get("start_line"), fields.get("end_line"))
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(hit)
+        return unique
+
+    def _fetch_rows(
+        self, collection_name: str, ids: List[int], output_fields: List[str]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        최종 결과의 필드를 pk로 일괄 조회 (2단계 검색, 내부 메서드)
+
+        Args:
+            collection_name: 컬렉션 이름
+            ids: 조회할 pk 리스트
+            output_fields: 가져올 필드
+
+        Returns:
+            pk -> 필드 딕셔너리
 
-            # 결과 포맷팅
-            return self._format_results(res[0])
+        Raises:
+            SearchError: 조회 실패 시
+        """
+        if not ids:
+            return {}
 
+        try:
+            rows = self.store.get(collection_name, ids, output_fields)
         except Exception as e:
-            raise SearchError(f"Hybrid search execution failed: {e}") from e
+            raise SearchError(f"Failed to fetch search result fields: {e}") from e
+
+        return {row["pk"]: row for row in rows}
 
-    def _format_results(self, hits: List[Any]) -> List[SearchResultItem]:
+    def _format_results(
+        self, hits: List[VectorHit], rows: Optional[Dict[int, Dict[str, Any]]] = None
+    ) -> List[SearchResultItem]:
         """
         검색 결과를 포맷팅
 
         Args:
             hits: 검색 히트 리스트
+            rows: 2단계 검색에서 pk로 조회한 필드 (있으면 히트 필드 위에 덮어씀)
 
         Returns:
             포맷팅된 결과 리스트
@@ -406,7 +861,9 @@ class SearchService:
         results: List[SearchResultItem] = []
 
         for hit in hits:
-            fields = hit.entity.fields.copy()
+            fields = dict(hit["fields"])
+            if rows is not None:
+                fields.update(rows.get(hit["id"], {}))
 
             # 'text' -> 'code' 변환
             code = fields.pop("text", "")
@@ -417,7 +874,7 @@ class SearchService:
             fields.pop("sparse", None)
 
             # 스코어 추가
-            score = getattr(hit, "distance", None)
+            score = hit["score"]
 
             result_item: SearchResultItem = SearchResultItem(
                 code=code,
@@ -428,6 +885,12 @@ class SearchService:
                 type=fields.get("type", ""),
                 _source_file=fields.get("_source_file", ""),
                 score=score,
+                chunk_id=fields.get("chunk_id", ""),
+                part_index=fields.get("part_index", 0),
+                part_count=fields.get("part_count", 1),
+                overlap_lines=fields.get("overlap_lines", 0),
+                parent_id=fields.get("parent_id", ""),
+                member_ids=list(fields.get("member_ids") or []),
             )
 
             results.append(result_item)
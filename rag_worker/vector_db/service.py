@@ -3,13 +3,16 @@ Vector DB 통합 서비스
 """
 
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from .collection_manager import CollectionManager
+from .config import EMBEDDING_MAX_BATCH_SIZE
 from .embedding_service import EmbeddingService
 from .search_service import SearchService
 from .repository_embedder import RepositoryEmbedder
 from .types import (
+    BatchSearchInput,
+    BatchSearchResult,
     CollectionInfo,
     CollectionCreateResult,
     CollectionDeleteResult,
@@ -29,13 +32,15 @@ class VectorDBService:
     컬렉션 관리, 임베딩, 검색 기능을 통합하여 제공합니다.
     """
 
-    def __init__(self, batch_size: int = 256, embedding_batch_size: int = 4) -> None:
+    def __init__(
+        self, batch_size: int = 256, embedding_batch_size: int = EMBEDDING_MAX_BATCH_SIZE
+    ) -> None:
         """
         VectorDBService 초기화
 
         Args:
             batch_size: Milvus 삽입 배치 크기
-            embedding_batch_size: 임베딩 생성 배치 크기 (메모리 부족 시 줄이기)
+            embedding_batch_size: 모델 1회 호출당 최대 텍스트 수 (토큰 예산은 자동 조절)
         """
         self.collection_manager: CollectionManager = CollectionManager()
         self.embedding_service: EmbeddingService = EmbeddingService(
@@ -149,6 +154,35 @@ class VectorDBService:
         """
         return self.repository_embedder.embed_repository(repo_name, collection_name, model_key)
 
+    def embed_chunks(
+        self, chunks: List[Dict[str, Any]], collection_name: str, model_key: str
+    ) -> EmbeddingResult:
+        """
+        청크 리스트를 기존 컬렉션에 추가 임베딩 (증분 동기화용)
+
+        Args:
+            chunks: 청크 딕셔너리 리스트
+            collection_name: 저장할 컬렉션 이름
+            model_key: 사용할 임베딩 모델 키
+
+        Returns:
+            임베딩 결과
+        """
+        return self.embedding_service.embed_chunks(chunks, collection_name, model_key)
+
+    def delete_file_chunks(self, collection_name: str, file_paths: List[str]) -> int:
+        """
+        지정된 소스 파일의 청크를 컬렉션에서 삭제
+
+        Args:
+            collection_name: 컬렉션 이름
+            file_paths: 삭제할 청크의 file_path 값 리스트
+
+        Returns:
+            삭제된 엔티티 수
+        """
+        return self.embedding_service.delete_file_chunks(collection_name, file_paths)
+
     # ==================== 검색 ====================
 
     def search(
@@ -158,6 +192,8 @@ class VectorDBService:
         model_key: str,
         top_k: int = 5,
         filter_expr: Optional[str] = None,
+        output_fields: Optional[List[str]] = None,
+        two_phase: Optional[bool] = None,
     ) -> SearchResult:
         """
         하이브리드 검색 수행
@@ -168,6 +204,8 @@ class VectorDBService:
             model_key: 사용할 임베딩 모델 키
             top_k: 반환할 결과 개수
             filter_expr: 필터 표현식 (선택)
+            output_fields: 가져올 필드 (선택, 기본값: SEARCH_OUTPUT_FIELDS)
+            two_phase: 2단계 검색 여부 (선택, 기본값: SEARCH_TWO_PHASE)
 
         Returns:
             검색 결과
@@ -178,6 +216,45 @@ class VectorDBService:
             model_key=model_key,
             top_k=top_k,
             filter_expr=filter_expr,
+            output_fields=output_fields,
+            two_phase=two_phase,
         )
 
         return self.search_service.search(input_data)
+
+    def search_batch(
+        self,
+        queries: List[str],
+        collection_name: str,
+        model_key: str,
+        top_k: int = 5,
+        filter_expr: Optional[str] = None,
+        output_fields: Optional[List[str]] = None,
+        two_phase: Optional[bool] = None,
+    ) -> BatchSearchResult:
+        """
+        다중 쿼리 하이브리드 검색 수행 (같은 컬렉션)
+
+        Args:
+            queries: 검색 쿼리 리스트
+            collection_name: 검색할 컬렉션 이름
+            model_key: 사용할 임베딩 모델 키
+            top_k: 쿼리별 반환할 결과 개수
+            filter_expr: 필터 표현식 (선택, 모든 쿼리에 공통 적용)
+            output_fields: 가져올 필드 (선택, 기본값: SEARCH_OUTPUT_FIELDS)
+            two_phase: 2단계 검색 여부 (선택, 기본값: SEARCH_TWO_PHASE)
+
+        Returns:
+            쿼리 순서대로의 검색 결과
+        """
+        input_data: BatchSearchInput = BatchSearchInput(
+            queries=queries,
+            collection_name=collection_name,
+            model_key=model_key,
+            top_k=top_k,
+            filter_expr=filter_expr,
+            output_fields=output_fields,
+            two_phase=two_phase,
+        )
+
+        return self.search_service.search_batch(input_data)
@@ -0,0 +1,352 @@
+"""
+BM25 희소 벡터 인코더 (용어 가중치 기반)
+"""
+
+import math
+import re
+import zlib
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Mapping, Union
+
+import numpy as np
+
+# 식별자 / 숫자 단위 토큰 패턴
+TOKEN_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|\d+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    텍스트를 BM25용 토큰 리스트로 변환
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        소문자 토큰 리스트
+    """
+    return [token.lower() for token in TOKEN_PATTERN.findall(text)]
+
+
+class SparseBatch:
+    """
+    CSR 형식 희소 벡터 배치
+
+    i번째 문서의 용어 ID와 가중치는 indices[indptr[i]:indptr[i+1]],
+    values[indptr[i]:indptr[i+1]]에 연속으로 저장됩니다. 문서마다 딕셔너리를 두는 대신
+    배치 전체가 세 개의 배열만 차지합니다.
+    """
+
+    __slots__ = ("indptr", "indices", "values")
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, values: np.ndarray) -> None:
+        """
+        SparseBatch 초기화
+
+        Args:
+            indptr: 문서별 시작 오프셋 (int64, 길이 = 문서 수 + 1)
+            indices: 용어 ID (uint32)
+            values: 가중치 (float32)
+        """
+        self.indptr: np.ndarray = indptr
+        self.indices: np.ndarray = indices
+        self.values: np.ndarray = values
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def nbytes(self) -> int:
+        """배열 메모리 크기 (바이트)"""
+        return self.indptr.nbytes + self.indices.nbytes + self.values.nbytes
+
+    def row(self, i: int) -> Dict[int, float]:
+        """
+        i번째 문서의 희소 벡터 (Milvus 삽입 직전에만 딕셔너리로 변환)
+
+        Args:
+            i: 문서 인덱스
+
+        Returns:
+            희소 벡터 (용어 ID -> 가중치)
+        """
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return dict(zip(self.indices[start:end].tolist(), self.values[start:end].tolist()))
+
+
+class BM25SparseEncoder:
+    """
+    BM25 용어 가중치 희소 인코더
+
+    희소 벡터의 차원은 문서 인덱스가 아닌 용어 ID입니다.
+    문서 벡터는 BM25의 TF 정규화 항, 쿼리 벡터는 IDF 항을 담으므로
+    두 벡터의 내적(IP)이 곧 BM25 점수가 됩니다.
+
+    용어 ID는 토큰의 CRC32 해시로 결정되므로, 같은 토큰은 어떤 프로세스에서
+    어떤 순서로 학습하더라도 항상 같은 차원에 매핑됩니다. 따라서 저장소에는
+    용어 ID별 문서 빈도만 기록하고 어휘 사전은 저장하지 않습니다
+    (vocabulary는 프로세스 내 해시 캐시입니다).
+
+    서로 다른 토큰이 같은 해시를 가지면 두 토큰의 통계가 한 차원으로 합쳐지므로,
+    fit() 시점에 충돌을 찾아 collisions에 기록합니다 (용어 10만 개 기준 기대 충돌 약 1건).
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
+        """
+        BM25SparseEncoder 초기화
+
+        Args:
+            k1: TF 포화 파라미터
+            b: 문서 길이 정규화 파라미터
+        """
+        self.k1: float = k1
+        self.b: float = b
+        self.num_docs: int = 0
+        self.total_length: int = 0
+        self.vocabulary: Dict[str, int] = {}
+        self.doc_freqs: Mapping[int, int] = {}
+        self.collisions: Dict[int, List[str]] = {}
+
+    @property
+    def avgdl(self) -> float:
+        """평균 문서 길이"""
+        return self.total_length / self.num_docs if self.num_docs else 0.0
+
+    @staticmethod
+    def hash_token(token: str) -> int:
+        """
+        토큰의 해시 용어 ID 계산 (CRC32)
+
+        Args:
+            token: 토큰
+
+        Returns:
+            용어 ID
+        """
+        return zlib.crc32(token.encode("utf-8"))
+
+    def token_id(self, token: str) -> int:
+        """
+        토큰의 용어 ID 반환 (어휘 사전에 없으면 등록)
+
+        Args:
+            token: 토큰
+
+        Returns:
+            용어 ID
+        """
+        term_id = self.vocabulary.get(token)
+        if term_id is None:
+            term_id = self.hash_token(token)
+            self.vocabulary[token] = term_id
+        return term_id
+
+    def find_collisions(self) -> Dict[int, List[str]]:
+        """
+        어휘 사전에서 같은 용어 ID로 합쳐진 토큰 찾기 (비용: O(어휘 수))
+
+        Returns:
+            충돌한 용어 ID -> 토큰 리스트 (충돌이 없으면 빈 딕셔너리)
+        """
+        tokens_by_id: Dict[int, List[str]] = {}
+        for token, term_id in self.vocabulary.items():
+            tokens_by_id.setdefault(term_id, []).append(token)
+        return {term_id: tokens for term_id, tokens in tokens_by_id.items() if len(tokens) > 1}
+
+    def fit(self, tokenized_corpus: Iterable[List[str]]) -> "BM25SparseEncoder":
+        """
+        코퍼스 통계를 한 번의 순회로 수집 (기존 통계 초기화)
+
+        Args:
+            tokenized_corpus: 토큰화된 문서 이터러블
+
+        Returns:
+            self
+        """
+        self.num_docs = 0
+        self.total_length = 0
+        self.vocabulary = {}
+        self.doc_freqs = {}
+        self.add_documents(tokenized_corpus)
+        self.collisions = self.find_collisions()
+        return self
+
+    def add_documents(self, tokenized_corpus: Iterable[List[str]]) -> None:
+        """
+        문서를 코퍼스 통계에 추가
+
+        Args:
+            tokenized_corpus: 토큰화된 문서 이터러블
+        """
+        doc_freqs = self._mutable_doc_freqs()
+        for doc_tokens in tokenized_corpus:
+            self.num_docs += 1
+            self.total_length += len(doc_tokens)
+            for term_id in {self.token_id(token) for token in doc_tokens}:
+                doc_freqs[term_id] = doc_freqs.get(term_id, 0) + 1
+
+    def remove_documents(self, tokenized_corpus: Iterable[List[str]]) -> None:
+        """
+        문서를 코퍼스 통계에서 제거
+
+        Args:
+            tokenized_corpus: 토큰화된 문서 이터러블
+        """
+        doc_freqs = self._mutable_doc_freqs()
+        for doc_tokens in tokenized_corpus:
+            self.num_docs = max(self.num_docs - 1, 0)
+            self.total_length = max(self.total_length - len(doc_tokens), 0)
+            for term_id in {self.token_id(token) for token in doc_tokens}:
+                remaining = doc_freqs.get(term_id, 0) - 1
+                if remaining > 0:
+                    doc_freqs[term_id] = remaining
+                else:
+                    doc_freqs.pop(term_id, None)
+
+    def _mutable_doc_freqs(self) -> Dict[int, int]:
+        """
+        문서 빈도 테이블을 수정 가능한 딕셔너리로 보장 (내부 메서드)
+
+        저장소에서 메모리 매핑으로 로드한 읽기 전용 테이블은 최초 수정 시점에 복사합니다.
+
+        Returns:
+            문서 빈도 딕셔너리
+        """
+        if not isinstance(self.doc_freqs, dict):
+            self.doc_freqs = dict(self.doc_freqs.items())
+        return self.doc_freqs
+
+    def idf(self, term_id: int) -> float:
+        """
+        용어의 IDF 계산 (항상 양수가 되도록 +1 보정)
+
+        Args:
+            term_id: 용어 ID
+
+        Returns:
+            IDF 값 (코퍼스에 없는 용어는 0)
+        """
+        df = self.doc_freqs.get(term_id, 0)
+        if df == 0:
+            return 0.0
+        return math.log((self.num_docs - df + 0.5) / (df + 0.5) + 1.0)
+
+    def encode_document(self, doc_tokens: List[str]) -> Dict[int, float]:
+        """
+        문서 토큰을 BM25 TF 가중치 희소 벡터로 변환
+
+        Args:
+            doc_tokens: 토큰화된 문서
+
+        Returns:
+            희소 벡터 (용어 ID -> 가중치)
+        """
+        if not doc_tokens:
+            return {}
+
+        avgdl = self.avgdl or float(len(doc_tokens))
+        norm = self.k1 * (1.0 - self.b + self.b * len(doc_tokens) / avgdl)
+
+        return {
+            self.token_id(token): tf * (self.k1 + 1.0) / (tf + norm)
+            for token, tf in Counter(doc_tokens).items()
+        }
+
+    def encode_documents(self, tokenized_corpus: Iterable[List[str]]) -> List[Dict[int, float]]:
+        """
+        여러 문서를 희소 벡터로 변환
+
+        Args:
+            tokenized_corpus: 토큰화된 문서 이터러블
+
+        Returns:
+            희소 벡터 리스트
+        """
+        return [self.encode_document(doc_tokens) for doc_tokens in tokenized_corpus]
+
+    def encode_batch(self, tokenized_corpus: Iterable[List[str]]) -> SparseBatch:
+        """
+        여러 문서를 CSR 형식 희소 벡터 배치로 변환 (encode_documents와 같은 가중치)
+
+        Args:
+            tokenized_corpus: 토큰화된 문서 이터러블
+
+        Returns:
+            SparseBatch
+        """
+        indptr: List[int] = [0]
+        term_ids: List[int] = []
+        term_freqs: List[int] = []
+        doc_norms: List[float] = []
+
+        for doc_tokens in tokenized_corpus:
+            counts = Counter(doc_tokens)
+            term_ids.extend(self.token_id(token) for token in counts)
+            term_freqs.extend(counts.values())
+            indptr.append(len(term_ids))
+            if doc_tokens:
+                avgdl = self.avgdl or float(len(doc_tokens))
+                doc_norms.append(self.k1 * (1.0 - self.b + self.b * len(doc_tokens) / avgdl))
+            else:
+                doc_norms.append(0.0)
+
+        offsets = np.asarray(indptr, dtype=np.int64)
+        tfs = np.asarray(term_freqs, dtype=np.float64)
+        norms = np.repeat(np.asarray(doc_norms, dtype=np.float64), np.diff(offsets))
+        values = (tfs * (self.k1 + 1.0) / (tfs + norms)).astype(np.float32)
+
+        return SparseBatch(offsets, np.asarray(term_ids, dtype=np.uint32), values)
+
+    def encode_query(self, query: Union[str, List[str]]) -> Dict[int, float]:
+        """
+        쿼리를 IDF 가중치 희소 벡터로 변환 (비용: O(쿼리 토큰 수))
+
+        Args:
+            query: 쿼리 문자열 또는 토큰 리스트
+
+        Returns:
+            희소 벡터 (코퍼스에 없는 토큰은 제외)
+        """
+        query_tokens = tokenize(query) if isinstance(query, str) else query
+        sparse_vec: Dict[int, float] = {}
+
+        for token, count in Counter(query_tokens).items():
+            term_id = self.hash_token(token)
+            weight = self.idf(term_id)
+            if weight > 0:
+                sparse_vec[term_id] = weight * count
+
+        return sparse_vec
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        인코더 상태를 직렬화 가능한 딕셔너리로 변환
+
+        Returns:
+            인코더 상태
+        """
+        return {
+            "k1": self.k1,
+            "b": self.b,
+            "num_docs": self.num_docs,
+            "total_length": self.total_length,
+            "vocabulary": self.vocabulary,
+            "doc_freqs": {str(term_id): df for term_id, df in self.doc_freqs.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "BM25SparseEncoder":
+        """
+        딕셔너리로부터 인코더 복원
+
+        Args:
+            state: to_dict()로 만든 인코더 상태
+
+        Returns:
+            BM25SparseEncoder 인스턴스
+        """
+        encoder = cls(k1=state["k1"], b=state["b"])
+        encoder.num_docs = state["num_docs"]
+        encoder.total_length = state["total_length"]
+        encoder.vocabulary = dict(state["vocabulary"])
+        encoder.doc_freqs = {int(term_id): df for term_id, df in state["doc_freqs"].items()}
+        return encoder
@@ -0,0 +1,397 @@
+"""
+BM25 희소 인코더 영속 저장소 (컬렉션별 버전 관리 + 메모리 매핑)
+"""
+
+import bisect
+import json
+import logging
+import mmap
+import os
+import sys
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, Mapping, Optional, Tuple
+
+from .sparse_encoder import BM25SparseEncoder
+
+try:
+    import fcntl
+except ImportError:
+    # Windows는 msvcrt 바이트 잠금 사용
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+# 저장 포맷 버전 (포맷이 바뀌면 올려서 이전 아티팩트를 무시)
+ARTIFACT_FORMAT = 1
+
+
+def _lock_file(handle: IO[bytes]) -> None:
+    """
+    파일 배타 잠금 획득 (다른 프로세스가 해제할 때까지 대기)
+
+    Args:
+        handle: 잠금 파일 핸들
+    """
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        return
+    handle.seek(0)
+    while True:
+        try:
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            # LK_LOCK은 약 10초 재시도 후 실패하므로 계속 대기
+            continue
+
+
+def _unlock_file(handle: IO[bytes]) -> None:
+    """
+    파일 배타 잠금 해제
+
+    Args:
+        handle: 잠금 파일 핸들
+    """
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        return
+    handle.seek(0)
+    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class MappedDocFreqs(Mapping[int, int]):
+    """
+    메모리 매핑된 문서 빈도 테이블 (읽기 전용)
+
+    정렬된 용어 ID 배열과 문서 빈도 배열을 이진 탐색으로 조회하므로,
+    로드 시 딕셔너리를 만들지 않고 여러 워커 프로세스가 페이지 캐시를 공유합니다.
+    """
+
+    def __init__(self, buffer: mmap.mmap, num_terms: int) -> None:
+        """
+        MappedDocFreqs 초기화
+
+        Args:
+            buffer: 메모리 매핑된 데이터 파일
+            num_terms: 용어 수
+        """
+        self._buffer: mmap.mmap = buffer
+        view = memoryview(buffer).cast("I")
+        self._term_ids: memoryview = view[:num_terms]
+        self._doc_freqs: memoryview = view[num_terms : num_terms * 2]
+
+    def get(self, term_id: int, default: Any = None) -> Any:
+        """용어 ID의 문서 빈도 조회 (O(log V))"""
+        index = bisect.bisect_left(self._term_ids, term_id)
+        if index < len(self._term_ids) and self._term_ids[index] == term_id:
+            return self._doc_freqs[index]
+        return default
+
+    def __getitem__(self, term_id: int) -> int:
+        value = self.get(term_id)
+        if value is None:
+            raise KeyError(term_id)
+        return value
+
+    def __contains__(self, term_id: object) -> bool:
+        return isinstance(term_id, int) and self.get(term_id) is not None
+
+    def __len__(self) -> int:
+        return len(self._term_ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._term_ids)
+
+    def items(self) -> Iterator[Tuple[int, int]]:  # type: ignore[override]
+        return zip(self._term_ids, self._doc_freqs)
+
+
+class SparseModelStore:
+    """
+    컬렉션별 BM25 인코더 아티팩트 저장소
+
+    디렉토리 구조:
+        {base_path}/{collection_name}/meta.json   - 코퍼스 통계 및 현재 버전
+        {base_path}/{collection_name}/v{N}.bin    - uint32 용어 ID 배열 + uint32 문서 빈도 배열
+
+    저장 시 새 버전 파일을 쓰고 meta.json을 원자적으로 교체하므로,
+    이전 버전을 매핑하고 있는 다른 프로세스는 영향을 받지 않습니다.
+
+    저장 / 삭제는 컬렉션별 파일 잠금({base_path}/{collection_name}.lock) 안에서 수행되어
+    여러 워커 프로세스가 같은 버전 번호나 임시 파일에 동시에 쓰지 않습니다. 인코더를 읽고
+    수정해 다시 저장하는 호출 측은 lock()으로 전체 구간을 감싸 다른 프로세스의 갱신을 덮어쓰지 않게 합니다.
+    """
+
+    # 프로세스 내 잠금 상태 (잠금 파일 경로 -> 스레드 잠금 / 재진입 깊이 / 파일 핸들)
+    _thread_locks: Dict[str, threading.RLock] = {}
+    _lock_depths: Dict[str, int] = {}
+    _lock_handles: Dict[str, IO[bytes]] = {}
+    _locks_guard: threading.Lock = threading.Lock()
+
+    def __init__(self, base_path: str = "sparse_models") -> None:
+        """
+        SparseModelStore 초기화
+
+        Args:
+            base_path: 아티팩트 저장 기본 경로
+        """
+        # 프로젝트 루트 찾기
+        if Path(base_path).is_absolute():
+            self.base_path: Path = Path(base_path)
+        else:
+            current = Path.cwd()
+            while current != current.parent:
+                if (current / "pyproject.toml").exists():
+                    self.base_path = current / base_path
+                    break
+                current = current.parent
+            else:
+                self.base_path = Path(base_path).resolve()
+
+    def get_collection_path(self, collection_name: str) -> Path:
+        """
+        컬렉션 아티팩트 디렉토리 반환
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            아티팩트 디렉토리 경로
+        """
+        return self.base_path / collection_name
+
+    def get_meta_path(self, collection_name: str) -> Path:
+        """
+        컬렉션 메타 파일 경로 반환
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            meta.json 경로
+        """
+        return self.get_collection_path(collection_name) / "meta.json"
+
+    @contextmanager
+    def lock(self, collection_name: str) -> Iterator[None]:
+        """
+        컬렉션 아티팩트 배타 잠금 (프로세스 간 파일 잠금, 같은 스레드에서는 재진입 가능)
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Yields:
+            None (잠금을 보유한 구간)
+        """
+        lock_path = self.base_path / f"{collection_name}.lock"
+        key = str(lock_path)
+        with SparseModelStore._locks_guard:
+            thread_lock = SparseModelStore._thread_locks.setdefault(key, threading.RLock())
+
+        with thread_lock:
+            depth = SparseModelStore._lock_depths.get(key, 0)
+            if depth == 0:
+                # 잠금 파일은 컬렉션 디렉토리 밖에 두어 delete() 후에도 대기 중인 프로세스와 공유
+                self.base_path.mkdir(parents=True, exist_ok=True)
+                handle = open(lock_path, "a+b")
+                try:
+                    _lock_file(handle)
+                except BaseException:
+                    handle.close()
+                    raise
+                SparseModelStore._lock_handles[key] = handle
+            SparseModelStore._lock_depths[key] = depth + 1
+
+            try:
+                yield
+            finally:
+                depth = SparseModelStore._lock_depths[key] - 1
+                SparseModelStore._lock_depths[key] = depth
+                if depth == 0:
+                    handle = SparseModelStore._lock_handles.pop(key)
+                    _unlock_file(handle)
+                    handle.close()
+
+    def stamp(self, collection_name: str) -> Optional[int]:
+        """
+        메타 파일 변경 스탬프 반환 (다른 프로세스의 갱신 감지용, stat 1회)
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            메타 파일 수정 시각 (ns), 없으면 None
+        """
+        try:
+            return os.stat(self.get_meta_path(collection_name)).st_mtime_ns
+        except OSError:
+            return None
+
+    def read_meta(self, collection_name: str) -> Optional[Dict[str, Any]]:
+        """
+        메타 정보 읽기
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            메타 딕셔너리 (없거나 포맷이 다르면 None)
+        """
+        meta_path = self.get_meta_path(collection_name)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if meta.get("format") != ARTIFACT_FORMAT or meta.get("byteorder") != sys.byteorder:
+            logger.warning(f"⚠️ Ignoring incompatible sparse model artifact: {meta_path}")
+            return None
+
+        return meta
+
+    def save(self, collection_name: str, encoder: BM25SparseEncoder) -> int:
+        """
+        인코더를 새 버전 아티팩트로 저장 (컬렉션 잠금 안에서 버전 결정 / 기록 / 교체)
+
+        Args:
+            collection_name: 컬렉션 이름
+            encoder: BM25 인코더
+
+        Returns:
+            저장된 버전 번호
+        """
+        with self.lock(collection_name):
+            return self._save_locked(collection_name, encoder)
+
+    def _save_locked(self, collection_name: str, encoder: BM25SparseEncoder) -> int:
+        """
+        인코더를 새 버전 아티팩트로 저장 (컬렉션 잠금 보유 상태, 내부 메서드)
+
+        Args:
+            collection_name: 컬렉션 이름
+            encoder: BM25 인코더
+
+        Returns:
+            저장된 버전 번호
+        """
+        collection_path = self.get_collection_path(collection_name)
+        collection_path.mkdir(parents=True, exist_ok=True)
+
+        previous = self.read_meta(collection_name)
+        version = (previous["version"] + 1) if previous else 1
+        data_file = f"v{version}.bin"
+
+        # 용어 ID 정렬 후 두 개의 uint32 배열로 기록
+        term_ids = array("I", sorted(encoder.doc_freqs.keys()))
+        doc_freqs = array("I", (encoder.doc_freqs[term_id] for term_id in term_ids))
+
+        # 임시 파일 이름에 pid를 붙여 잠금 밖에서 남은 파일과도 겹치지 않게 함
+        tmp_data_path = collection_path / f"{data_file}.{os.getpid()}.tmp"
+        with open(tmp_data_path, "wb") as f:
+            term_ids.tofile(f)
+            doc_freqs.tofile(f)
+        os.replace(tmp_data_path, collection_path / data_file)
+
+        meta: Dict[str, Any] = {
+            "format": ARTIFACT_FORMAT,
+            "byteorder": sys.byteorder,
+            "collection_name": collection_name,
+            "version": version,
+            "data_file": data_file,
+            "k1": encoder.k1,
+            "b": encoder.b,
+            "num_docs": encoder.num_docs,
+            "total_length": encoder.total_length,
+            "num_terms": len(term_ids),
+            "updated_at": time.time(),
+        }
+
+        tmp_meta_path = collection_path / f"meta.json.{os.getpid()}.tmp"
+        with open(tmp_meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_meta_path, self.get_meta_path(collection_name))
+
+        self._remove_stale_versions(collection_path, data_file)
+
+        logger.info(
+            f"💾 Sparse model saved: {collection_name} v{version} "
+            f"({meta['num_terms']} terms, {meta['num_docs']} docs)"
+        )
+        return version
+
+    def load(self, collection_name: str) -> Optional[Tuple[BM25SparseEncoder, Dict[str, Any]]]:
+        """
+        현재 버전 아티팩트를 메모리 매핑하여 인코더 복원
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            (인코더, 메타) 튜플, 아티팩트가 없으면 None
+        """
+        meta = self.read_meta(collection_name)
+        if meta is None:
+            return None
+
+        data_path = self.get_collection_path(collection_name) / meta["data_file"]
+        encoder = BM25SparseEncoder(k1=meta["k1"], b=meta["b"])
+        encoder.num_docs = meta["num_docs"]
+        encoder.total_length = meta["total_length"]
+
+        if meta["num_terms"] > 0:
+            try:
+                with open(data_path, "rb") as f:
+                    buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ Failed to map sparse model {data_path}: {e}")
+                return None
+            encoder.doc_freqs = MappedDocFreqs(buffer, meta["num_terms"])
+
+        logger.info(f"📂 Sparse model loaded: {collection_name} v{meta['version']}")
+        return encoder, meta
+
+    def delete(self, collection_name: str) -> None:
+        """
+        컬렉션 아티팩트 삭제
+
+        Args:
+            collection_name: 컬렉션 이름
+        """
+        collection_path = self.get_collection_path(collection_name)
+        if not collection_path.exists():
+            return
+
+        with self.lock(collection_name):
+            for path in collection_path.iterdir():
+                try:
+                    path.unlink()
+                except OSError as e:
+                    logger.warning(f"Failed to delete sparse model file {path}: {e}")
+            try:
+                collection_path.rmdir()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _remove_stale_versions(collection_path: Path, current_file: str) -> None:
+        """
+        현재 버전 외의 데이터 파일 정리 (내부 메서드)
+
+        Args:
+            collection_path: 컬렉션 아티팩트 디렉토리
+            current_file: 현재 데이터 파일 이름
+        """
+        for path in collection_path.glob("v*.bin"):
+            if path.name == current_file:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                # Windows에서 다른 프로세스가 매핑 중이면 다음 저장 때 정리
+                pass
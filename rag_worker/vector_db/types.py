@@ -17,7 +17,7 @@ class EmbeddingModelConfig(TypedDict):
 class EmbeddingInput(TypedDict):
     """임베딩 작업 입력"""
 
-    json_path: str
+    json_path: str  # JSON 배열 또는 줄 단위 JSON(.jsonl, .jsonl.gz) 청크 파일
     collection_name: str
     model_key: str
 
@@ -30,10 +30,28 @@ class EmbeddingResult(TypedDict):
     total_documents: int
     inserted_count: int
     elapsed_time: float
+    cache_hits: int
+    cache_hit_rate: float
+    cache_bytes_saved: int
+    tokens_per_second: float
+    batch_token_budget: int
+    peak_rss_bytes: int
     message: Optional[str]
     error: Optional[str]
 
 
+class DenseEmbeddingStats(TypedDict):
+    """밀집 임베딩 생성 통계 (캐시 조회 + 모델 인코딩)"""
+
+    lookups: int
+    hits: int
+    bytes_saved: int
+    tokens: int
+    encode_seconds: float
+    token_budget: int
+    peak_rss_bytes: int
+
+
 class SearchInput(TypedDict):
     """검색 작업 입력"""
 
@@ -42,6 +60,16 @@ class SearchInput(TypedDict):
     model_key: str
     top_k: int
     filter_expr: Optional[str]
+    output_fields: Optional[List[str]]  # 가져올 필드 (None이면 SEARCH_OUTPUT_FIELDS)
+    two_phase: Optional[bool]  # 2단계 검색 여부 (None이면 SEARCH_TWO_PHASE)
+
+
+class VectorHit(TypedDict):
+    """벡터 저장소 검색 히트 (백엔드 공통)"""
+
+    id: int  # 기본 키 (pk)
+    score: float  # 밀집 검색은 COSINE 유사도, 하이브리드 검색은 RRF 점수
+    fields: Dict[str, Any]  # 요청한 output_fields 값
 
 
 class SearchResultItem(TypedDict):
@@ -55,6 +83,12 @@ class SearchResultItem(TypedDict):
     type: str
     _source_file: str
     score: Optional[float]
+    chunk_id: str  # 분할된 조각은 원본 청크 ID 공유 (이전에 인덱싱된 컬렉션은 "")
+    part_index: int  # 조각 순서 (분할되지 않았으면 0)
+    part_count: int  # 같은 chunk_id의 전체 조각 수 (분할되지 않았으면 1)
+    overlap_lines: int  # 이전 조각과 겹치는 앞쪽 줄 수 (ChunkSplitter.join_parts로 복원)
+    parent_id: str  # 감싸는 클래스 / 함수의 chunk_id (최상위면 "")
+    member_ids: List[str]  # class 타입: 메서드 / 중첩 클래스 chunk_id
 
 
 class SearchResult(TypedDict):
@@ -66,10 +100,57 @@ class SearchResult(TypedDict):
     total_results: int
     results: List[SearchResultItem]
     elapsed_time: float
+    stage_timings: Dict[str, float]  # 단계별 소요 시간 (초, 실행된 단계만): load, model_load, dense, sparse, search, format
+    query_cache_hits: int  # 이번 검색에서 캐시로 대체한 쿼리 벡터 수 (밀집 + 희소, 0~2)
+    query_cache_hit_rate: float  # 워커 프로세스 누적 쿼리 벡터 캐시 히트율
+    message: Optional[str]
+    error: Optional[str]
+
+
+class BatchSearchInput(TypedDict):
+    """다중 쿼리 검색 입력 (같은 컬렉션 / 모델 / 필터)"""
+
+    queries: List[str]
+    collection_name: str
+    model_key: str
+    top_k: int
+    filter_expr: Optional[str]
+    output_fields: Optional[List[str]]  # 가져올 필드 (None이면 SEARCH_OUTPUT_FIELDS)
+    two_phase: Optional[bool]  # 2단계 검색 여부 (None이면 SEARCH_TWO_PHASE)
+
+
+class BatchSearchResult(TypedDict):
+    """다중 쿼리 검색 결과"""
+
+    success: bool
+    collection_name: str
+    total_queries: int
+    results: List[SearchResult]  # 쿼리 순서대로, stage_timings / elapsed_time은 쿼리에 귀속되는 시간 (search_batch 참고)
+    elapsed_time: float  # 배치 전체 소요 시간 (초)
+    stage_timings: Dict[str, float]  # 배치 전체의 단계별 소요 시간 (초): load, dense, sparse, search
     message: Optional[str]
     error: Optional[str]
 
 
+class CollectionLoadStats(TypedDict):
+    """컬렉션 로드 추적 통계 (워커 프로세스 단위)"""
+
+    hits: int  # 이미 로드된 컬렉션 검색
+    misses: int  # 로드 상태 확인이 필요했던 검색
+    loads: int  # load_collection 호출 수
+    releases: int  # 유휴 / LRU 해제 수
+    loaded: List[str]  # 현재 로드된 것으로 추적 중인 컬렉션 (오래된 순)
+
+
+class QueryBatchStats(TypedDict):
+    """쿼리 인코딩 마이크로 배치 통계 (워커 프로세스, 모델 키 단위)"""
+
+    batches: int  # 모델 forward 호출 수
+    queries: int  # 인코딩 요청 수
+    max_batch_size: int  # 관측된 최대 배치 크기
+    mean_batch_size: float  # 평균 배치 크기
+
+
 class CollectionInfo(TypedDict):
     """컬렉션 정보"""
 
@@ -0,0 +1,125 @@
+"""
+벡터 저장소 인터페이스 및 백엔드 선택
+"""
+
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Protocol
+
+from .config import VECTOR_STORE_BACKEND
+from .exceptions import VectorDBError
+from .types import VectorHit
+
+
+class VectorStore(Protocol):
+    """
+    벡터 저장소 인터페이스
+
+    컬렉션 스키마는 pk(자동 증가) / text / dense / sparse / 메타데이터 필드로 고정되어 있으며,
+    CollectionManager, EmbeddingService, SearchService는 이 인터페이스만 사용합니다.
+    """
+
+    def has_collection(self, collection_name: str) -> bool:
+        """컬렉션 존재 여부"""
+        ...
+
+    def create_collection(self, collection_name: str, dim: int, description: str) -> None:
+        """하이브리드 검색용 컬렉션 생성 (밀집 벡터 차원 dim)"""
+        ...
+
+    def drop_collection(self, collection_name: str) -> None:
+        """컬렉션 삭제"""
+        ...
+
+    def list_collections(self) -> List[str]:
+        """컬렉션 이름 목록"""
+        ...
+
+    def describe_collection(self, collection_name: str) -> str:
+        """컬렉션 설명"""
+        ...
+
+    def row_count(self, collection_name: str) -> int:
+        """로드 없이 조회하는 행 수 (삭제 직후에는 삭제된 행이 포함될 수 있음)"""
+        ...
+
+    def count(self, collection_name: str) -> int:
+        """현재 조회 가능한 정확한 엔티티 수"""
+        ...
+
+    def ensure_loaded(self, collection_name: str) -> None:
+        """검색 가능한 상태 보장 (이미 로드되어 있으면 추가 비용 없음)"""
+        ...
+
+    def insert(self, collection_name: str, rows: List[Dict[str, Any]]) -> int:
+        """행 삽입 (text, dense, sparse, 메타데이터), 삽입된 행 수 반환"""
+        ...
+
+    def flush(self, collection_name: str) -> None:
+        """삽입된 행을 다른 프로세스에서도 검색 가능하도록 영속화"""
+        ...
+
+    def query_by_files(
+        self, collection_name: str, file_paths: List[str], output_fields: List[str]
+    ) -> List[Dict[str, Any]]:
+        """file_path가 주어진 값 중 하나인 행 조회"""
+        ...
+
+    def delete_by_files(self, collection_name: str, file_paths: List[str]) -> int:
+        """file_path가 주어진 값 중 하나인 행 삭제, 삭제된 행 수 반환"""
+        ...
+
+    def iter_texts(self, collection_name: str, batch_size: int) -> Iterator[List[str]]:
+        """전체 행의 text를 배치 단위로 순회"""
+        ...
+
+    def search(
+        self,
+        collection_name: str,
+        dense_vectors: List[List[float]],
+        sparse_vectors: Optional[List[Dict[int, float]]],
+        limit: int,
+        output_fields: List[str],
+        filter_expr: Optional[str] = None,
+    ) -> List[List[VectorHit]]:
+        """
+        쿼리별 검색 (sparse_vectors가 있으면 밀집 COSINE + 희소 IP 결과를 RRF로 융합,
+        없으면 밀집 검색만 수행)
+        """
+        ...
+
+    def get(
+        self, collection_name: str, ids: List[int], output_fields: List[str]
+    ) -> List[Dict[str, Any]]:
+        """pk로 행 조회 (각 행에 pk 포함)"""
+        ...
+
+
+_store: Optional[VectorStore] = None
+_store_lock: threading.Lock = threading.Lock()
+
+
+def get_vector_store() -> VectorStore:
+    """
+    설정된 백엔드의 벡터 저장소 반환 (프로세스 내 싱글톤)
+
+    Returns:
+        VECTOR_STORE_BACKEND에 해당하는 VectorStore 구현
+
+    Raises:
+        VectorDBError: 알 수 없는 백엔드일 때
+    """
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            if VECTOR_STORE_BACKEND == "milvus":
+                from .milvus_store import MilvusVectorStore
+
+                _store = MilvusVectorStore()
+            elif VECTOR_STORE_BACKEND == "local":
+                from .local_store import LocalVectorStore
+
+                _store = LocalVectorStore()
+            else:
+                raise VectorDBError(f"Unknown vector store backend: {VECTOR_STORE_BACKEND}")
+        return _store
@@ -0,0 +1,249 @@
+"""
+워커 프로세스 워밍업 및 준비 상태(readiness) 보고
+
+prefork 자식 프로세스가 시작되면 백그라운드 스레드에서 임베딩 모델, 최근 활성 컬렉션의
+BM25 인코더와 Milvus 컬렉션을 미리 로드하고 더미 쿼리를 실행합니다.
+프로세스별 상태는 WORKER_READINESS_DIR/{pid}.json 에 기록되며,
+`python -m rag_worker.warmup` 은 살아 있는 모든 워커 프로세스가 준비되었을 때만 0으로 종료하므로
+오케스트레이터의 readiness probe로 사용할 수 있습니다.
+"""
+
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, TypedDict
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스 시작 시 워밍업 여부
+WARMUP_ENABLED: bool = os.getenv("WORKER_WARMUP_ENABLED", "true").lower() == "true"
+
+# 미리 로드할 임베딩 모델 키 (쉼표 구분, 비어 있으면 DEFAULT_MODEL_KEY)
+WARMUP_MODEL_KEYS: str = os.getenv("WORKER_WARMUP_MODEL_KEYS", "")
+
+# 미리 로드할 최근 활성 컬렉션 수 (최근 채팅이 있었던 레포지토리 기준)
+WARMUP_COLLECTION_LIMIT: int = int(os.getenv("WORKER_WARMUP_COLLECTIONS", "5"))
+
+# 더미 쿼리 (검색 경로 전체를 한 번 실행)
+WARMUP_QUERY: str = "def main():"
+
+# 프로세스별 준비 상태 파일 디렉토리
+READINESS_DIR: Path = Path(
+    os.getenv("WORKER_READINESS_DIR", os.path.join(tempfile.gettempdir(), "rag_worker_ready"))
+)
+
+
+class WarmupReport(TypedDict):
+    """워커 프로세스 워밍업 상태"""
+
+    pid: int
+    status: str  # "warming", "ready", "failed"
+    models: List[str]  # 로드된 임베딩 모델 키
+    collections: List[str]  # 워밍업된 컬렉션 이름
+    stage_timings: Dict[str, float]  # 단계별 소요 시간 (초): models, collections, total
+    started_at: float
+    finished_at: Optional[float]
+    error: Optional[str]
+
+
+_report: Optional[WarmupReport] = None
+_thread: Optional[threading.Thread] = None
+
+
+def get_report() -> Optional[WarmupReport]:
+    """
+    현재 프로세스의 워밍업 상태 반환
+
+    Returns:
+        워밍업 상태 (워밍업을 시작하지 않았으면 None)
+    """
+    return _report
+
+
+def start_warmup() -> None:
+    """
+    워밍업을 백그라운드 스레드로 시작 (worker_process_init에서 호출)
+
+    worker_process_init 핸들러가 오래 걸리면 Celery가 자식 프로세스를 종료하므로
+    모델 로드는 스레드에서 수행하고, 그동안 상태 파일은 "warming"으로 남습니다.
+    """
+    global _report, _thread
+
+    _report = _new_report()
+
+    if not WARMUP_ENABLED:
+        _finish("ready")
+        return
+
+    _write_report()
+    _thread = threading.Thread(target=run_warmup, name="rag-worker-warmup", daemon=True)
+    _thread.start()
+
+
+def run_warmup() -> WarmupReport:
+    """
+    모델, 희소 인코더, 최근 활성 컬렉션을 로드하고 더미 쿼리 실행
+
+    모델 로드 실패는 채팅 요청도 실패하므로 "failed"로 기록하고,
+    개별 컬렉션 워밍업 실패는 경고만 남깁니다 (첫 요청에서 다시 로드).
+
+    Returns:
+        워밍업 상태
+    """
+    from .vector_db import EmbeddingModelRegistry, SearchService
+    from .vector_db.config import DEFAULT_MODEL_KEY, PROMPT_OUTPUT_FIELDS
+    from .vector_db.types import SearchInput
+
+    global _report
+    if _report is None:
+        _report = _new_report()
+
+    start_time = time.time()
+    model_keys = [key.strip() for key in WARMUP_MODEL_KEYS.split(",") if key.strip()] or [DEFAULT_MODEL_KEY]
+
+    try:
+        for model_key in model_keys:
+            # 첫 forward 호출의 초기화 비용까지 미리 지불
+            EmbeddingModelRegistry.get(model_key).embed_query(WARMUP_QUERY)
+            _report["models"].append(model_key)
+            logger.info(f"🔥 Embedding model warmed up: {model_key}")
+        _report["stage_timings"]["models"] = time.time() - start_time
+    except Exception as e:
+        logger.error(f"❌ Worker warmup failed while loading models: {e}")
+        _report["error"] = str(e)
+        _finish("failed")
+        return _report
+
+    collections_start = time.time()
+    search_service: Optional[SearchService] = None
+    for collection_name in _recent_collections():
+        try:
+            search_service = search_service or SearchService()
+            # 컬렉션 로드 + BM25 인코더 매핑 + 하이브리드 검색 경로를 한 번에 워밍업
+            result = search_service.search(
+                SearchInput(
+                    query=WARMUP_QUERY,
+                    collection_name=collection_name,
+                    model_key=model_keys[0],
+                    top_k=1,
+                    filter_expr=None,
+                    output_fields=PROMPT_OUTPUT_FIELDS,
+                    two_phase=None,
+                )
+            )
+            if not result["success"]:
+                raise RuntimeError(result["error"])
+            _report["collections"].append(collection_name)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to warm up collection '{collection_name}': {e}")
+    _report["stage_timings"]["collections"] = time.time() - collections_start
+
+    _finish("ready")
+    logger.info(
+        f"✅ Worker warmup completed in {_report['stage_timings']['total']:.2f}s "
+        f"(models: {len(_report['models'])}, collections: {len(_report['collections'])})"
+    )
+    return _report
+
+
+def clear_readiness() -> None:
+    """현재 프로세스의 상태 파일 제거 (worker_process_shutdown에서 호출)"""
+    try:
+        (READINESS_DIR / f"{os.getpid()}.json").unlink()
+    except FileNotFoundError:
+        pass
+
+
+def is_ready() -> bool:
+    """
+    살아 있는 모든 워커 프로세스가 준비되었는지 확인
+
+    종료된 프로세스가 남긴 상태 파일은 무시하고 정리합니다.
+
+    Returns:
+        상태 파일이 하나 이상 있고 모두 "ready"이면 True
+    """
+    statuses: List[str] = []
+    for path in READINESS_DIR.glob("*.json"):
+        try:
+            report = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+
+        if not psutil.pid_exists(report.get("pid", 0)):
+            path.unlink(missing_ok=True)
+            continue
+        statuses.append(report.get("status", ""))
+
+    return bool(statuses) and all(status == "ready" for status in statuses)
+
+
+def _recent_collections() -> List[str]:
+    """
+    최근 채팅이 있었던 레포지토리의 컬렉션 이름 조회 (내부 함수)
+
+    Returns:
+        컬렉션 이름 리스트 (DB 조회 실패 시 빈 리스트)
+    """
+    if WARMUP_COLLECTION_LIMIT <= 0:
+        return []
+
+    from .db_helper import RepositoryDBHelper, get_session
+
+    try:
+        db = get_session()
+        try:
+            repo_ids = RepositoryDBHelper.get_recently_active_repository_ids(db, WARMUP_COLLECTION_LIMIT)
+        finally:
+            db.close()
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to look up recently active repositories: {e}")
+        return []
+
+    return [f"repo_{repo_id.replace('-', '_')}" for repo_id in repo_ids]
+
+
+def _new_report() -> WarmupReport:
+    """warming 상태의 새 워밍업 상태 생성 (내부 함수)"""
+    return WarmupReport(
+        pid=os.getpid(),
+        status="warming",
+        models=[],
+        collections=[],
+        stage_timings={},
+        started_at=time.time(),
+        finished_at=None,
+        error=None,
+    )
+
+
+def _finish(status: str) -> None:
+    """워밍업 종료 상태 기록 (내부 함수)"""
+    _report["status"] = status
+    _report["finished_at"] = time.time()
+    _report["stage_timings"]["total"] = _report["finished_at"] - _report["started_at"]
+    _write_report()
+
+
+def _write_report() -> None:
+    """현재 프로세스의 상태 파일 기록 (임시 파일 후 교체, 내부 함수)"""
+    try:
+        READINESS_DIR.mkdir(parents=True, exist_ok=True)
+        path = READINESS_DIR / f"{_report['pid']}.json"
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(_report), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"⚠️ Failed to write readiness file: {e}")
+
+
+if __name__ == "__main__":
+    # readiness probe: 모든 워커 프로세스가 준비되었으면 0
+    sys.exit(0 if is_ready() else 1)
@@ -0,0 +1,118 @@
+"""
+DenseEmbedder 배치 방식 벤치마크 (CPU)
+
+기존 방식(파일 순서대로 고정 개수 배치 + 배치마다 empty_cache/gc.collect)과
+현재 방식(토큰 길이순 정렬 + 토큰 예산 배치)의 처리량(tokens/sec)을 비교합니다.
+입력은 지정한 디렉토리의 Python 파일을 PythonChunker로 청킹한 실제 코드 청크입니다.
+
+사용법:
+python -m ragit_sdk.tests.bench_embedding [--path rag_worker] [--limit 256] [--batch-size 4]
+"""
+
+import argparse
+import gc
+import time
+from pathlib import Path
+from typing import List
+
+import torch
+
+from rag_worker.python_parser.file_scanner import FileScanner
+from rag_worker.python_parser.service import PythonChunker
+from rag_worker.vector_db.config import DEFAULT_MODEL_KEY, EMBEDDING_TOKEN_BUDGET
+from rag_worker.vector_db.embedding_service import DenseEmbedder
+
+
+def load_texts(path: Path, limit: int) -> List[str]:
+    """
+    벤치마크용 코드 청크 텍스트 수집
+
+    Args:
+        path: Python 파일을 찾을 디렉토리
+        limit: 최대 청크 수
+
+    Returns:
+        청크 코드 리스트 (파일 순서)
+    """
+    chunker = PythonChunker()
+    texts: List[str] = []
+    for file_path in FileScanner().scan_repository(path):
+        texts.extend(chunk["code"] for chunk in chunker.chunk_file(file_path)["chunks"])
+        if len(texts) >= limit:
+            break
+    return texts[:limit]
+
+
+def legacy_embed(embedder: DenseEmbedder, texts: List[str], batch_size: int) -> float:
+    """
+    기존 방식 재현: 입력 순서대로 고정 개수 배치 (비교 기준)
+
+    Args:
+        embedder: DenseEmbedder 인스턴스
+        texts: 텍스트 리스트
+        batch_size: 배치당 텍스트 수
+
+    Returns:
+        소요 시간 (초)
+    """
+    start = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        embedder.embedder.embed_documents(texts[i : i + batch_size])
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        gc.collect()
+    return time.perf_counter() - start
+
+
+def bucketed_embed(embedder: DenseEmbedder, texts: List[str]) -> float:
+    """
+    현재 방식: 길이순 토큰 예산 배치
+
+    Args:
+        embedder: DenseEmbedder 인스턴스
+        texts: 텍스트 리스트
+
+    Returns:
+        소요 시간 (초, 토큰 수 계산 포함)
+    """
+    start = time.perf_counter()
+    embedder.embed_documents(texts)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """벤치마크 실행"""
+    arg_parser = argparse.ArgumentParser(description="DenseEmbedder batching benchmark")
+    arg_parser.add_argument("--path", type=Path, default=Path("rag_worker"))
+    arg_parser.add_argument("--limit", type=int, default=256)
+    arg_parser.add_argument("--batch-size", type=int, default=4, help="기존 방식의 고정 배치 크기")
+    arg_parser.add_argument("--token-budget", type=int, default=EMBEDDING_TOKEN_BUDGET)
+    arg_parser.add_argument("--model", default=DEFAULT_MODEL_KEY)
+    args = arg_parser.parse_args()
+
+    texts = load_texts(args.path, args.limit)
+    embedder = DenseEmbedder(args.model, token_budget=args.token_budget)
+    total_tokens = sum(embedder.count_tokens(texts))
+
+    print("\n" + "=" * 60)
+    print("⏱️  DenseEmbedder Batching Benchmark")
+    print("=" * 60)
+    print(f"📌 Device: {'cuda' if torch.cuda.is_available() else 'cpu'}")
+    print(f"📌 Chunks: {len(texts)}, tokens: {total_tokens}")
+
+    # 모델 워밍업 (첫 호출의 초기화 비용 제외)
+    embedder.embedder.embed_documents(texts[:2])
+
+    legacy_time = legacy_embed(embedder, texts, args.batch_size)
+    bucketed_time = bucketed_embed(embedder, texts)
+    batches = embedder.plan_batches(embedder.count_tokens(texts))
+
+    print(f"\nLegacy   (fixed {args.batch_size}/batch, file order): "
+          f"{legacy_time:7.2f} s, {total_tokens / legacy_time:8.0f} tokens/s")
+    print(f"Bucketed ({args.token_budget} tokens/batch, {len(batches)} batches): "
+          f"{bucketed_time:7.2f} s, {total_tokens / bucketed_time:8.0f} tokens/s")
+    print(f"Speedup: {legacy_time / bucketed_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
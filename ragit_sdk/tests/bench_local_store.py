@@ -0,0 +1,146 @@
+"""
+로컬 벡터 저장소 검색 벤치마크
+
+임시 디렉토리에 합성 밀집 / 희소 벡터로 LocalVectorStore 컬렉션을 만들고,
+밀집 검색과 하이브리드 검색(RRF)의 쿼리별 지연(p50/p99)을 측정합니다.
+임베딩 모델과 Milvus 없이 실행되며, 컬렉션 크기별 결과를 Milvus 검색 지연과 비교할 수 있습니다.
+
+사용법:
+python -m ragit_sdk.tests.bench_local_store [--rows 1000,10000,50000] [--dim 1024] [--queries 200] [--top-k 5]
+"""
+
+import argparse
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from rag_worker.vector_db.local_store import LocalVectorStore
+
+# 합성 희소 벡터의 어휘 크기 / 문서당 용어 수 / 쿼리당 용어 수
+VOCABULARY_SIZE = 50_000
+TERMS_PER_DOCUMENT = 40
+TERMS_PER_QUERY = 6
+
+
+def make_sparse(rng: np.random.Generator, terms: int) -> Dict[int, float]:
+    """
+    합성 희소 벡터 생성 (Zipf 분포 용어 ID)
+
+    Args:
+        rng: 난수 생성기
+        terms: 용어 수
+
+    Returns:
+        희소 벡터 (용어 ID -> 가중치)
+    """
+    term_ids = np.unique(rng.zipf(1.3, size=terms) % VOCABULARY_SIZE)
+    return {int(term_id): float(weight) for term_id, weight in zip(term_ids, rng.random(len(term_ids)) + 0.1)}
+
+
+def build_collection(store: LocalVectorStore, name: str, rows: int, dim: int, rng: np.random.Generator) -> float:
+    """
+    합성 데이터로 컬렉션 생성
+
+    Args:
+        store: 로컬 저장소
+        name: 컬렉션 이름
+        rows: 행 수
+        dim: 밀집 벡터 차원
+        rng: 난수 생성기
+
+    Returns:
+        삽입 + flush 소요 시간 (초)
+    """
+    store.create_collection(name, dim, "bench")
+    start = time.perf_counter()
+    for offset in range(0, rows, 1000):
+        count = min(1000, rows - offset)
+        dense = rng.standard_normal((count, dim), dtype=np.float32)
+        store.insert(name, [
+            {
+                "text": f"def function_{offset + i}(): pass",
+                "dense": dense[i],
+                "sparse": make_sparse(rng, TERMS_PER_DOCUMENT),
+                "file_path": f"src/module_{(offset + i) // 20}.py",
+                "name": f"function_{offset + i}",
+                "start_line": (offset + i) % 20 * 10,
+                "end_line": (offset + i) % 20 * 10 + 9,
+                "type": "function",
+                "_source_file": f"module_{(offset + i) // 20}.py",
+            }
+            for i in range(count)
+        ])
+    store.flush(name)
+    return time.perf_counter() - start
+
+
+def measure(search: Callable[[int], None], queries: int) -> List[float]:
+    """
+    쿼리별 검색 지연 측정
+
+    Args:
+        search: 쿼리 인덱스를 받아 검색 1회를 수행하는 함수
+        queries: 쿼리 수
+
+    Returns:
+        쿼리별 지연 리스트 (초)
+    """
+    search(0)  # 워밍업 (페이지 캐시 / 필드 매핑)
+    latencies: List[float] = []
+    for i in range(queries):
+        start = time.perf_counter()
+        search(i)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(label: str, latencies: List[float]) -> None:
+    """벤치마크 결과 한 줄 출력"""
+    p50, p99 = np.percentile(np.array(latencies) * 1000, [50, 99])
+    print(f"  {label:<8} p50 {p50:8.2f} ms   p99 {p99:8.2f} ms   {len(latencies) / sum(latencies):8.1f} queries/s")
+
+
+def main() -> None:
+    """벤치마크 실행"""
+    arg_parser = argparse.ArgumentParser(description="Local vector store search benchmark")
+    arg_parser.add_argument("--rows", default="1000,10000,50000", help="컬렉션 행 수 목록 (쉼표 구분)")
+    arg_parser.add_argument("--dim", type=int, default=1024)
+    arg_parser.add_argument("--queries", type=int, default=200)
+    arg_parser.add_argument("--top-k", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    output_fields = ["text", "file_path", "name", "start_line", "end_line", "type"]
+
+    print("\n" + "=" * 60)
+    print("⏱️  Local Vector Store Search Benchmark")
+    print("=" * 60)
+    print(f"📌 dim: {args.dim}, top_k: {args.top_k}, queries: {args.queries}")
+
+    with tempfile.TemporaryDirectory() as base_path:
+        store = LocalVectorStore(base_path)
+
+        for rows in [int(value) for value in args.rows.split(",")]:
+            name = f"bench_{rows}"
+            build_seconds = build_collection(store, name, rows, args.dim, rng)
+            print(f"\n{rows} rows (build {build_seconds:.2f}s)")
+
+            dense_queries = rng.standard_normal((args.queries, args.dim), dtype=np.float32).tolist()
+            sparse_queries = [make_sparse(rng, TERMS_PER_QUERY) for _ in range(args.queries)]
+
+            report("Dense", measure(
+                lambda i: store.search(name, [dense_queries[i]], None, args.top_k, output_fields),
+                args.queries,
+            ))
+            report("Hybrid", measure(
+                lambda i: store.search(name, [dense_queries[i]], [sparse_queries[i]], args.top_k, output_fields),
+                args.queries,
+            ))
+
+            store.drop_collection(name)
+
+
+if __name__ == "__main__":
+    main()
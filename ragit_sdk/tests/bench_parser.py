@@ -0,0 +1,138 @@
+"""
+PythonASTParser 청킹 마이크로벤치마크
+
+기존 구현(정의 종류별 ast.walk 3회 + 노드마다 줄 리스트 join)과
+현재 구현(단일 순회 + 줄 오프셋 테이블 슬라이스)을 큰 합성 파일에서 비교합니다.
+
+사용법:
+python -m ragit_sdk.tests.bench_parser [--classes 400] [--methods 12] [--repeat 5]
+"""
+
+import argparse
+import ast
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from rag_worker.python_parser.parser import PythonASTParser
+
+
+def build_source(num_classes: int, num_methods: int) -> str:
+    """
+    벤치마크용 대용량 Python 소스 생성
+
+    Args:
+        num_classes: 클래스 수
+        num_methods: 클래스당 메서드 수
+
+    Returns:
+        소스 코드
+    """
+    lines: List[str] = ["import os", "import sys", "from typing import Any, Dict, List", ""]
+
+    for c in range(num_classes):
+        lines.append(f"class Service{c}:")
+        lines.append(f'    """Service {c} docstring"""')
+        lines.append("")
+        for m in range(num_methods):
+            lines.append(f"    def method_{m}(self, items: List[int]) -> Dict[str, Any]:")
+            lines.append(f"        total = sum(item * {m} for item in items if item % 2 == 0)")
+            lines.append("        def helper(value: int) -> int:")
+            lines.append("            return value + total")
+            lines.append("        return {'total': helper(total), 'name': self.__class__.__name__}")
+            lines.append("")
+        lines.append(f"async def handler_{c}(request: Any) -> None:")
+        lines.append(f"    await request.send({c})")
+        lines.append("")
+        lines.append(f"CONSTANT_{c} = {c}")
+        lines.append("")
+
+    return "\n".join(lines) + "\n"
+
+
+def legacy_parse(source_code: str) -> int:
+    """
+    기존 구현의 정의 청크 추출 방식 재현 (비교 기준)
+
+    Args:
+        source_code: 소스 코드
+
+    Returns:
+        추출한 청크 수
+    """
+    source_lines = source_code.splitlines(keepends=True)
+    tree = ast.parse(source_code)
+    chunks = []
+
+    for node_type in (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef):
+        for node in ast.walk(tree):
+            if isinstance(node, node_type):
+                snippet = "".join(source_lines[node.lineno - 1 : node.end_lineno])
+                chunks.append((node.name, snippet.rstrip("\n")))
+
+    return len(chunks)
+
+
+def current_parse(source_code: str) -> int:
+    """
+    현재 구현으로 청킹
+
+    Args:
+        source_code: 소스 코드
+
+    Returns:
+        추출한 청크 수
+    """
+    return len(PythonASTParser.parse_source(source_code, "bench.py"))
+
+
+def measure(func: Callable[[str], int], source_code: str, repeat: int) -> float:
+    """
+    최소 실행 시간 측정
+
+    Args:
+        func: 측정할 함수
+        source_code: 소스 코드
+        repeat: 반복 횟수
+
+    Returns:
+        최소 소요 시간 (초)
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(source_code)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """벤치마크 실행"""
+    arg_parser = argparse.ArgumentParser(description="PythonASTParser microbenchmark")
+    arg_parser.add_argument("--classes", type=int, default=400)
+    arg_parser.add_argument("--methods", type=int, default=12)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--file", type=Path, default=None, help="합성 소스 대신 사용할 Python 파일")
+    args = arg_parser.parse_args()
+
+    if args.file:
+        source_code = args.file.read_text(encoding="utf-8")
+    else:
+        source_code = build_source(args.classes, args.methods)
+
+    print("\n" + "=" * 60)
+    print("⏱️  PythonASTParser Microbenchmark")
+    print("=" * 60)
+    print(f"📌 Source: {source_code.count(chr(10))} lines, {len(source_code) / 1024:.0f} KB")
+
+    legacy_time = measure(legacy_parse, source_code, args.repeat)
+    current_time = measure(current_parse, source_code, args.repeat)
+
+    print(f"\nLegacy  (3x ast.walk + join): {legacy_time * 1000:8.1f} ms")
+    print(f"Current (single pass + slice): {current_time * 1000:8.1f} ms")
+    print(f"Speedup: {legacy_time / current_time:.2f}x")
+    print("\n⚠️  Current implementation also emits module/script chunks and qualified names.")
+
+
+if __name__ == "__main__":
+    main()
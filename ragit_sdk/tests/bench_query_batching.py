@@ -0,0 +1,122 @@
+"""
+쿼리 임베딩 마이크로 배치 벤치마크
+
+동시 호출자 수별로 기존 방식(스레드마다 embed_query 1회 = 배치 크기 1)과
+QueryEmbeddingBatcher(동시 요청을 모아 forward 1회)의 요청 지연(p50/p99)과 처리량(queries/sec)을
+비교합니다. 쿼리 벡터 캐시는 거치지 않으며 쿼리는 모두 서로 다릅니다.
+
+사용법:
+python -m ragit_sdk.tests.bench_query_batching [--concurrency 1,2,4,8,16] [--requests 16] [--max-wait-ms 5]
+"""
+
+import argparse
+import threading
+import time
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from rag_worker.vector_db.config import DEFAULT_MODEL_KEY, QUERY_BATCH_MAX_SIZE, QUERY_BATCH_MAX_WAIT_MS
+from rag_worker.vector_db.model_registry import EmbeddingModelRegistry
+from rag_worker.vector_db.query_batcher import QueryEmbeddingBatcher
+
+# 채팅 질문 형태의 쿼리 템플릿
+QUERY_TEMPLATES = [
+    "How does {} handle errors?",
+    "Where is {} called?",
+    "What does the {} function return?",
+    "Explain the {} class",
+]
+
+
+def make_queries(count: int) -> List[str]:
+    """
+    서로 다른 벤치마크 쿼리 생성
+
+    Args:
+        count: 쿼리 수
+
+    Returns:
+        쿼리 리스트
+    """
+    return [QUERY_TEMPLATES[i % len(QUERY_TEMPLATES)].format(f"symbol_{i}") for i in range(count)]
+
+
+def run_clients(
+    encode: Callable[[str], List[float]], concurrency: int, requests_per_client: int
+) -> Tuple[List[float], float]:
+    """
+    동시 호출자 스레드로 쿼리 인코딩 실행
+
+    Args:
+        encode: 쿼리 1개 인코딩 함수
+        concurrency: 동시 호출자 수
+        requests_per_client: 호출자당 순차 요청 수
+
+    Returns:
+        (요청별 지연 리스트 (초), 전체 소요 시간 (초))
+    """
+    queries = make_queries(concurrency * requests_per_client)
+    latencies: List[float] = []
+    latencies_lock = threading.Lock()
+    barrier = threading.Barrier(concurrency + 1)
+
+    def client(index: int) -> None:
+        barrier.wait()
+        for query in queries[index::concurrency]:
+            start = time.perf_counter()
+            encode(query)
+            with latencies_lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return latencies, time.perf_counter() - start
+
+
+def report(label: str, latencies: List[float], elapsed: float) -> None:
+    """벤치마크 결과 한 줄 출력"""
+    p50, p99 = np.percentile(np.array(latencies) * 1000, [50, 99])
+    print(f"  {label:<9} p50 {p50:8.1f} ms   p99 {p99:8.1f} ms   {len(latencies) / elapsed:8.1f} queries/s")
+
+
+def main() -> None:
+    """벤치마크 실행"""
+    arg_parser = argparse.ArgumentParser(description="Query embedding micro-batching benchmark")
+    arg_parser.add_argument("--concurrency", default="1,2,4,8,16", help="동시 호출자 수 목록 (쉼표 구분)")
+    arg_parser.add_argument("--requests", type=int, default=16, help="호출자당 요청 수")
+    arg_parser.add_argument("--max-batch", type=int, default=QUERY_BATCH_MAX_SIZE)
+    arg_parser.add_argument("--max-wait-ms", type=float, default=QUERY_BATCH_MAX_WAIT_MS)
+    arg_parser.add_argument("--model", default=DEFAULT_MODEL_KEY)
+    args = arg_parser.parse_args()
+
+    embedder = EmbeddingModelRegistry.get(args.model)
+    batcher = QueryEmbeddingBatcher(args.model, max_batch_size=args.max_batch, max_wait_ms=args.max_wait_ms)
+
+    # 모델 워밍업 (첫 호출의 초기화 비용 제외)
+    embedder.embed_documents(make_queries(4))
+
+    print("\n" + "=" * 60)
+    print("⏱️  Query Embedding Micro-batching Benchmark")
+    print("=" * 60)
+    print(f"📌 Model: {args.model}, max batch: {args.max_batch}, max wait: {args.max_wait_ms} ms")
+
+    for concurrency in [int(value) for value in args.concurrency.split(",")]:
+        print(f"\nConcurrency {concurrency} ({concurrency * args.requests} queries)")
+        report("Single", *run_clients(embedder.embed_query, concurrency, args.requests))
+
+        before = batcher.stats()
+        report("Batched", *run_clients(batcher.embed, concurrency, args.requests))
+        after = batcher.stats()
+        batches = after["batches"] - before["batches"]
+        print(f"  {'':<9} {batches} forward passes, "
+              f"mean batch size {(after['queries'] - before['queries']) / max(batches, 1):.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+parse_repository 태스크 결과 크기 비교
+
+Celery 결과 백엔드(Redis)에 저장되는 JSON 결과의 크기를
+기존 결과(파일별 청크 본문 포함)와 현재 결과(요약)로 비교합니다.
+
+사용법:
+python -m ragit_sdk.tests.bench_task_results --repo my_repo [--base repository]
+"""
+
+import argparse
+import json
+
+from rag_worker.python_parser.service import RepositoryParserService
+
+
+def main() -> None:
+    """결과 크기 비교 실행"""
+    arg_parser = argparse.ArgumentParser(description="parse_repository result size comparison")
+    arg_parser.add_argument("--repo", required=True, help="레포지토리 이름")
+    arg_parser.add_argument("--base", default="repository", help="레포지토리 기본 경로")
+    args = arg_parser.parse_args()
+
+    service = RepositoryParserService(base_repository_path=args.base)
+    result = service.parse_repository(args.repo, save_json=False)
+    if not result["success"]:
+        print(f"❌ Parsing failed: {result['error']}")
+        return
+
+    # Celery json 직렬화와 같은 방식으로 크기 측정
+    full_bytes = len(json.dumps(result).encode("utf-8"))
+    summary_bytes = len(json.dumps(service.summarize(result)).encode("utf-8"))
+
+    print("\n" + "=" * 60)
+    print("📦 parse_repository Result Size")
+    print("=" * 60)
+    print(f"📌 Files: {result['total_files']}, chunks: {result['total_chunks']}")
+    print(f"\nFull result (files[].chunks[]): {full_bytes / 1024:10.1f} KiB")
+    print(f"Summary result:                 {summary_bytes / 1024:10.1f} KiB")
+    print(f"Reduction: {full_bytes / summary_bytes:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+분할 청크 검색 결과 복원 테스트
+
+1. 긴 줄(생성된 모듈의 25KB 문자열 리터럴) / 비ASCII 줄이 있는 함수를 기본 한도와 작은 한도로
+   나눈 뒤 ChunkSplitter.join_parts가 원본 코드를 그대로 복원하는지 확인합니다.
+2. 토큰 예산을 넘는 함수를 나눠 임베딩한 뒤, chunk_id 필터로 검색한 조각들을 이어 붙여
+   원본 코드와 같은지 확인합니다.
+
+Milvus 없이 로컬 벡터 저장소를 사용하며, 벡터 저장소 / BM25 아티팩트 / 임베딩 캐시는 모두
+임시 디렉토리에 기록하고 종료 시 삭제합니다. 임베딩 모델은 실제로 로드합니다.
+
+사용법:
+python -m ragit_sdk.tests.test_split_restitch
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from typing import Dict
+
+# 서비스 모듈이 설정을 읽기 전에 로컬 저장소로 지정
+STORE_DIR = tempfile.mkdtemp(prefix="ragit_restitch_")
+os.environ["VECTOR_STORE_BACKEND"] = "local"
+os.environ["LOCAL_VECTOR_STORE_DIR"] = STORE_DIR
+
+from rag_worker.python_parser.parser import PythonASTParser
+from rag_worker.python_parser.splitter import ChunkSplitter
+from rag_worker.vector_db.config import DEFAULT_MODEL_KEY, EMBEDDING_MODELS
+from rag_worker.vector_db.embedding_cache import EmbeddingCache
+from rag_worker.vector_db.embedding_service import BM25ModelCache, EmbeddingService
+from rag_worker.vector_db.search_service import SearchService
+from rag_worker.vector_db.sparse_model_store import SparseModelStore
+from rag_worker.vector_db.types import SearchInput
+
+COLLECTION_NAME = "restitch_test"
+
+# join_parts 왕복 검사 한도 (max_tokens, max_bytes, overlap_lines), None은 기본값
+ROUNDTRIP_LIMITS = [None, (200, 500, 3), (50, 300, 1)]
+
+
+def make_source() -> str:
+    """분할 대상이 되는 긴 함수와 작은 함수가 있는 소스 생성"""
+    body = "\n".join(f"    total_{i} = compute_value({i}, 'label_{i}') + offset_{i}" for i in range(300))
+    return (
+        f"def build_report(rows):\n    \"\"\"리포트 생성\"\"\"\n{body}\n    return total_0\n\n\n"
+        "def small_helper(x):\n    return x + 1\n"
+    )
+
+
+def make_long_line_sources() -> Dict[str, str]:
+    """긴 문자열 리터럴 / 비ASCII 줄이 있는 소스 생성"""
+    literal = "x" * 25_000
+    korean = "가나다라마바사" * 600
+    return {
+        "generated.py": "def generated():\n" + "".join(f"    v{i} = '{literal}'\n" for i in range(6)) + "    return v0\n",
+        "korean.py": "def korean():\n" + "".join(
+            f"    message_{i} = '{korean}'\n    count_{i} = len(message_{i})\n" for i in range(5)
+        ) + "    return count_0\n",
+        "report.py": make_source(),
+    }
+
+
+def test_join_parts_roundtrip() -> None:
+    """긴 줄 / 비ASCII 줄 분할 후 복원 테스트"""
+    print("\n" + "=" * 60)
+    print("🧵 join_parts Round-trip Test")
+    print("=" * 60)
+
+    for file_name, source in make_long_line_sources().items():
+        for limits in ROUNDTRIP_LIMITS:
+            splitter = ChunkSplitter(*limits) if limits else ChunkSplitter()
+            for chunk in PythonASTParser.parse_source(source, file_name):
+                parts = splitter.split([chunk])
+                assert all(len(part["code"].encode("utf-8")) <= splitter.max_bytes for part in parts)
+                restored = ChunkSplitter.join_parts(parts)
+                assert restored == chunk["code"], (
+                    f"{file_name} {limits or 'default'}: restored {len(restored)} chars "
+                    f"from {len(parts)} parts, original {len(chunk['code'])}"
+                )
+            print(f"✅ {file_name} ({limits or 'default'}): restored")
+
+
+def test_split_restitch() -> None:
+    """분할 청크 검색 후 복원 테스트"""
+    print("\n" + "=" * 60)
+    print("🧩 Split Chunk Re-stitch Test")
+    print("=" * 60)
+
+    chunks = PythonASTParser.parse_source(make_source(), "report.py")
+    original = next(chunk for chunk in chunks if chunk["name"] == "build_report")
+    parts = ChunkSplitter(max_tokens=256).split(chunks)
+    part_count = sum(1 for part in parts if part["chunk_id"] == original["chunk_id"])
+
+    print(f"\n📌 {len(chunks)} chunks -> {len(parts)} parts ({part_count} parts of build_report)")
+    assert part_count > 1, "build_report was not split"
+
+    embedding = EmbeddingService().process_chunks(
+        chunk_source=lambda: iter(parts),
+        collection_name=COLLECTION_NAME,
+        model_key=DEFAULT_MODEL_KEY,
+    )
+    assert embedding["success"], embedding["error"]
+
+    result = SearchService().search(SearchInput(
+        query="build report compute value",
+        collection_name=COLLECTION_NAME,
+        model_key=DEFAULT_MODEL_KEY,
+        top_k=part_count,
+        filter_expr=f'chunk_id == "{original["chunk_id"]}"',
+        output_fields=None,
+        two_phase=None,
+    ))
+    assert result["success"], result["error"]
+
+    returned = result["results"]
+    print(f"📌 Search returned {len(returned)} parts "
+          f"(part_count field: {sorted({item['part_count'] for item in returned})})")
+    assert len(returned) == part_count
+    assert all(item["chunk_id"] == original["chunk_id"] for item in returned)
+    assert sorted(item["part_index"] for item in returned) == list(range(part_count))
+
+    restored = ChunkSplitter.join_parts(returned)
+    assert restored == original["code"], "restored code differs from the original chunk"
+    print(f"✅ Restored {len(restored.splitlines())} lines from {part_count} parts")
+
+
+if __name__ == "__main__":
+    # BM25 아티팩트와 임베딩 캐시도 레포지토리 대신 임시 디렉토리에 기록
+    BM25ModelCache._store = SparseModelStore(os.path.join(STORE_DIR, "sparse_models"))
+    EmbeddingCache._instances[DEFAULT_MODEL_KEY] = EmbeddingCache(
+        DEFAULT_MODEL_KEY,
+        EMBEDDING_MODELS[DEFAULT_MODEL_KEY]["dim"],
+        base_path=os.path.join(STORE_DIR, "embedding_cache"),
+    )
+    try:
+        test_join_parts_roundtrip()
+        test_split_restitch()
+    except AssertionError as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
+    finally:
+        shutil.rmtree(STORE_DIR, ignore_errors=True)